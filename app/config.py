@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import EmailStr
 from pydantic_settings import BaseSettings
 
@@ -5,21 +7,132 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     database_url: str
 
+    # Database engine / pool
+    database_read_url: Optional[str] = None  # read replica for read-only queries
+    database_echo: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100  # asyncpg prepared statements per connection
+    db_pool_warmup: int = (
+        2  # connections opened concurrently at startup (capped at pool size)
+    )
+
+    # Schema at startup: "create_all" (dev), "alembic" (one query comparing the
+    # alembic_version revision with the migration heads) or "none". Pinning the
+    # expected head (e.g. from `alembic heads` at deploy) skips importing alembic.
+    db_schema_startup: Literal["create_all", "alembic", "none"] = "create_all"
+    db_schema_revision: Optional[str] = None
+    alembic_config: str = "alembic.ini"
+
     # JWT config
     secret_key: str
     algorithm: str = "HS256"
     token_expire_minutes: int = 30
+    # RS*/ES*/PS* algorithms sign with the private PEM and verify with the
+    # public one (derived from the private key when only that is given)
+    jwt_private_key_file: Optional[str] = None
+    jwt_public_key_file: Optional[str] = None
+    jwt_cache_enabled: bool = True  # verified claims by token digest, until exp
+    jwt_cache_size: int = 10_000
+    # Refresh tokens rotate on every use; revoked sessions are checked through
+    # an in-memory Bloom filter synced from the DB every revocation_sync_interval
+    # seconds (other workers see a logout / reuse revocation after at most that)
+    refresh_token_expire_days: int = 30
+    revocation_filter_capacity: int = 100_000
+    revocation_filter_error_rate: float = 0.001
+    revocation_sync_interval: float = 5.0
+
+    # Password hashing pool (0 workers = hash inline on the event loop)
+    password_hash_executor: str = "thread"  # "thread" or "process"
+    password_hash_workers: int = 4
+    password_hash_queue_size: int = 64
+    password_hash_timeout: float = 5.0
+
+    # Rate limiting ("memory" store; see app/services/rate_limit.py)
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    rate_limit_auth_per_minute: int = 10
+    rate_limit_api_per_second: float = 20.0
+    rate_limit_api_burst: int = 100
+
+    # Caching ("none" or "memory"; "memory" is a local stand-in for a shared store)
+    cache_shared_backend: str = "none"
+    principal_cache_enabled: bool = True
+    principal_cache_size: int = 10_000
+    principal_cache_ttl: float = 60.0
+    # Contact read responses per user; writes invalidate them. Without a shared
+    # backend, other workers (and a lagging replica) can serve a body up to the TTL old.
+    response_cache_enabled: bool = True
+    response_cache_size: int = 10_000
+    response_cache_ttl: float = 30.0
+
+    # Search (in-process n-gram index used when not on PostgreSQL)
+    search_index_max_users: int = 256
+    search_index_ttl: float = 300.0
+
+    # Bulk contact import
+    import_batch_size: int = 1000
+    import_max_errors: int = 1000
+
+    # Observability (Prometheus text format at GET /metrics)
+    metrics_enabled: bool = True
+    # Pool / cache / queue stats under /api/system (authenticated users only)
+    system_endpoints_enabled: bool = False
+
+    # Query auditing for development / CI (N+1, statement budgets, slow SQL);
+    # "raise" fails the statement that crosses a limit, "log" warns per request
+    query_audit_enabled: bool = False
+    query_audit_mode: Literal["log", "raise"] = "log"
+    query_audit_max_statements: int = 20
+    query_audit_max_repeats: int = 3
+    query_audit_slow_ms: float = 100.0
+
+    # Delta sync (tombstones older than the retention are compacted)
+    sync_page_size: int = 500
+    sync_tombstone_retention_days: int = 30
+    sync_compaction_interval: float = 3600.0
+
+    # Upcoming birthdays window (days ahead, inclusive of today)
+    birthday_window_days: int = 7
 
     # Cloudinary
     cloudinary_name: str
     cloudinary_api_key: str
     cloudinary_api_secret: str
 
+    # Avatars ("cloudinary" or "local"; local writes under avatar_local_dir)
+    avatar_storage: str = "cloudinary"
+    avatar_local_dir: str = "media/avatars"
+    avatar_local_base_url: str = "/media/avatars"
+    avatar_max_bytes: int = 5 * 1024 * 1024
+    avatar_max_pixels: int = 40_000_000
+    avatar_size: int = 256
+    avatar_quality: int = 85
+
     # Email config
     mail_username: EmailStr
     mail_password: str
     mail_server: str = "smtp.gmail.com"
     mail_port: int = 587
+    mail_starttls: bool = True
+    mail_login: bool = True
+    mail_timeout: float = 30.0
+
+    # Outbound email queue (see app/services/email_queue.py)
+    email_dispatch_enabled: bool = True
+    email_workers: int = 1
+    email_batch_size: int = 20
+    email_max_attempts: int = 5
+    email_retry_base_seconds: float = 30.0
+    email_retry_max_seconds: float = 3600.0
+    email_poll_interval: float = 5.0
+    email_lease_seconds: float = (
+        300.0  # renewed per send; keep it above a few mail_timeouts
+    )
+    email_templates_reload: bool = False  # re-check template files on render (dev)
 
     # Frontend
     frontend_base_url: str = "http://localhost:3000"
@@ -1,5 +1,8 @@
-from typing import AsyncGenerator
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Dict
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -7,20 +10,128 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.utils.metrics import instrument_engine
 
 # Define the base class for all SQLAlchemy models
 Base = declarative_base()
 
-# Create an asynchronous SQLAlchemy engine using the database URL from settings
-engine: AsyncEngine = create_async_engine(settings.database_url, echo=True)
 
-# Create a session factory for asynchronous database sessions
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that also records checkouts that had to wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        # a wait: no idle connection left and no overflow allowed to open one
+        blocked = self._pool.empty() and -1 < self._max_overflow <= self._overflow
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.checkouts += 1
+            if blocked:
+                waited = time.perf_counter() - started
+                self.waits += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+def build_engine(url: str, **overrides) -> AsyncEngine:
+    """Create an async engine with the pool and driver options from settings."""
+    database_url = make_url(url)
+    options: Dict[str, Any] = {
+        "echo": settings.database_echo,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    # in-memory SQLite needs its default single-connection pool
+    if not (
+        database_url.get_backend_name() == "sqlite"
+        and database_url.database in (None, "", ":memory:")
+    ):
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    if database_url.get_driver_name() == "asyncpg":
+        database_url = database_url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_statement_cache_size)},
+        )
+    options.update(overrides)
+    engine = create_async_engine(database_url, **options)
+    if settings.metrics_enabled:
+        instrument_engine(engine)
+    return engine
+
+
+def pool_stats(bind: AsyncEngine) -> dict:
+    """Checked-out / overflow counts and checkout waits for an engine's pool."""
+    pool = bind.sync_engine.pool
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            checkouts=pool.checkouts,
+            waits=pool.waits,
+            avg_wait_ms=pool.wait_seconds / pool.waits * 1000 if pool.waits else 0.0,
+            max_wait_ms=pool.max_wait_seconds * 1000,
+        )
+    return stats
+
+
+async def warm_pool(bind: AsyncEngine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections concurrently; returns how many."""
+    pool = bind.sync_engine.pool
+    connections = min(
+        connections, pool.size() if isinstance(pool, InstrumentedQueuePool) else 1
+    )
+    if connections <= 0:
+        return 0
+    # hold them all at once, or the pool would hand the same connection back
+    opened = await asyncio.gather(
+        *(bind.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    await asyncio.gather(
+        *(conn.close() for conn in opened if not isinstance(conn, BaseException))
+    )
+    for result in opened:
+        if isinstance(result, BaseException):
+            raise result
+    return connections
+
+
+# Primary engine (all writes) and optional read replica for read-only queries
+engine: AsyncEngine = build_engine(settings.database_url)
+read_engine: AsyncEngine = (
+    build_engine(settings.database_read_url) if settings.database_read_url else engine
+)
+
+# Create session factories for asynchronous database sessions
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+ReadSessionLocal = async_sessionmaker(bind=read_engine, expire_on_commit=False)
 
 
 # Dependency for FastAPI routes that provides a database session
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+# Same, routed to the read replica when one is configured (may lag the primary)
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
@@ -1,27 +1,88 @@
-from fastapi import FastAPI
+import asyncio
 
-from app.database import Base, engine
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
+
+from app.config import settings
+from app.database import Base, engine, read_engine, warm_pool
+from app.middleware.body_limit import configure_body_limits
 from app.middleware.cors import configure_cors
-from app.routers import auth, contacts
+from app.middleware.metrics import configure_metrics
+from app.middleware.query_audit import configure_query_audit
+from app.routers import auth, contacts, metrics, system, users
+from app.services.auth import get_current_user
+from app.services.email_queue import email_dispatcher
+from app.services.hashing import password_hasher
+from app.services.rate_limit import api_rate_limiter
+from app.services.sessions import revocation_filter
+from app.services.sync import tombstone_compactor
+from app.utils.email import preload_templates
+from app.utils.startup import ensure_schema, startup_timings
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Contacts API",
     description="A RESTful API for managing contacts with authentication and avatar support.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Setup CORS middleware
 configure_cors(app)
+configure_body_limits(app)
+configure_query_audit(app)
+# added last, so it wraps the other middleware and times whole requests
+configure_metrics(app)
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(contacts.router, prefix="/api/contacts", tags=["Contacts"])
+app.include_router(users.router, prefix="/api/users", tags=["Users"])
+app.include_router(
+    contacts.router,
+    prefix="/api/contacts",
+    tags=["Contacts"],
+    dependencies=[Depends(api_rate_limiter)],
+)
+if settings.system_endpoints_enabled:
+    app.include_router(
+        system.router,
+        prefix="/api/system",
+        tags=["System"],
+        dependencies=[Depends(get_current_user)],
+    )
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
 
 
-# Create tables if not using migrations (optional)
-# You can remove this in production and rely on Alembic
+# create_all by default; set DB_SCHEMA_STARTUP=alembic where migrations own the schema
 @app.on_event("startup")
 async def on_startup():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    with startup_timings.phase("schema"):
+        await ensure_schema(
+            engine,
+            Base.metadata,
+            settings.db_schema_startup,
+            settings.alembic_config,
+            settings.db_schema_revision,
+        )
+    with startup_timings.phase("db_pool_warmup"):
+        engines = {engine, read_engine}
+        await asyncio.gather(
+            *(warm_pool(bind, settings.db_pool_warmup) for bind in engines)
+        )
+    with startup_timings.phase("email_templates"):
+        preload_templates()
+    with startup_timings.phase("background_tasks"):
+        if settings.email_dispatch_enabled:
+            email_dispatcher.start()
+        tombstone_compactor.start()
+        revocation_filter.start()
+    startup_timings.finish()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await email_dispatcher.stop()
+    await tombstone_compactor.stop()
+    await revocation_filter.stop()
+    password_hasher.shutdown()
@@ -0,0 +1,73 @@
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+# Multipart framing around the file itself (boundaries, part headers)
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class BodySizeLimitMiddleware:
+    """Reject request bodies over a per-path limit before they are parsed.
+
+    Checks Content-Length up front and counts streamed bytes, so chunked
+    uploads are cut off as soon as they cross the limit. The cut-off
+    happens at the ASGI level: the 413 goes out from here and the app sees
+    a client disconnect, whose error response (FastAPI reports it as a
+    body-parsing 400) is dropped.
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, int]) -> None:
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse({"detail": "Request body too large"}, status_code=413)
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > limit:
+                await response(scope, receive, send)
+                return
+
+        received = 0
+        started = False
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    rejected = True
+                    if not started:
+                        await response(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal started
+            if rejected:
+                return
+            started = started or message["type"] == "http.response.start"
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:  # pylint: disable=broad-except
+            # whatever the cut-off body made the app raise; the 413 is out
+            if not rejected:
+                raise
+
+
+def configure_body_limits(app):
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        limits={"/api/users/avatar": settings.avatar_max_bytes + MULTIPART_OVERHEAD},
+    )
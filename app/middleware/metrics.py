@@ -0,0 +1,62 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.utils.metrics import (
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_DB_STATEMENTS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    RequestDBStats,
+    request_db_stats,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Record latency, in-flight count and DB cost per request.
+
+    Requests are labelled by route template (``/api/contacts/{contact_id}``),
+    never by raw path, to keep label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def recording_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        db_stats = RequestDBStats()
+        token = request_db_stats.set(db_stats)
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, recording_send)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            request_db_stats.reset(token)
+            # the router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_SECONDS.observe(
+                elapsed, (scope["method"], route, str(status_code))
+            )
+            HTTP_REQUEST_DB_STATEMENTS.observe(db_stats.statements, (route,))
+            HTTP_REQUEST_DB_SECONDS.observe(db_stats.seconds, (route,))
+
+
+def configure_metrics(app):
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
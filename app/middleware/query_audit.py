@@ -0,0 +1,48 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.database import engine, read_engine
+from app.utils.query_audit import audit_engine, audit_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryAuditMiddleware:
+    """Audit the SQL each request runs against the configured budgets.
+
+    In "log" mode a request that breaks a limit logs one warning with the
+    statement breakdown; in "raise" mode the offending statement fails with
+    QueryBudgetExceeded, which surfaces as a 500 (and a traceback) in tests.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with audit_queries(
+            max_statements=settings.query_audit_max_statements,
+            max_repeats=settings.query_audit_max_repeats,
+            slow_ms=settings.query_audit_slow_ms,
+            strict=settings.query_audit_mode == "raise",
+        ) as audit:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if audit.violations:
+                    route = getattr(scope.get("route"), "path", scope["path"])
+                    logger.warning(
+                        "Query audit: %s %s\n%s", scope["method"], route, audit.report()
+                    )
+
+
+def configure_query_audit(app):
+    if settings.query_audit_enabled:
+        audit_engine(engine)
+        audit_engine(read_engine)
+        app.add_middleware(QueryAuditMiddleware)
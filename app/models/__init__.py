@@ -1,2 +1,4 @@
-from app.models.contact import Contact
+from app.models.contact import Contact, ContactTombstone
+from app.models.email import OutboxEmail
+from app.models.session import AuthSession, RefreshToken
 from app.models.user import User
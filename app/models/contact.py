@@ -1,11 +1,51 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    event,
+)
+from sqlalchemy.orm import relationship, validates
 
 from app.database import Base
 
+# Expressions indexed for search on PostgreSQL (see app/services/search.py);
+# queries must use exactly these expressions for the planner to pick the index.
+SEARCH_TEXT_EXPR = "lower(first_name || ' ' || last_name || ' ' || email)"
+SEARCH_PHONE_EXPR = "regexp_replace(phone, '[^0-9]', '', 'g')"
+
+
+def birthday_key(value: Optional[date]) -> Optional[int]:
+    """Month/day of a birthday as MMDD (e.g. 229 for Feb 29), year-independent."""
+    if value is None:
+        return None
+    return value.month * 100 + value.day
+
+
+def _birthday_key_default(context) -> Optional[int]:
+    # Covers Core inserts (bulk seeding / imports) that bypass @validates
+    return birthday_key(context.get_current_parameters().get("birthday"))
+
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        # keyset pagination: WHERE user_id = ? AND (sort_col, id) > (?, ?)
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_id_last_name_id", "user_id", "last_name", "id"),
+        # upcoming birthdays: WHERE user_id = ? AND birthday_md BETWEEN ? AND ?
+        Index("ix_contacts_user_id_birthday_md", "user_id", "birthday_md"),
+        # delta sync: WHERE user_id = ? AND change_seq > ? ORDER BY change_seq
+        Index("ix_contacts_user_id_change_seq", "user_id", "change_seq"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(100), nullable=False)
@@ -13,6 +53,48 @@ class Contact(Base):
     email = Column(String(150), unique=True, index=True, nullable=False)
     phone = Column(String(30), unique=True, nullable=False)
     birthday = Column(Date, nullable=True)
+    birthday_md = Column(SmallInteger, nullable=True, default=_birthday_key_default)
+
+    # bumped by every UPDATE; feeds ETags and If-Match checks
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # owner's change sequence at the last write (see app/services/sync.py)
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     owner = relationship("User", back_populates="contacts")
+
+    @validates("birthday")
+    def _sync_birthday_md(self, _key, value):
+        self.birthday_md = birthday_key(value)
+        return value
+
+
+class ContactTombstone(Base):
+    """Marker left by a deleted contact so delta sync can report the delete."""
+
+    __tablename__ = "contact_tombstones"
+    __table_args__ = (
+        Index("ix_contact_tombstones_user_id_change_seq", "user_id", "change_seq"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    contact_id = Column(Integer, nullable=False)
+    change_seq = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+# Trigram indexes only exist on PostgreSQL; other dialects use the in-process index.
+# These cover create_all; migrated databases get them from migrations/versions/0003.
+for _ddl in (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS ix_contacts_search_trgm ON contacts "
+    f"USING gin (({SEARCH_TEXT_EXPR}) gin_trgm_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_contacts_phone_trgm ON contacts "
+    f"USING gin (({SEARCH_PHONE_EXPR}) gin_trgm_ops)",
+):
+    event.listen(
+        Contact.__table__,
+        "after_create",
+        DDL(_ddl).execute_if(dialect="postgresql"),
+    )
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class OutboxEmail(Base):
+    """Outgoing e-mail waiting for (or done with) SMTP delivery."""
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # dispatcher claim: WHERE status IN (...) AND next_attempt_at <= now
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+
+    id = Column(Integer, primary_key=True)
+    to_email = Column(String(150), nullable=False)
+    subject = Column(String(255), nullable=False)
+    html_body = Column(Text, nullable=False)
+    text_body = Column(Text, nullable=True)
+
+    status = Column(String(16), nullable=False, default=PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
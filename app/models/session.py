@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.database import Base
+
+
+class AuthSession(Base):
+    """One login: the refresh-token family and the access tokens issued from it."""
+
+    __tablename__ = "auth_sessions"
+    __table_args__ = (
+        # revocation filter sync: WHERE revoked_at >= :since
+        Index("ix_auth_sessions_revoked_at", "revoked_at"),
+    )
+
+    id = Column(String(32), primary_key=True)  # the tokens' "sid" claim
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    revoked_at = Column(DateTime, nullable=True)
+
+
+class RefreshToken(Base):
+    """A single-use refresh token; ``used_at`` is set when it is rotated."""
+
+    __tablename__ = "refresh_tokens"
+
+    jti = Column(String(32), primary_key=True)
+    session_id = Column(
+        String(32),
+        ForeignKey("auth_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    expires_at = Column(DateTime, nullable=False, index=True)
+    used_at = Column(DateTime, nullable=True)
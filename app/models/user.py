@@ -14,6 +14,10 @@ class User(Base):
     avatar = Column(String, nullable=True)
     is_verified = Column(Boolean, default=False)
     avatar = Column(String, nullable=True)
+    # last change sequence number handed out for this user's contacts
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
+    # changes at or below this were compacted away; older sync tokens expire
+    sync_floor = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationship to contacts
     contacts = relationship("Contact", back_populates="owner", cascade="all, delete")
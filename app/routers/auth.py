@@ -2,8 +2,15 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.schemas.auth import TokenResponse, UserCreate, UserLogin
-from app.services.auth import authenticate_user, register_user
+from app.schemas.auth import RefreshRequest, TokenResponse, UserCreate, UserLogin
+from app.services.auth import (
+    authenticate_user,
+    logout,
+    oauth2_scheme,
+    refresh_tokens,
+    register_user,
+)
+from app.services.rate_limit import login_rate_limiter
 
 router = APIRouter()
 
@@ -12,11 +19,28 @@ router = APIRouter()
     "/signup",
     response_model=TokenResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(login_rate_limiter)],
 )
 async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     return await register_user(user_data, db)
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(login_rate_limiter)],
+)
 async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     return await authenticate_user(user_data, db)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(body: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    return await refresh_tokens(body.refresh_token, db)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def end_session(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+):
+    await logout(token, db)
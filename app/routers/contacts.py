@@ -1,74 +1,287 @@
-from typing import List
+from datetime import date
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db
 from app.models.user import User
-from app.schemas.contact import ContactCreate, ContactRead, ContactUpdate
+from app.schemas.contact import (
+    ContactBatchDelete,
+    ContactBatchResult,
+    ContactBatchUpdate,
+    ContactChanges,
+    ContactCreate,
+    ContactImportResult,
+    ContactPage,
+    ContactRead,
+    ContactUpdate,
+)
 from app.services.auth import get_current_user
 from app.services.contacts import (
+    batch_delete_contacts,
+    batch_update_contacts,
     create_contact,
     delete_contact,
     get_contact_by_id,
+    get_contact_version,
     get_contacts,
+    get_contacts_page,
+    get_contacts_page_versions,
+    get_contacts_versions,
     get_upcoming_birthdays,
+    import_contacts,
+    search_contacts,
     update_contact,
 )
+from app.services.exports import MEDIA_TYPES, export_contacts
+from app.services.imports import FORMATS, detect_format
+from app.services.response_cache import CachedBody, response_cache
+from app.services.sync import get_changes
+from app.utils.etag import collection_etag, contact_etag, etag_matches, not_modified
+from app.utils.serializers import (
+    contact_dict,
+    contact_rows,
+    contact_rows_response,
+    dumps,
+)
+
+router = APIRouter()
+
 
-router = APIRouter(prefix="/contacts", tags=["Contacts"])
+def _json_body(body: str, response: Response, etag: str) -> Response:
+    # returned responses don't pick up headers set on ``response`` (rate limits)
+    return Response(
+        body, media_type="application/json", headers={**response.headers, "ETag": etag}
+    )
+
+
+def _from_cache(
+    entry: CachedBody, response: Response, if_none_match: Optional[str]
+) -> Response:
+    if if_none_match and etag_matches(if_none_match, entry.etag):
+        return not_modified(entry.etag, response.headers)
+    return _json_body(entry.body, response, entry.etag)
 
 
 @router.post("/", response_model=ContactRead, status_code=status.HTTP_201_CREATED)
 async def create_contact_view(
     contact: ContactCreate,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    new_contact = await create_contact(contact, db, current_user)
+    response.headers["ETag"] = contact_etag(new_contact.id, new_contact.version)
+    return new_contact
+
+
+@router.post("/import", response_model=ContactImportResult)
+async def import_contacts_view(
+    request: Request,
+    fmt: Optional[Literal["csv", "ndjson"]] = Query(None, alias="format"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await create_contact(contact, db, current_user)
+    """Stream a CSV (with header) or NDJSON body of contacts into the address book."""
+    body_format = fmt or detect_format(request.headers.get("content-type"))
+    if body_format not in FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=",
+        )
+    return await import_contacts(body_format, request.stream(), db, current_user)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_contacts_view(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream the whole address book as NDJSON or CSV."""
+    return StreamingResponse(
+        export_contacts(fmt, current_user.id),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="contacts.{fmt}"'},
+    )
 
 
 @router.get("/", response_model=List[ContactRead])
 async def list_contacts(
+    response: Response,
     skip: int = 0,
     limit: int = 10,
-    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    slot = await response_cache.lookup(current_user.id, "list", f"{skip}:{limit}")
+    if slot.entry is not None:
+        return _from_cache(slot.entry, response, if_none_match)
+    # revalidation reads only (id, version), not whole rows
+    if if_none_match:
+        etag = collection_etag(
+            await get_contacts_versions(skip, limit, db, current_user)
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, response.headers)
+    rows = await get_contacts(skip, limit, db, current_user)
+    etag = collection_etag((row.id, row.version) for row in rows)
+    body = dumps(contact_rows(rows))
+    await response_cache.store(slot, body, etag)
+    return _json_body(body, response, etag)
+
+
+@router.get("/page", response_model=ContactPage)
+async def list_contacts_page(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100),
+    sort: Literal["id", "last_name"] = "id",
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    if if_none_match:
+        versions, has_more = await get_contacts_page_versions(
+            limit, db, current_user, cursor, sort
+        )
+        etag = collection_etag(versions, has_more)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, response.headers)
+    rows, next_cursor = await get_contacts_page(limit, db, current_user, cursor, sort)
+    etag = collection_etag(
+        ((row.id, row.version) for row in rows), next_cursor is not None
+    )
+    return ORJSONResponse(
+        {"items": contact_rows(rows), "next_cursor": next_cursor},
+        headers={**response.headers, "ETag": etag},
+    )
+
+
+@router.get("/search", response_model=List[ContactRead])
+async def search_contacts_view(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await get_contacts(skip, limit, db, current_user)
+    rows = await search_contacts(q, db, current_user, limit)
+    return contact_rows_response(rows, headers=response.headers)
 
 
 @router.get("/upcoming/birthdays", response_model=List[ContactRead])
 async def upcoming_birthdays_view(
+    response: Response,
+    days: int = Query(settings.birthday_window_days, ge=0, le=366),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    # the window moves at midnight, so the date is part of the key
+    slot = await response_cache.lookup(
+        current_user.id, "birthdays", f"{days}:{date.today().isoformat()}"
+    )
+    if slot.entry is not None:
+        return _from_cache(slot.entry, response, if_none_match)
+    rows = await get_upcoming_birthdays(db, current_user, days)
+    etag = collection_etag((row.id, row.version) for row in rows)
+    body = dumps(contact_rows(rows))
+    await response_cache.store(slot, body, etag)
+    return _json_body(body, response, etag)
+
+
+@router.get("/changes", response_model=ContactChanges)
+async def contact_changes_view(
+    since: Optional[str] = None,
+    limit: int = Query(settings.sync_page_size, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Contacts created, updated or deleted since the ``since`` sync token.
+
+    Omit ``since`` for a full sync. Store ``next_token`` and pass it back;
+    keep paging while ``has_more``. A 410 means the token predates
+    compaction and the client must sync from scratch.
+    """
+    return await get_changes(since, limit, db, current_user)
+
+
+@router.patch("/batch", response_model=ContactBatchResult)
+async def batch_update_view(
+    batch: ContactBatchUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Patch many contacts in one transaction; each id reports its own status."""
+    return await batch_update_contacts(batch.items, db, current_user)
+
+
+@router.post("/batch/delete", response_model=ContactBatchResult)
+async def batch_delete_view(
+    batch: ContactBatchDelete,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await get_upcoming_birthdays(db, current_user)
+    """Delete many contacts in one transaction; each id reports its own status."""
+    return await batch_delete_contacts(batch.ids, db, current_user)
 
 
 @router.get("/{contact_id}", response_model=ContactRead)
 async def get_contact_view(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await get_contact_by_id(contact_id, db, current_user)
+    slot = await response_cache.lookup(current_user.id, "get", str(contact_id))
+    if slot.entry is not None:
+        return _from_cache(slot.entry, response, if_none_match)
+    if if_none_match:
+        etag = contact_etag(
+            contact_id, await get_contact_version(contact_id, db, current_user)
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, response.headers)
+    contact = await get_contact_by_id(contact_id, db, current_user)
+    etag = contact_etag(contact.id, contact.version)
+    body = dumps(contact_dict(contact))
+    await response_cache.store(slot, body, etag)
+    return _json_body(body, response, etag)
 
 
 @router.put("/{contact_id}", response_model=ContactRead)
 async def update_contact_view(
     contact_id: int,
     contact_data: ContactUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await update_contact(contact_id, contact_data, db, current_user)
+    contact = await update_contact(contact_id, contact_data, db, current_user, if_match)
+    response.headers["ETag"] = contact_etag(contact.id, contact.version)
+    return contact
 
 
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contact_view(
     contact_id: int,
+    if_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await delete_contact(contact_id, db, current_user)
+    await delete_contact(contact_id, db, current_user, if_match)
@@ -0,0 +1,54 @@
+from fastapi import APIRouter
+
+from app.database import engine, pool_stats, read_engine
+from app.services.auth import principal_cache, token_codec
+from app.services.email_queue import email_dispatcher
+from app.services.hashing import password_hasher
+from app.services.response_cache import response_cache
+from app.services.sessions import revocation_filter
+from app.utils.startup import startup_timings
+
+router = APIRouter()
+
+
+@router.get("/password-hashing", summary="Password hashing pool stats")
+async def password_hashing_stats():
+    return password_hasher.stats()
+
+
+@router.get("/principal-cache", summary="Authenticated principal cache stats")
+async def principal_cache_stats():
+    return principal_cache.stats()
+
+
+@router.get("/response-cache", summary="Contact read response cache stats")
+async def response_cache_stats():
+    return response_cache.stats()
+
+
+@router.get("/token-cache", summary="Verified access token cache stats")
+async def token_cache_stats():
+    return token_codec.stats()
+
+
+@router.get("/revocation-filter", summary="Revoked-session filter stats")
+async def revocation_filter_stats():
+    return revocation_filter.stats()
+
+
+@router.get("/email-outbox", summary="Outbound email queue stats")
+async def email_outbox_stats():
+    return await email_dispatcher.stats()
+
+
+@router.get("/db-pool", summary="Database connection pool stats")
+async def db_pool_stats():
+    stats = {"primary": pool_stats(engine)}
+    if read_engine is not engine:
+        stats["replica"] = pool_stats(read_engine)
+    return stats
+
+
+@router.get("/startup", summary="Startup phase timings")
+async def startup_stats():
+    return startup_timings.stats()
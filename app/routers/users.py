@@ -5,7 +5,7 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.user import AvatarUpdate, UserRead
 from app.services.auth import get_current_user
-from app.services.avatar import upload_avatar_to_cloudinary
+from app.services.avatar import store_avatar
 from app.services.rate_limit import rate_limiter
 from app.services.users import update_avatar
 
@@ -32,11 +32,9 @@ async def upload_avatar(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    url = await upload_avatar_to_cloudinary(
+    url = await store_avatar(
         file,
         public_id=f"user_avatars/{current_user.id}",
     )
-    current_user.avatar = url
-    db.add(current_user)
-    await db.commit()
+    await update_avatar(AvatarUpdate(avatar_url=url), db, current_user)
     return {"avatar_url": url}
@@ -20,9 +20,16 @@ class TokenResponse(BaseModel):
     """Schema for returning the access token"""
 
     access_token: str
+    refresh_token: str | None = None
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    """Schema for exchanging a refresh token for a new token pair"""
+
+    refresh_token: str
+
+
 class UserResponse(BaseModel):
     """Schema for returning user data"""
 
@@ -1,7 +1,7 @@
 from datetime import date
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 
 
 class ContactBase(BaseModel):
@@ -23,9 +23,73 @@ class ContactUpdate(BaseModel):
     phone: Optional[str] = Field(None, max_length=30)
     birthday: Optional[date] = None
 
+    # optional means "may be omitted": these columns are NOT NULL
+    @field_validator("first_name", "last_name", "email", "phone")
+    @classmethod
+    def _not_null(cls, value):
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
 
 class ContactRead(ContactBase):
     id: int
 
     class Config:
         from_attributes = True
+
+
+class ContactPage(BaseModel):
+    items: List[ContactRead]
+    next_cursor: Optional[str] = None
+
+
+class ContactChanges(BaseModel):
+    changed: List[ContactRead]
+    deleted: List[int]
+    next_token: str
+    has_more: bool = False
+
+
+BATCH_MAX_ITEMS = 1000
+
+
+class ContactBatchUpdateItem(BaseModel):
+    id: int
+    changes: ContactUpdate
+    # optimistic concurrency: only apply while the contact is at this version
+    version: Optional[int] = None
+
+
+class ContactBatchUpdate(BaseModel):
+    items: List[ContactBatchUpdateItem] = Field(
+        ..., min_length=1, max_length=BATCH_MAX_ITEMS
+    )
+
+
+class ContactBatchDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class ContactBatchItemResult(BaseModel):
+    id: int
+    status: Literal[
+        "updated", "unchanged", "deleted", "not_found", "conflict", "duplicate"
+    ]
+    detail: Optional[str] = None
+
+
+class ContactBatchResult(BaseModel):
+    results: List[ContactBatchItemResult]
+
+
+class ContactImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ContactImportResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[ContactImportError]
+    errors_truncated: bool = False
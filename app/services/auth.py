@@ -2,7 +2,8 @@
 Authentication & authorisation helpers:
 – password hashing / verifying
 – JWT access & e-mail-verification tokens
-– current-user dependency for routes
+– login sessions: rotating refresh tokens, logout (see app/services/sessions.py)
+– current-user dependency for routes (with a principal cache)
 """
 
 from __future__ import annotations
@@ -12,21 +13,30 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.config import settings
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import UserCreate, UserLogin
-from app.utils.email import send_verification_email
+from app.services.email_queue import email_dispatcher, enqueue_email
+from app.services.hashing import password_hasher
+from app.services.sessions import (
+    add_refresh_token,
+    open_session,
+    revocation_filter,
+    revoke_session,
+    rotate_refresh_token,
+)
+from app.utils.cache import TieredCache, build_shared_backend
+from app.utils.email import render_verification_email
+from app.utils.tokens import TokenCodec, read_pem_file
 
 # ──────────────────────────── constants ─────────────────────────── #
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.token_expire_minutes
@@ -34,15 +44,34 @@ VERIFY_TOKEN_EXPIRE_HOURS = 24
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# keys are parsed once here; verified claims are cached until their exp
+token_codec = TokenCodec(
+    ALGORITHM,
+    secret=SECRET_KEY,
+    private_key=read_pem_file(settings.jwt_private_key_file),
+    public_key=read_pem_file(settings.jwt_public_key_file),
+    cache_size=settings.jwt_cache_size,
+    cache_enabled=settings.jwt_cache_enabled,
+)
+
+# token subject (e-mail) -> snapshot of the users row
+principal_cache = TieredCache(
+    "principal",
+    maxsize=settings.principal_cache_size,
+    ttl=settings.principal_cache_ttl,
+    shared=build_shared_backend(settings.cache_shared_backend),
+    enabled=settings.principal_cache_enabled,
+)
+
 # ──────────────────────────── helpers ───────────────────────────── #
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await password_hasher.verify(plain, hashed)
 
 
 def create_access_token(
@@ -54,17 +83,30 @@ def create_access_token(
         expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode["exp"] = expire
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return token_codec.encode(to_encode)
 
 
 def create_verification_token(email: str) -> str:
     expire = datetime.utcnow() + timedelta(hours=VERIFY_TOKEN_EXPIRE_HOURS)
-    return jwt.encode({"sub": email, "exp": expire}, SECRET_KEY, algorithm=ALGORITHM)
+    return token_codec.encode({"sub": email, "exp": expire})
+
+
+async def issue_tokens(db: AsyncSession, email: str, session_id: str) -> dict:
+    """Access + refresh token pair for a session (the caller commits)."""
+    jti, expires_at = await add_refresh_token(db, session_id)
+    claims = {"sub": email, "sid": session_id}
+    return {
+        "access_token": create_access_token(claims),
+        "refresh_token": token_codec.encode(
+            {**claims, "jti": jti, "type": "refresh", "exp": expires_at}
+        ),
+        "token_type": "bearer",
+    }
 
 
 def decode_token(token: str) -> dict:
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return token_codec.decode(token)
     except JWTError as exc:  # explicit chaining ✔️
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -86,16 +128,17 @@ async def register_user(user_data: UserCreate, db: AsyncSession) -> dict:
     new_user = User(
         username=user_data.username,
         email=user_data.email,
-        password=hash_password(user_data.password),
+        password=await hash_password(user_data.password),
         is_verified=False,
     )
     db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
 
-    # send verification e-mail
-    token = create_verification_token(new_user.email)
-    send_verification_email(new_user.email, token)
+    # queue the verification e-mail in the same transaction as the user
+    email = render_verification_email(create_verification_token(new_user.email))
+    await enqueue_email(db, new_user.email, email.subject, email.html, email.text)
+    # the INSERTs already return generated keys; nothing to refresh
+    await db.commit()
+    email_dispatcher.notify()
 
     return {
         "access_token": create_access_token({"sub": new_user.email}),
@@ -117,12 +160,15 @@ async def verify_email_token(token: str, db: AsyncSession) -> dict:
 
     user.is_verified = True
     await db.commit()
+    await invalidate_principal(user.email)
     return {"msg": "Email successfully verified"}
 
 
 async def authenticate_user(user_data: UserLogin, db: AsyncSession) -> dict:
     user = await db.scalar(select(User).filter_by(email=user_data.email))
-    if not user or not verify_password(user_data.password, user.password):
+    # end the read transaction so the pooled connection isn't held during bcrypt
+    await db.commit()
+    if not user or not await verify_password(user_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -134,10 +180,45 @@ async def authenticate_user(user_data: UserLogin, db: AsyncSession) -> dict:
             detail="Email not verified",
         )
 
-    return {
-        "access_token": create_access_token({"sub": user.email}),
-        "token_type": "bearer",
-    }
+    tokens = await issue_tokens(db, user.email, await open_session(db, user.id))
+    await db.commit()
+    return tokens
+
+
+async def refresh_tokens(refresh_token: str, db: AsyncSession) -> dict:
+    """Rotate a refresh token: no password check, so no bcrypt."""
+    invalid_exc = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired refresh token",
+    )
+    try:
+        claims = token_codec.decode(refresh_token)
+    except JWTError as exc:
+        raise invalid_exc from exc
+    if claims.get("type") != "refresh":
+        raise invalid_exc
+
+    if not await rotate_refresh_token(db, claims["jti"], claims["sid"]):
+        await db.commit()  # keep a reuse-triggered revocation
+        raise invalid_exc
+
+    tokens = await issue_tokens(db, claims["sub"], claims["sid"])
+    await db.commit()
+    return tokens
+
+
+async def logout(token: str, db: AsyncSession) -> None:
+    """Revoke the session behind an access token, with all its refresh tokens."""
+    try:
+        session_id = token_codec.decode(token).get("sid")
+    except JWTError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        ) from exc
+    if session_id is not None:
+        await revoke_session(db, session_id)
+        await db.commit()
 
 
 # ───────────────────── FastAPI dependency ───────────────────────── #
@@ -153,15 +234,49 @@ async def get_current_user(
     )
 
     try:
-        email: str | None = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get(
-            "sub",
-        )
-        if email is None:
-            raise credentials_exc
+        claims = token_codec.decode(token)
     except JWTError as exc:
         raise credentials_exc from exc
+    email: str | None = claims.get("sub")
+    if email is None or claims.get("type") == "refresh":
+        raise credentials_exc
+
+    # a query only when the filter says "maybe revoked"
+    session_id = claims.get("sid")
+    if session_id is not None and await revocation_filter.is_revoked(session_id, db):
+        raise credentials_exc
+
+    cached = await principal_cache.get(email)
+    if cached is not None:
+        return _user_from_snapshot(cached)
 
     user = await db.scalar(select(User).filter_by(email=email))
     if user is None:
         raise credentials_exc
+    await principal_cache.set(email, _user_snapshot(user))
     return user
+
+
+# ───────────────────────── principal cache ──────────────────────── #
+
+
+# what routes read off current_user; never the password hash, since
+# snapshots can land in the shared tier
+PRINCIPAL_FIELDS = ("id", "username", "email", "avatar", "is_verified")
+
+
+def _user_snapshot(user: User) -> dict:
+    return {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+
+
+def _user_from_snapshot(snapshot: dict) -> User:
+    # Rebuild a detached instance so callers can still db.add() and update it;
+    # the fields left out are expired and load from the DB if ever touched
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+async def invalidate_principal(email: str) -> None:
+    """Drop the cached principal after its users row changed."""
+    await principal_cache.delete(email)
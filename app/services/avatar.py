@@ -1,24 +1,159 @@
-import cloudinary
-import cloudinary.uploader
-from fastapi import UploadFile
+"""
+Avatar pipeline:
+– reject wrong types / oversized uploads before decoding
+– resize and recompress to a fixed square off the event loop
+– hand the small result to a pluggable storage backend
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional, Protocol
+
+from fastapi import HTTPException, UploadFile, status
 
 from app.config import settings
+from app.utils.metrics import AVATAR_UPLOAD_SECONDS
+
+ALLOWED_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp", "image/gif"}
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+OUTPUT_FORMAT = "JPEG"
+OUTPUT_CONTENT_TYPE = "image/jpeg"
+
+
+# ──────────────────────────── storage ───────────────────────────── #
+
+
+class AvatarStorage(Protocol):
+    async def save(self, public_id: str, data: bytes, content_type: str) -> str:
+        """Persist the avatar and return its public URL."""
+
+
+class CloudinaryStorage:
+    """Uploads to Cloudinary; the blocking SDK call runs in a worker thread."""
+
+    def __init__(self) -> None:
+        import cloudinary
+
+        cloudinary.config(
+            cloud_name=settings.cloudinary_name,
+            api_key=settings.cloudinary_api_key,
+            api_secret=settings.cloudinary_api_secret,
+            secure=True,
+        )
+
+    async def save(self, public_id: str, data: bytes, content_type: str) -> str:
+        import cloudinary.uploader
+
+        result = await asyncio.to_thread(
+            cloudinary.uploader.upload,
+            io.BytesIO(data),
+            public_id=public_id,
+            overwrite=True,
+            resource_type="image",
+        )
+        return result["secure_url"]
+
+
+class LocalStorage:
+    """Writes avatars to a directory; stand-in for Cloudinary in dev and tests."""
+
+    def __init__(self, root: str, base_url: str) -> None:
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
 
-# Configure Cloudinary using environment variables
-cloudinary.config(
-    cloud_name=settings.cloudinary_name,
-    api_key=settings.cloudinary_api_key,
-    api_secret=settings.cloudinary_api_secret,
-    secure=True,
-)
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
 
+    async def save(self, public_id: str, data: bytes, content_type: str) -> str:
+        relative = f"{public_id}.jpg"
+        await asyncio.to_thread(self._write, self.root / relative, data)
+        return f"{self.base_url}/{relative}"
 
-async def upload_avatar_to_cloudinary(file: UploadFile, public_id: str) -> str:
-    """Uploads an avatar image to Cloudinary and returns the secure URL."""
-    result = cloudinary.uploader.upload(
+
+_storage: Optional[AvatarStorage] = None
+
+
+def get_avatar_storage() -> AvatarStorage:
+    """Build the configured storage backend on first use."""
+    global _storage  # pylint: disable=global-statement
+    if _storage is None:
+        if settings.avatar_storage == "local":
+            _storage = LocalStorage(
+                settings.avatar_local_dir, settings.avatar_local_base_url
+            )
+        elif settings.avatar_storage == "cloudinary":
+            _storage = CloudinaryStorage()
+        else:
+            raise ValueError(f"Unknown avatar storage: {settings.avatar_storage!r}")
+    return _storage
+
+
+def set_avatar_storage(storage: AvatarStorage) -> None:
+    """Swap the storage backend (tests, benchmarks)."""
+    global _storage  # pylint: disable=global-statement
+    _storage = storage
+
+
+# ─────────────────────────── processing ─────────────────────────── #
+
+
+def _unprocessable(
+    detail: str, code: int = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+) -> HTTPException:
+    return HTTPException(status_code=code, detail=detail)
+
+
+def process_image(source: BinaryIO, size: int, quality: int) -> bytes:
+    """Decode, crop to a ``size``×``size`` square and re-encode as JPEG (blocking)."""
+    # Pillow is imported on first upload (runs in a worker thread), not at app import
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(source) as image:
+            # Image.open only parsed the header: check before decoding pixels
+            if image.format not in ALLOWED_FORMATS:
+                raise _unprocessable("Unsupported image format")
+            if image.width * image.height > settings.avatar_max_pixels:
+                raise _unprocessable(
+                    "Image dimensions too large",
+                    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+            # JPEG can decode at a reduced scale, skipping most of the work
+            image.draft("RGB", (size * 2, size * 2))
+            image = ImageOps.exif_transpose(image).convert("RGB")
+            avatar = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        raise _unprocessable("Invalid image file") from exc
+
+    output = io.BytesIO()
+    avatar.save(output, OUTPUT_FORMAT, quality=quality, optimize=True)
+    return output.getvalue()
+
+
+async def store_avatar(file: UploadFile, public_id: str) -> str:
+    """Validate, shrink and store an uploaded avatar; returns its URL."""
+    if file.content_type not in ALLOWED_CONTENT_TYPES:
+        raise _unprocessable("Avatar must be a JPEG, PNG, WebP or GIF image")
+    if file.size is not None and file.size > settings.avatar_max_bytes:
+        raise _unprocessable(
+            "Avatar file too large", status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
+
+    # The upload is spooled by Starlette; Pillow reads it from there in a thread
+    data = await asyncio.to_thread(
+        process_image,
         file.file,
-        public_id=public_id,
-        overwrite=True,
-        resource_type="image",
+        settings.avatar_size,
+        settings.avatar_quality,
+    )
+    started = time.perf_counter()
+    url = await get_avatar_storage().save(public_id, data, OUTPUT_CONTENT_TYPE)
+    AVATAR_UPLOAD_SECONDS.observe(
+        time.perf_counter() - started, (settings.avatar_storage,)
     )
-    return result["secure_url"]
+    return url
@@ -0,0 +1,240 @@
+"""
+Batch contact mutations:
+– one SELECT checks ownership (and versions) for every id in the batch
+– updates run as executemany UPDATEs, one per distinct set of changed
+  fields; one SELECT confirms which rows took them when the rowcounts
+  can't (asyncpg reports none); deletes as a single DELETE ... RETURNING
+– everything commits in one transaction and each id gets its own result
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.contact import Contact, ContactTombstone, birthday_key
+from app.models.user import User
+from app.schemas.contact import ContactBatchItemResult, ContactBatchUpdateItem
+from app.services.sync import next_change_seq
+
+UNIQUE_FIELDS = ("email", "phone")
+
+
+def _unique_violation(exc: IntegrityError) -> bool:
+    orig = exc.orig
+    return getattr(orig, "pgcode", None) == "23505" or getattr(
+        orig, "sqlite_errorname", None
+    ) == ("SQLITE_CONSTRAINT_UNIQUE")
+
+
+def _result(
+    contact_id: int, outcome: str, detail: str | None = None
+) -> ContactBatchItemResult:
+    return ContactBatchItemResult(id=contact_id, status=outcome, detail=detail)
+
+
+async def _unique_conflicts(
+    db: AsyncSession,
+    changes: Dict[int, dict],
+) -> Dict[int, str]:
+    """Ids whose new email/phone is taken, by another contact or within the batch."""
+    conflicts: Dict[int, str] = {}
+    claimed: Dict[Tuple[str, str], int] = {}
+    for contact_id, values in changes.items():
+        for field in UNIQUE_FIELDS:
+            if field in values:
+                owner = claimed.setdefault((field, values[field]), contact_id)
+                if owner != contact_id:
+                    conflicts[contact_id] = f"{field} repeated in batch"
+
+    wanted = {
+        field: {v[field] for v in changes.values() if field in v}
+        for field in UNIQUE_FIELDS
+    }
+    conditions = [
+        getattr(Contact, field).in_(values)
+        for field, values in wanted.items()
+        if values
+    ]
+    if conditions:
+        taken = await db.execute(
+            select(Contact.id, Contact.email, Contact.phone).where(or_(*conditions))
+        )
+        for row in taken.all():
+            for field in UNIQUE_FIELDS:
+                claimant = claimed.get((field, getattr(row, field)))
+                if claimant is not None and claimant != row.id:
+                    conflicts[claimant] = f"{field} already in use"
+    return conflicts
+
+
+async def update_contacts(
+    items: List[ContactBatchUpdateItem],
+    db: AsyncSession,
+    user: User,
+) -> Tuple[List[ContactBatchItemResult], int]:
+    """Apply per-contact patches; returns (results in input order, rows updated)."""
+    first: Dict[int, ContactBatchUpdateItem] = {}
+    for item in items:
+        first.setdefault(item.id, item)
+
+    owned = dict(
+        (
+            await db.execute(
+                select(Contact.id, Contact.version).where(
+                    Contact.user_id == user.id,
+                    Contact.id.in_(first),
+                ),
+            )
+        ).all(),
+    )
+
+    outcomes: Dict[int, ContactBatchItemResult] = {}
+    changes: Dict[int, dict] = {}
+    for contact_id, item in first.items():
+        values = item.changes.model_dump(exclude_unset=True)
+        if contact_id not in owned:
+            outcomes[contact_id] = _result(contact_id, "not_found")
+        elif item.version is not None and item.version != owned[contact_id]:
+            outcomes[contact_id] = _result(contact_id, "conflict", "version mismatch")
+        elif not values:
+            outcomes[contact_id] = _result(contact_id, "unchanged")
+        else:
+            changes[contact_id] = values
+
+    for contact_id, detail in (await _unique_conflicts(db, changes)).items():
+        del changes[contact_id]
+        outcomes[contact_id] = _result(contact_id, "conflict", detail)
+
+    applied: Set[int] = set()
+    if changes:
+        last_seq = await next_change_seq(db, user.id, len(changes))
+        # executemany needs uniform parameters: group by the set of changed fields
+        groups: Dict[Tuple[str, ...], List[dict]] = defaultdict(list)
+        for seq, (contact_id, values) in enumerate(
+            changes.items(), start=last_seq - len(changes) + 1
+        ):
+            if "birthday" in values:
+                values["birthday_md"] = birthday_key(values["birthday"])
+            params = {f"p_{key}": value for key, value in values.items()}
+            params.update(
+                p_id=contact_id, p_version=owned[contact_id], p_change_seq=seq
+            )
+            groups[tuple(sorted(values))].append(params)
+
+        table = Contact.__table__
+        confirmed = True
+        try:
+            for fields, rows in groups.items():
+                stmt = (
+                    update(table)
+                    .where(
+                        table.c.id == bindparam("p_id"),
+                        table.c.user_id == user.id,
+                        # the row must not have moved since the ownership SELECT
+                        table.c.version == bindparam("p_version"),
+                    )
+                    .values(
+                        {
+                            **{field: bindparam(f"p_{field}") for field in fields},
+                            "version": table.c.version + 1,
+                            "change_seq": bindparam("p_change_seq"),
+                        },
+                    )
+                )
+                result = await db.execute(stmt, rows)
+                if not result.supports_sane_multi_rowcount() or result.rowcount != len(
+                    rows
+                ):
+                    confirmed = False
+        except IntegrityError as exc:
+            if not _unique_violation(exc):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Email or phone already in use",
+            ) from exc
+
+        if confirmed:
+            applied = set(changes)
+        else:
+            # a short rowcount, or none at all (asyncpg): a row took its
+            # update iff it now carries the change_seq assigned to it
+            assigned = {
+                params["p_id"]: params["p_change_seq"]
+                for group in groups.values()
+                for params in group
+            }
+            stamped = await db.execute(
+                select(Contact.id, Contact.change_seq).where(Contact.id.in_(assigned))
+            )
+            applied = {
+                row.id for row in stamped.all() if row.change_seq == assigned[row.id]
+            }
+        for contact_id in changes:
+            if contact_id in applied:
+                outcomes[contact_id] = _result(contact_id, "updated")
+            else:
+                outcomes[contact_id] = _result(
+                    contact_id, "conflict", "changed during the batch"
+                )
+
+    await db.commit()
+    return _in_input_order([item.id for item in items], outcomes), len(applied)
+
+
+async def delete_contacts(
+    ids: List[int],
+    db: AsyncSession,
+    user: User,
+) -> Tuple[List[ContactBatchItemResult], int]:
+    """Delete the user's contacts among ``ids``; returns (results, rows deleted)."""
+    unique_ids = list(dict.fromkeys(ids))
+    # reserve first: the user row lock comes before contact rows, as in single writes
+    last_seq = await next_change_seq(db, user.id, len(unique_ids))
+    result = await db.execute(
+        delete(Contact)
+        .where(Contact.user_id == user.id, Contact.id.in_(unique_ids))
+        .returning(Contact.id),
+    )
+    deleted = set(result.scalars().all())
+    if deleted:
+        first_seq = last_seq - len(unique_ids) + 1
+        await db.execute(
+            insert(ContactTombstone),
+            [
+                {"user_id": user.id, "contact_id": contact_id, "change_seq": seq}
+                for seq, contact_id in enumerate(sorted(deleted), start=first_seq)
+            ],
+        )
+    await db.commit()
+
+    outcomes = {
+        contact_id: _result(
+            contact_id, "deleted" if contact_id in deleted else "not_found"
+        )
+        for contact_id in unique_ids
+    }
+    return _in_input_order(ids, outcomes), len(deleted)
+
+
+def _in_input_order(
+    ids: List[int],
+    outcomes: Dict[int, ContactBatchItemResult],
+) -> List[ContactBatchItemResult]:
+    # only the first occurrence of an id is applied; repeats are reported
+    seen: Set[int] = set()
+    results = []
+    for contact_id in ids:
+        results.append(
+            _result(contact_id, "duplicate")
+            if contact_id in seen
+            else outcomes[contact_id]
+        )
+        seen.add(contact_id)
+    return results
@@ -1,13 +1,48 @@
+from calendar import isleap
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, case, delete, insert, or_, select, tuple_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.contact import Contact
+from app.models.contact import Contact, birthday_key
 from app.models.user import User
-from app.schemas.contact import ContactCreate, ContactUpdate
+from app.schemas.contact import (
+    ContactBatchResult,
+    ContactBatchUpdateItem,
+    ContactCreate,
+    ContactImportResult,
+    ContactUpdate,
+)
+from app.services import batch, imports, search, sync
+from app.services.response_cache import response_cache
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.etag import parse_etags
+from app.utils.serializers import CONTACT_ROW_COLUMNS
+
+# Columns the keyset mode can order by; ``id`` breaks ties.
+SORT_COLUMNS = {
+    "id": Contact.id,
+    "last_name": Contact.last_name,
+}
+
+
+async def _contacts_changed(user: User) -> None:
+    """Drop derived per-user state after any write to the user's contacts."""
+    search.invalidate_index(user.id)
+    await response_cache.invalidate(user.id)
+
+
+def _list_query(skip: int, limit: int, user: User):
+    return (
+        select(*CONTACT_ROW_COLUMNS)
+        .filter(Contact.user_id == user.id)
+        .order_by(Contact.id)
+        .offset(skip)
+        .limit(limit)
+    )
 
 
 async def get_contacts(
@@ -15,11 +50,110 @@ async def get_contacts(
     limit: int,
     db: AsyncSession,
     user: User,
-) -> List[Contact]:
+) -> List[Row]:
     """Retrieve all contacts for the current user with pagination."""
-    query = select(Contact).filter(Contact.user_id == user.id).offset(skip).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
+    return (await db.execute(_list_query(skip, limit, user))).all()
+
+
+async def get_contacts_versions(
+    skip: int,
+    limit: int,
+    db: AsyncSession,
+    user: User,
+) -> List[Tuple[int, int]]:
+    """(id, version) pairs of the page ``get_contacts`` would return."""
+    query = _list_query(skip, limit, user).with_only_columns(
+        Contact.id, Contact.version
+    )
+    return [tuple(row) for row in (await db.execute(query)).all()]
+
+
+def _valid_position(position: dict, sort: str) -> bool:
+    # cursors are client-supplied: check the types before they reach SQL
+    def is_int(value) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    if not is_int(position.get("id")):
+        return False
+    if sort == "id":
+        return True
+    value = position.get("v")
+    python_type = SORT_COLUMNS[sort].type.python_type
+    return is_int(value) if python_type is int else isinstance(value, python_type)
+
+
+def _page_query(user: User, cursor: Optional[str], sort: str):
+    column = SORT_COLUMNS[sort]
+    query = select(*CONTACT_ROW_COLUMNS).filter(Contact.user_id == user.id)
+
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position.get("s") != sort:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor does not match the requested sort",
+            )
+        if not _valid_position(position, sort):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        if sort == "id":
+            query = query.filter(Contact.id > position["id"])
+        else:
+            query = query.filter(
+                tuple_(column, Contact.id) > (position["v"], position["id"])
+            )
+
+    if sort == "id":
+        return query.order_by(Contact.id)
+    return query.order_by(column, Contact.id)
+
+
+def _next_page(items: list, limit: int, sort: str) -> Tuple[list, Optional[str]]:
+    # items holds up to limit + 1 rows; the extra one means "more"
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    last = items[-1]
+    position = {"s": sort, "id": last.id}
+    if sort != "id":
+        position["v"] = getattr(last, sort)
+    return items, encode_cursor(position)
+
+
+async def get_contacts_page(
+    limit: int,
+    db: AsyncSession,
+    user: User,
+    cursor: Optional[str] = None,
+    sort: str = "id",
+) -> Tuple[List[Row], Optional[str]]:
+    """Keyset-paginate the current user's contacts; returns (page, next_cursor)."""
+    result = await db.execute(_page_query(user, cursor, sort).limit(limit + 1))
+    return _next_page(result.all(), limit, sort)
+
+
+async def get_contacts_page_versions(
+    limit: int,
+    db: AsyncSession,
+    user: User,
+    cursor: Optional[str] = None,
+    sort: str = "id",
+) -> Tuple[List[Tuple[int, int]], bool]:
+    """(id, version) pairs of a keyset page, and whether another page follows."""
+    query = _page_query(user, cursor, sort).with_only_columns(
+        Contact.id, Contact.version
+    )
+    rows = [tuple(row) for row in (await db.execute(query.limit(limit + 1))).all()]
+    return rows[:limit], len(rows) > limit
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Contact not found",
+    )
 
 
 async def get_contact_by_id(contact_id: int, db: AsyncSession, user: User) -> Contact:
@@ -31,52 +165,185 @@ async def get_contact_by_id(contact_id: int, db: AsyncSession, user: User) -> Co
     contact: Contact | None = result.scalars().first()
 
     if contact is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contact not found",
-        )
+        raise _not_found()
 
     return contact
 
 
+async def get_contact_version(contact_id: int, db: AsyncSession, user: User) -> int:
+    """Current version of a contact, without loading the row."""
+    version = await db.scalar(
+        select(Contact.version).where(
+            Contact.id == contact_id, Contact.user_id == user.id
+        ),
+    )
+    if version is None:
+        raise _not_found()
+    return version
+
+
+def _if_match_versions(contact_id: int, if_match: Optional[str]) -> Optional[List[int]]:
+    """Versions an If-Match header allows; None when it imposes no condition."""
+    if if_match is None:
+        return None
+    tags = parse_etags(if_match)
+    if "*" in tags:
+        return None
+    # strong comparison: weak tags and other contacts' tags never match
+    versions = []
+    for tag in tags:
+        owner, _, version = tag.strip('"').partition("-")
+        if tag.startswith('"') and owner == str(contact_id) and version.isdigit():
+            versions.append(int(version))
+    return versions
+
+
+async def _write_failed(
+    contact_id: int, db: AsyncSession, user: User, conditional: bool
+) -> HTTPException:
+    # The guarded statement matched nothing: tell "missing" from "stale"
+    if conditional and await db.scalar(
+        select(Contact.id).where(Contact.id == contact_id, Contact.user_id == user.id),
+    ):
+        return HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Contact was modified by another request",
+        )
+    return _not_found()
+
+
 async def create_contact(
     contact_data: ContactCreate,
     db: AsyncSession,
     user: User,
 ) -> Contact:
     """Create a new contact for the current user."""
-    new_contact = Contact(**contact_data.dict(), user_id=user.id)
-    db.add(new_contact)
+    values = contact_data.model_dump()
+    change_seq = await sync.next_change_seq(db, user.id)
+    # Core-style statement: @validates does not run, so derive birthday_md here
+    stmt = (
+        insert(Contact)
+        .values(
+            **values,
+            birthday_md=birthday_key(values["birthday"]),
+            change_seq=change_seq,
+            user_id=user.id,
+        )
+        .returning(Contact)
+    )
+    new_contact = (await db.scalars(stmt)).one()
     await db.commit()
-    await db.refresh(new_contact)
+    await _contacts_changed(user)
     return new_contact
 
 
+async def import_contacts(
+    fmt: str,
+    chunks: AsyncIterator[bytes],
+    db: AsyncSession,
+    user: User,
+) -> ContactImportResult:
+    """Bulk-import contacts from a streamed CSV or NDJSON body."""
+
+    async def batch_committed() -> None:
+        await _contacts_changed(user)
+
+    return await imports.stream_import(fmt, chunks, db, user, on_commit=batch_committed)
+
+
 async def update_contact(
     contact_id: int,
     contact_data: ContactUpdate,
     db: AsyncSession,
     user: User,
+    if_match: Optional[str] = None,
 ) -> Contact:
     """Update an existing contact owned by the current user."""
-    contact = await get_contact_by_id(contact_id, db, user)
-    for field, value in contact_data.dict(exclude_unset=True).items():
-        setattr(contact, field, value)
+    versions = _if_match_versions(contact_id, if_match)
+    values = contact_data.model_dump(exclude_unset=True)
+    if not values:
+        contact = await get_contact_by_id(contact_id, db, user)
+        if versions is not None and contact.version not in versions:
+            raise await _write_failed(contact_id, db, user, True)
+        return contact
+    if "birthday" in values:
+        values["birthday_md"] = birthday_key(values["birthday"])
+    values["version"] = Contact.version + 1
+    values["change_seq"] = await sync.next_change_seq(db, user.id)
+
+    # one UPDATE ... RETURNING; the user_id filter is the ownership check
+    stmt = update(Contact).where(Contact.id == contact_id, Contact.user_id == user.id)
+    if versions is not None:
+        stmt = stmt.where(Contact.version.in_(versions))
+    stmt = (
+        stmt.values(**values)
+        .returning(Contact)
+        .execution_options(populate_existing=True)
+    )
+    contact = (await db.scalars(stmt)).one_or_none()
+    if contact is None:
+        raise await _write_failed(contact_id, db, user, versions is not None)
     await db.commit()
-    await db.refresh(contact)
+    await _contacts_changed(user)
     return contact
 
 
-async def delete_contact(contact_id: int, db: AsyncSession, user: User):
+async def delete_contact(
+    contact_id: int,
+    db: AsyncSession,
+    user: User,
+    if_match: Optional[str] = None,
+):
     """Delete a contact belonging to the current user."""
-    contact = await get_contact_by_id(contact_id, db, user)
-    await db.delete(contact)
+    versions = _if_match_versions(contact_id, if_match)
+    change_seq = await sync.next_change_seq(db, user.id)
+    stmt = delete(Contact).where(Contact.id == contact_id, Contact.user_id == user.id)
+    if versions is not None:
+        stmt = stmt.where(Contact.version.in_(versions))
+    if (await db.scalars(stmt.returning(Contact.id))).one_or_none() is None:
+        raise await _write_failed(contact_id, db, user, versions is not None)
+    await sync.record_tombstone(db, user.id, contact_id, change_seq)
     await db.commit()
+    await _contacts_changed(user)
     return {"detail": "Contact deleted successfully"}
 
 
-async def search_contacts(query: str, db: AsyncSession, user: User) -> List[Contact]:
-    """Search contacts by first name, last name, or email."""
+async def batch_update_contacts(
+    items: List[ContactBatchUpdateItem],
+    db: AsyncSession,
+    user: User,
+) -> ContactBatchResult:
+    """Patch many contacts in one transaction, with a result per id."""
+    results, updated = await batch.update_contacts(items, db, user)
+    if updated:
+        await _contacts_changed(user)
+    return ContactBatchResult(results=results)
+
+
+async def batch_delete_contacts(
+    ids: List[int], db: AsyncSession, user: User
+) -> ContactBatchResult:
+    """Delete many contacts in one transaction, with a result per id."""
+    results, deleted = await batch.delete_contacts(ids, db, user)
+    if deleted:
+        await _contacts_changed(user)
+    return ContactBatchResult(results=results)
+
+
+async def search_contacts(
+    query: str,
+    db: AsyncSession,
+    user: User,
+    limit: int = 20,
+) -> List[Row]:
+    """Ranked search by name, email or phone, backed by an index."""
+    return await search.search(query, db, user, limit)
+
+
+async def search_contacts_ilike(
+    query: str, db: AsyncSession, user: User
+) -> List[Contact]:
+    """Unindexed substring search by first name, last name, or email (reference path)."""
     stmt = select(Contact).filter(
         and_(
             Contact.user_id == user.id,
@@ -91,20 +358,42 @@ async def search_contacts(query: str, db: AsyncSession, user: User) -> List[Cont
     return result.scalars().all()
 
 
-async def get_upcoming_birthdays(db: AsyncSession, user: User) -> List[Contact]:
-    """Retrieve contacts with birthdays in the next 7 days."""
-    today = date.today()
-    next_week = today + timedelta(days=7)
+def _birthday_ranges(today: date, days: int) -> List[Tuple[int, int]]:
+    """MMDD ranges covering today..today+days, split at the year boundary."""
+    if days >= 365:
+        return [(101, 1231)]
+    end = today + timedelta(days=days)
+    # birthday_key() spelled out: it returns Optional, and these dates are set
+    start_key, end_key = today.month * 100 + today.day, end.month * 100 + end.day
+    # Feb 29 birthdays are celebrated on Feb 28 in non-leap years
+    if end_key == 228 and not isleap(end.year):
+        end_key = 229
+    if end.year == today.year:
+        return [(start_key, end_key)]
+    return [(start_key, 1231), (101, end_key)]
 
-    stmt = select(Contact).filter(Contact.user_id == user.id)
-    result = await db.execute(stmt)
-    all_contacts = result.scalars().all()
 
-    upcoming_birthdays = [
-        contact
-        for contact in all_contacts
-        if contact.birthday
-        and today <= contact.birthday.replace(year=today.year) <= next_week
-    ]
+async def get_upcoming_birthdays(
+    db: AsyncSession,
+    user: User,
+    days: int = 7,
+) -> List[Row]:
+    """Retrieve contacts with birthdays in the next ``days`` days, soonest first."""
+    today = date.today()
+    start_key = birthday_key(today)
+    ranges = _birthday_ranges(today, days)
 
-    return upcoming_birthdays
+    stmt = (
+        select(*CONTACT_ROW_COLUMNS)
+        .filter(
+            Contact.user_id == user.id,
+            or_(*(Contact.birthday_md.between(low, high) for low, high in ranges)),
+        )
+        .order_by(
+            case((Contact.birthday_md >= start_key, 0), else_=1),
+            Contact.birthday_md,
+            Contact.id,
+        )
+    )
+    result = await db.execute(stmt)
+    return result.all()
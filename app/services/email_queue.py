@@ -0,0 +1,306 @@
+"""
+Background e-mail delivery:
+– enqueue_email() writes to the outbox inside the caller's transaction
+– EmailDispatcher workers claim due rows in batches and send them over a
+  reused, authenticated SMTP connection (blocking smtplib, in a thread)
+– failures retry with exponential backoff; exhausted rows become dead letters
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import smtplib
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.email import OutboxEmail
+from app.utils.email import build_message
+from app.utils.metrics import SMTP_SEND_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Check an idle connection with NOOP before reusing it
+NOOP_AFTER_SECONDS = 30.0
+# Close the connection once a worker has had nothing to send for this long
+IDLE_CLOSE_SECONDS = 60.0
+
+
+async def enqueue_email(
+    db: AsyncSession,
+    to_email: str,
+    subject: str,
+    html_body: str,
+    text_body: Optional[str] = None,
+) -> OutboxEmail:
+    """Queue an e-mail; it is sent once the caller commits."""
+    email = OutboxEmail(
+        to_email=to_email,
+        subject=subject,
+        html_body=html_body,
+        text_body=text_body,
+    )
+    db.add(email)
+    return email
+
+
+# ─────────────────────────── SMTP session ───────────────────────── #
+
+
+class SMTPConnection:
+    """A lazily opened SMTP connection kept alive between sends (blocking API)."""
+
+    def __init__(self) -> None:
+        self._smtp: smtplib.SMTP | None = None
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(
+            settings.mail_server, settings.mail_port, timeout=settings.mail_timeout
+        )
+        if settings.mail_starttls:
+            smtp.starttls()
+        if settings.mail_login:
+            smtp.login(settings.mail_username, settings.mail_password)
+        return smtp
+
+    def _ensure(self) -> smtplib.SMTP:
+        if (
+            self._smtp is not None
+            and time.monotonic() - self._last_used > NOOP_AFTER_SECONDS
+        ):
+            try:
+                alive = self._smtp.noop()[0] == 250
+            except (smtplib.SMTPException, OSError):
+                alive = False
+            if not alive:
+                self.close()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def send(self, email: OutboxEmail) -> None:
+        message = build_message(
+            email.to_email, email.subject, email.html_body, email.text_body
+        )
+        smtp = self._ensure()
+        try:
+            smtp.send_message(message)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self.close()
+            raise
+        self._last_used = time.monotonic()
+
+    @property
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self._last_used
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+
+# ──────────────────────────── dispatcher ────────────────────────── #
+
+
+class EmailDispatcher:
+    """Worker tasks draining the outbox."""
+
+    def __init__(
+        self,
+        workers: int,
+        batch_size: int,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        poll_interval: float,
+        lease_seconds: float,
+    ) -> None:
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._claim_lock = asyncio.Lock()
+        self._stopping = False
+
+        # metrics
+        self.sent = 0
+        self.failed = 0
+        self.dead = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._stopping = False
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers after new mail was committed."""
+        self._wakeup.set()
+
+    async def _worker(self) -> None:
+        connection = SMTPConnection()
+        try:
+            while not self._stopping:
+                try:
+                    batch = await self._claim()
+                    if batch:
+                        await self._deliver(connection, batch)
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("E-mail dispatcher iteration failed")
+
+                # idle: release the SMTP connection eventually, then wait for work
+                if connection.idle_seconds > IDLE_CLOSE_SECONDS:
+                    await asyncio.to_thread(connection.close)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+        finally:
+            await asyncio.to_thread(connection.close)
+
+    async def _claim(self) -> List[OutboxEmail]:
+        # SKIP LOCKED splits work across processes on PostgreSQL; the lock
+        # covers dialects without row locks (SQLite) within one process.
+        async with self._claim_lock, AsyncSessionLocal() as db:
+            now = datetime.utcnow()
+            stmt = (
+                select(OutboxEmail)
+                .where(
+                    OutboxEmail.status.in_((OutboxEmail.PENDING, OutboxEmail.SENDING)),
+                    OutboxEmail.next_attempt_at <= now,
+                )
+                .order_by(OutboxEmail.next_attempt_at, OutboxEmail.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            batch = list((await db.scalars(stmt)).all())
+            # a lease: rows left in "sending" by a crashed worker are retried later
+            for email in batch:
+                email.status = OutboxEmail.SENDING
+                email.attempts += 1
+                email.next_attempt_at = now + timedelta(seconds=self.lease_seconds)
+            await db.commit()
+            return batch
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = self.retry_base_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(delay, self.retry_max_seconds))
+
+    async def _deliver(
+        self, connection: SMTPConnection, batch: List[OutboxEmail]
+    ) -> None:
+        # The claim's lease would not cover a whole batch of slow sends, so
+        # each row's lease is renewed right before its send (in the same
+        # transaction that records the previous outcome). A row whose lease
+        # already lapsed was re-claimed elsewhere (attempts moved on): skip it.
+        outcome = None
+        for email in batch:
+            async with AsyncSessionLocal() as db:
+                if outcome is not None:
+                    await db.execute(
+                        update(OutboxEmail)
+                        .where(OutboxEmail.id == outcome[0])
+                        .values(**outcome[1])
+                    )
+                renewed = await db.execute(
+                    update(OutboxEmail)
+                    .where(
+                        OutboxEmail.id == email.id,
+                        OutboxEmail.status == OutboxEmail.SENDING,
+                        OutboxEmail.attempts == email.attempts,
+                    )
+                    .values(
+                        next_attempt_at=datetime.utcnow()
+                        + timedelta(seconds=self.lease_seconds)
+                    )
+                    .returning(OutboxEmail.id)
+                )
+                owned = renewed.first() is not None
+                await db.commit()
+            outcome = (email.id, await self._send(connection, email)) if owned else None
+
+        if outcome is not None:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(OutboxEmail)
+                    .where(OutboxEmail.id == outcome[0])
+                    .values(**outcome[1])
+                )
+                await db.commit()
+
+    async def _send(self, connection: SMTPConnection, email: OutboxEmail) -> dict:
+        """Send one e-mail; returns the column values recording the outcome."""
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(connection.send, email)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.failed += 1
+            if email.attempts >= self.max_attempts:
+                self.dead += 1
+                logger.error(
+                    "E-mail %s to %s dead-lettered: %s", email.id, email.to_email, exc
+                )
+                return {"status": OutboxEmail.DEAD, "last_error": str(exc)}
+            return {
+                "status": OutboxEmail.PENDING,
+                "last_error": str(exc),
+                "next_attempt_at": datetime.utcnow() + self._backoff(email.attempts),
+            }
+        self.sent += 1
+        SMTP_SEND_SECONDS.observe(time.perf_counter() - started)
+        return {
+            "status": OutboxEmail.SENT,
+            "sent_at": datetime.utcnow(),
+            "last_error": None,
+        }
+
+    async def stats(self) -> dict:
+        async with AsyncSessionLocal() as db:
+            rows = await db.execute(
+                select(OutboxEmail.status, func.count()).group_by(OutboxEmail.status),
+            )
+            outbox = {status: count for status, count in rows.all()}
+        return {
+            "workers": len(self._tasks),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dead": self.dead,
+            "outbox": outbox,
+        }
+
+
+email_dispatcher = EmailDispatcher(
+    workers=settings.email_workers,
+    batch_size=settings.email_batch_size,
+    max_attempts=settings.email_max_attempts,
+    retry_base_seconds=settings.email_retry_base_seconds,
+    retry_max_seconds=settings.email_retry_max_seconds,
+    poll_interval=settings.email_poll_interval,
+    lease_seconds=settings.email_lease_seconds,
+)
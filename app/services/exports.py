@@ -0,0 +1,63 @@
+"""
+Streaming export of a user's contacts:
+– rows come from a server-side cursor in yield_per partitions
+– each partition is serialised (orjson / csv) and flushed as one chunk
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import AsyncIterator
+
+import orjson
+from sqlalchemy import select
+
+from app.database import ReadSessionLocal
+from app.models.contact import Contact
+
+EXPORT_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone,
+    Contact.birthday,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+PARTITION_ROWS = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _ndjson_chunk(rows) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(EXPORT_FIELDS, row))) + b"\n" for row in rows)
+
+
+def _csv_chunk(rows, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def export_contacts(fmt: str, user_id: int) -> AsyncIterator[bytes]:
+    """Yield the user's contacts as NDJSON or CSV byte chunks, ordered by id."""
+    # Own session: request-scoped dependencies are closed before streaming starts
+    async with ReadSessionLocal() as session:
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .where(Contact.user_id == user_id)
+            .order_by(Contact.id)
+            .execution_options(yield_per=PARTITION_ROWS)
+        )
+        result = await session.stream(stmt)
+        if fmt == "csv":
+            yield _csv_chunk([], header=True)
+        async for partition in result.partitions():
+            yield _csv_chunk(partition) if fmt == "csv" else _ndjson_chunk(partition)
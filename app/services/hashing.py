@@ -0,0 +1,158 @@
+"""
+Bounded worker pool for bcrypt password work:
+– hashing / verifying run off the event loop
+– concurrency is capped, excess callers queue with a timeout
+– a full or stalled queue answers 503 instead of piling up
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.config import settings
+from app.utils.metrics import PASSWORD_HASH_SECONDS
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# ──────────────────────── worker functions ──────────────────────── #
+# Module-level so they can be pickled into a ProcessPoolExecutor.
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain: str, hashed: str) -> bool:
+    return pwd_context.verify(plain, hashed)
+
+
+# ───────────────────────────── pool ─────────────────────────────── #
+
+
+class PasswordHasher:
+    """Runs bcrypt in a thread/process pool with admission control."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue: int,
+        queue_timeout: float,
+        executor: str = "thread",
+    ) -> None:
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash executor: {executor!r}")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.executor_kind = executor
+
+        self._executor: Executor | None = None
+        self._slots = asyncio.Semaphore(max(max_workers, 1))
+        self._waiting = 0
+        self._in_flight = 0
+
+        # metrics
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(_verify, plain, hashed)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="bcrypt",
+                )
+        return self._executor
+
+    def _overloaded(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service is busy, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.max_workers <= 0:
+            # Inline mode: no pool, blocks the loop (tests / comparison only)
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._record(time.perf_counter() - started)
+
+        if self._waiting >= self.max_queue:
+            self.rejected += 1
+            raise self._overloaded()
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError as exc:
+            self.timed_out += 1
+            raise self._overloaded() from exc
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._record(time.perf_counter() - started)
+            self._in_flight -= 1
+            self._slots.release()
+
+    def _record(self, elapsed: float) -> None:
+        PASSWORD_HASH_SECONDS.observe(elapsed)
+        self.completed += 1
+        self.total_seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+
+    def stats(self) -> dict:
+        """Snapshot of queue depth and hash latency."""
+        return {
+            "executor": self.executor_kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self._waiting,
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "avg_latency_ms": (
+                self.total_seconds / self.completed * 1000 if self.completed else 0.0
+            ),
+            "max_latency_ms": self.max_seconds * 1000,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_queue_size,
+    queue_timeout=settings.password_hash_timeout,
+    executor=settings.password_hash_executor,
+)
@@ -0,0 +1,228 @@
+"""
+Streaming bulk import of contacts:
+– the request body is decoded incrementally, never held in full
+– rows are validated against ContactCreate in batches
+– each batch is one multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.contact import Contact, birthday_key
+from app.models.user import User
+from app.schemas.contact import ContactCreate, ContactImportError, ContactImportResult
+from app.services.sync import next_change_seq
+
+FORMATS = ("csv", "ndjson")
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+MAX_RECORD_CHARS = 64 * 1024
+
+
+def detect_format(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    return CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+
+
+# ───────────────────────────── parsing ──────────────────────────── #
+
+
+def _too_long() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Import record longer than {MAX_RECORD_CHARS} characters",
+    )
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        if len(pending) > MAX_RECORD_CHARS:
+            raise _too_long()
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield pending.rstrip("\r")
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    # A CSV record is complete once its quotes balance (quoted newlines)
+    record = ""
+    async for line in _lines(chunks):
+        record = f"{record}\n{line}" if record else line
+        if len(record) > MAX_RECORD_CHARS:
+            raise _too_long()
+        if record.count('"') % 2 == 0:
+            if record.strip():
+                yield record
+            record = ""
+    if record.strip():
+        yield record
+
+
+async def _raw_rows(
+    fmt: str, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[Tuple[int, object]]:
+    """Yield (row_number, dict-or-error-message) per data row."""
+    row = 0
+    if fmt == "ndjson":
+        async for line in _lines(chunks):
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                yield row, orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                yield row, f"Invalid JSON: {exc}"
+        return
+
+    header: List[str] | None = None
+    async for record in _csv_records(chunks):
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        yield row, {name: value for name, value in zip(header, values) if value != ""}
+
+
+def _validate(raw: object) -> ContactCreate | List[str]:
+    if isinstance(raw, str):
+        return [raw]
+    if not isinstance(raw, dict):
+        return ["Row must be an object"]
+    try:
+        return ContactCreate.model_validate(raw)
+    except ValidationError as exc:
+        return [
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors()
+        ]
+
+
+# ───────────────────────────── writing ──────────────────────────── #
+
+
+def _insert_ignoring_conflicts(db: AsyncSession):
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(Contact).on_conflict_do_nothing()
+
+
+async def _insert_batch(
+    db: AsyncSession,
+    user: User,
+    batch: List[Tuple[int, ContactCreate]],
+) -> List[ContactImportError]:
+    errors: List[ContactImportError] = []
+    rows: List[Dict] = []
+    rows_by_email: Dict[str, int] = {}
+    phones = set()
+
+    for row, contact in batch:
+        if contact.email in rows_by_email or contact.phone in phones:
+            errors.append(
+                ContactImportError(
+                    row=row, errors=["Duplicate email or phone in import"]
+                )
+            )
+            continue
+        rows_by_email[contact.email] = row
+        phones.add(contact.phone)
+        rows.append(
+            {
+                **contact.model_dump(),
+                "birthday_md": birthday_key(contact.birthday),
+                "user_id": user.id,
+            },
+        )
+
+    if rows:
+        # one sequence number per row, reserved in a single statement
+        last_seq = await next_change_seq(db, user.id, len(rows))
+        for offset, values in enumerate(rows, start=last_seq - len(rows) + 1):
+            values["change_seq"] = offset
+        result = await db.execute(
+            _insert_ignoring_conflicts(db).returning(Contact.email), rows
+        )
+        inserted = set(result.scalars().all())
+        await db.commit()
+        errors.extend(
+            ContactImportError(row=row, errors=["Email or phone already exists"])
+            for email, row in rows_by_email.items()
+            if email not in inserted
+        )
+    return errors
+
+
+async def stream_import(
+    fmt: str,
+    chunks: AsyncIterator[bytes],
+    db: AsyncSession,
+    user: User,
+    on_commit: Optional[Callable[[], Awaitable[None]]] = None,
+) -> ContactImportResult:
+    """Import contacts from a CSV/NDJSON byte stream; each batch commits on its own.
+
+    ``on_commit`` runs after every batch that inserted rows, so those rows are
+    visible to caches even if a later batch (or the stream) fails.
+    """
+    batch_size = settings.import_batch_size
+    max_errors = settings.import_max_errors
+    inserted = failed = 0
+    errors: List[ContactImportError] = []
+    batch: List[Tuple[int, ContactCreate]] = []
+
+    def record(new_errors: List[ContactImportError]) -> None:
+        nonlocal failed
+        failed += len(new_errors)
+        errors.extend(new_errors[: max(0, max_errors - len(errors))])
+
+    async def flush() -> None:
+        nonlocal inserted
+        batch_errors = await _insert_batch(db, user, batch)
+        committed = len(batch) - len(batch_errors)
+        inserted += committed
+        record(batch_errors)
+        batch.clear()
+        if committed and on_commit is not None:
+            await on_commit()
+
+    async for row, raw in _raw_rows(fmt, chunks):
+        contact = _validate(raw)
+        if isinstance(contact, list):
+            record([ContactImportError(row=row, errors=contact)])
+            continue
+        batch.append((row, contact))
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    errors.sort(key=lambda error: error.row)
+    return ContactImportResult(
+        inserted=inserted,
+        failed=failed,
+        errors=errors,
+        errors_truncated=failed > len(errors),
+    )
@@ -1,24 +1,266 @@
+"""
+Rate limiting:
+– algorithms: token bucket (GCRA) and sliding-window counter
+– state lives in a pluggable CounterStore (Redis-shaped: INCR/EXPIRE/CAS);
+  InMemoryCounterStore is the per-process stand-in
+– policies become FastAPI dependencies keyed per IP or per user, and
+  answer with RateLimit-* headers
+"""
+
+from __future__ import annotations
+
+import math
 import time
+from dataclasses import dataclass
+from typing import Literal, NamedTuple, Optional, Protocol
 
-from fastapi import HTTPException, Request
+from fastapi import Depends, HTTPException, Request, Response
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
 
-request_times: dict[str, float] = {}
+from app.config import settings
+from app.models.user import User
+from app.services.auth import get_current_user
+
+# ───────────────────────────── stores ───────────────────────────── #
+
+
+class CounterStore(Protocol):
+    """Atomic per-key numeric state with expiry."""
+
+    async def get(self, key: str) -> Optional[float]:
+        """Current value, or None if the key is unset or expired."""
+
+    async def incr(self, key: str, amount: float, ttl: float) -> float:
+        """Add ``amount`` and return the total; a new key expires after ``ttl``."""
+
+    async def compare_and_set(
+        self,
+        key: str,
+        expected: Optional[float],
+        value: float,
+        ttl: float,
+    ) -> bool:
+        """Store ``value`` only if the key still holds ``expected`` (None: unset)."""
+
+
+class InMemoryCounterStore:
+    """Per-process store; each key holds one float and expires on its own."""
+
+    SWEEP_EVERY = 1024
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[float, float]] = {}
+        self._ops = 0
+
+    def _live(self, key: str, now: float) -> Optional[float]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._data[key]
+            return None
+        return entry[1]
+
+    def _maybe_sweep(self, now: float) -> None:
+        # amortised cleanup so idle keys don't accumulate
+        self._ops += 1
+        if self._ops % self.SWEEP_EVERY == 0:
+            expired = [
+                key for key, (expires_at, _) in self._data.items() if expires_at <= now
+            ]
+            for key in expired:
+                del self._data[key]
+
+    async def get(self, key: str) -> Optional[float]:
+        return self._live(key, time.monotonic())
+
+    async def incr(self, key: str, amount: float, ttl: float) -> float:
+        now = time.monotonic()
+        self._maybe_sweep(now)
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= now:
+            value, expires_at = amount, now + ttl
+        else:
+            value, expires_at = entry[1] + amount, entry[0]
+        self._data[key] = (expires_at, value)
+        return value
+
+    async def compare_and_set(
+        self,
+        key: str,
+        expected: Optional[float],
+        value: float,
+        ttl: float,
+    ) -> bool:
+        now = time.monotonic()
+        self._maybe_sweep(now)
+        if self._live(key, now) != expected:
+            return False
+        self._data[key] = (now + ttl, value)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def build_counter_store(name: str) -> CounterStore:
+    if name == "memory":
+        return InMemoryCounterStore()
+    raise ValueError(f"Unknown rate limit backend: {name!r}")
+
+
+counter_store: CounterStore = build_counter_store(settings.rate_limit_backend)
+
+
+def set_counter_store(store: CounterStore) -> None:
+    """Plug in a shared store (e.g. one backed by Redis) for multi-worker limits."""
+    global counter_store  # pylint: disable=global-statement
+    counter_store = store
+
+
+# ─────────────────────────── algorithms ─────────────────────────── #
+
+
+class Decision(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # seconds until the limit is fully restored
+    retry_after: float  # seconds until the next request may pass (0 if allowed)
+
+
+async def token_bucket(
+    store: CounterStore,
+    key: str,
+    capacity: int,
+    period: float,
+    now: float,
+) -> Decision:
+    """GCRA: ``capacity`` requests per ``period``, bursts up to ``capacity``.
+
+    Stores a single "theoretical arrival time" per key, updated with CAS.
+    """
+    interval = period / capacity
+    for _ in range(8):
+        tat = await store.get(key)
+        new_tat = max(tat if tat is not None else now, now) + interval
+        allow_at = new_tat - capacity * interval
+        if now < allow_at:
+            return Decision(False, capacity, 0, (tat or now) - now, allow_at - now)
+        if await store.compare_and_set(key, tat, new_tat, new_tat - now):
+            remaining = int((now - allow_at) / interval)
+            return Decision(True, capacity, remaining, new_tat - now, 0.0)
+    # heavy contention on one key: fail closed
+    return Decision(False, capacity, 0, period, interval)
+
+
+async def sliding_window(
+    store: CounterStore,
+    key: str,
+    limit: int,
+    period: float,
+    now: float,
+) -> Decision:
+    """Sliding-window counter: current + weighted previous fixed window."""
+    window = math.floor(now / period)
+    elapsed = now - window * period
+    previous = await store.get(f"{key}:{window - 1}") or 0.0
+    current = await store.get(f"{key}:{window}") or 0.0
+    weight = 1 - elapsed / period
+    count = previous * weight + current
+
+    if count >= limit:
+        if current >= limit or previous == 0:
+            retry_after = period - elapsed
+        else:
+            retry_after = min((count - limit + 1) * period / previous, period - elapsed)
+        return Decision(False, limit, 0, period - elapsed, retry_after)
+
+    await store.incr(f"{key}:{window}", 1, 2 * period)
+    return Decision(True, limit, max(0, int(limit - count - 1)), period - elapsed, 0.0)
+
+
+ALGORITHMS = {
+    "token_bucket": token_bucket,
+    "sliding_window": sliding_window,
+}
+
+
+# ──────────────────────────── policies ──────────────────────────── #
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    limit: int
+    period: float
+    algorithm: Literal["token_bucket", "sliding_window"] = "token_bucket"
+    scope: Literal["ip", "user"] = "ip"
+
+
+def _headers(policy: RateLimitPolicy, decision: Decision) -> dict[str, str]:
+    headers = {
+        "RateLimit-Limit": str(decision.limit),
+        "RateLimit-Remaining": str(decision.remaining),
+        "RateLimit-Reset": str(math.ceil(decision.reset_after)),
+        "RateLimit-Policy": f"{policy.limit};w={math.ceil(policy.period)}",
+    }
+    if not decision.allowed:
+        headers["Retry-After"] = str(max(1, math.ceil(decision.retry_after)))
+    return headers
+
+
+async def check_rate_limit(
+    policy: RateLimitPolicy, identity: str, response: Response
+) -> None:
+    if not settings.rate_limit_enabled:
+        return
+    algorithm = ALGORITHMS[policy.algorithm]
+    key = f"rl:{policy.name}:{identity}"
+    # wall clock, not monotonic: a shared store is read by many hosts
+    decision = await algorithm(
+        counter_store, key, policy.limit, policy.period, time.time()
+    )
+    headers = _headers(policy, decision)
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Too many requests. Please wait {headers['Retry-After']} seconds.",
+            headers=headers,
+        )
+    response.headers.update(headers)
+
+
+def rate_limit(policy: RateLimitPolicy):
+    """Build a route dependency enforcing ``policy``."""
+    if policy.scope == "user":
+
+        async def limit_user(
+            response: Response,
+            current_user: User = Depends(get_current_user),
+        ) -> None:
+            await check_rate_limit(policy, f"user:{current_user.id}", response)
 
-RATE_LIMIT_SECONDS = 5  # Time interval between allowed requests
+        return limit_user
 
+    async def limit_ip(request: Request, response: Response) -> None:
+        host = request.client.host if request.client else "unknown"
+        await check_rate_limit(policy, f"ip:{host}", response)
 
-async def rate_limiter(request: Request) -> None:
-    """Limit access to endpoint per IP address."""
-    ip: str = request.client.host
-    current_time: float = time.time()
+    return limit_ip
 
-    if ip in request_times:
-        elapsed = current_time - request_times[ip]
-        if elapsed < RATE_LIMIT_SECONDS:
-            raise HTTPException(
-                status_code=HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Too many requests. Please wait {int(RATE_LIMIT_SECONDS - elapsed)} seconds.",
-            )
 
-    request_times[ip] = current_time
+# One request per RATE_LIMIT_SECONDS on /me, as before (GCRA is exact here)
+RATE_LIMIT_SECONDS = 5
+rate_limiter = rate_limit(RateLimitPolicy("me", limit=1, period=RATE_LIMIT_SECONDS))
+login_rate_limiter = rate_limit(
+    RateLimitPolicy("auth", limit=settings.rate_limit_auth_per_minute, period=60),
+)
+api_rate_limiter = rate_limit(
+    RateLimitPolicy(
+        "api",
+        limit=settings.rate_limit_api_burst,
+        period=settings.rate_limit_api_burst / settings.rate_limit_api_per_second,
+        scope="user",
+    ),
+)
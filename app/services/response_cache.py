@@ -0,0 +1,108 @@
+"""
+Per-user cache of serialized contact read responses:
+– JSON bodies and their ETags, keyed by user, generation, route and params
+– each user has a generation token; every write to the user's contacts
+  replaces it, so all older entries become unreachable at once (no key scans)
+– local LRU tier in front of the optional shared tier (TieredCache); with a
+  shared backend the generation lives there too, so writes on one worker
+  invalidate every worker
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import NamedTuple, Optional
+
+from app.config import settings
+from app.utils.cache import LocalCache, SharedBackend, TieredCache, build_shared_backend
+
+# Generations must outlive the bodies keyed by them; an expired generation
+# is simply replaced, which orphans (never resurrects) older entries
+GENERATION_TTL = 24 * 3600.0
+
+
+class CachedBody(NamedTuple):
+    body: str
+    etag: str
+
+
+class CacheSlot(NamedTuple):
+    key: Optional[str]  # None when caching is disabled
+    entry: Optional[CachedBody]
+
+
+def _new_generation() -> str:
+    # random rather than a counter: no read-modify-write across workers
+    return uuid.uuid4().hex[:12]
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        shared: SharedBackend | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self.shared = shared
+        self.bodies = TieredCache(
+            "response", maxsize=maxsize, ttl=ttl, shared=shared, enabled=enabled
+        )
+        self.generations = LocalCache(maxsize=maxsize, ttl=GENERATION_TTL)
+        self.invalidations = 0
+
+    async def _generation(self, user_id: int) -> str:
+        if self.shared is not None:
+            key = f"response-generation:{user_id}"
+            generation = await self.shared.get(key)
+            if generation is None:
+                generation = _new_generation()
+                await self.shared.set(key, generation, GENERATION_TTL)
+            return generation
+        generation = self.generations.get(user_id)
+        if generation is None:
+            generation = _new_generation()
+            self.generations.set(user_id, generation)
+        return generation
+
+    async def lookup(self, user_id: int, route: str, params: str) -> CacheSlot:
+        """Find a cached body; on a miss, pass the slot to :meth:`store`.
+
+        The generation is read before the caller queries the database, so a
+        body built from data older than a concurrent write is stored under
+        the superseded generation and never served.
+        """
+        if not self.enabled:
+            return CacheSlot(None, None)
+        key = f"{user_id}:{await self._generation(user_id)}:{route}:{params}"
+        value = await self.bodies.get(key)
+        return CacheSlot(key, CachedBody(*value) if value is not None else None)
+
+    async def store(self, slot: CacheSlot, body: str, etag: str) -> None:
+        if slot.key is not None:
+            # a list, not bytes: shared backends hold JSON-like values
+            await self.bodies.set(slot.key, [body, etag])
+
+    async def invalidate(self, user_id: int) -> None:
+        if not self.enabled:
+            return
+        self.invalidations += 1
+        generation = _new_generation()
+        if self.shared is not None:
+            await self.shared.set(
+                f"response-generation:{user_id}", generation, GENERATION_TTL
+            )
+        else:
+            self.generations.set(user_id, generation)
+
+    def stats(self) -> dict:
+        return {**self.bodies.stats(), "invalidations": self.invalidations}
+
+
+response_cache = ResponseCache(
+    maxsize=settings.response_cache_size,
+    ttl=settings.response_cache_ttl,
+    shared=build_shared_backend(settings.cache_shared_backend),
+    enabled=settings.response_cache_enabled,
+)
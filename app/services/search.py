@@ -0,0 +1,205 @@
+"""
+Indexed contact search:
+– PostgreSQL: pg_trgm GIN indexes on name/e-mail and phone digits
+– other dialects (SQLite test runs): per-user in-process n-gram index
+Both rank prefix matches first and normalise phone-number queries, and
+return plain rows of CONTACT_ROW_COLUMNS.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, List
+
+from sqlalchemy import case, func, literal_column, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.contact import SEARCH_PHONE_EXPR, SEARCH_TEXT_EXPR, Contact
+from app.models.user import User
+from app.utils.cache import LocalCache
+from app.utils.serializers import CONTACT_ROW_COLUMNS
+
+PHONE_QUERY_RE = re.compile(r"^\+?[\d\s().-]+$")
+TOKEN_SPLIT_RE = re.compile(r"[\s@._+-]+")
+MIN_PHONE_DIGITS = 3
+
+
+def normalize_phone(value: str) -> str:
+    """Keep only the digits of a phone number."""
+    return re.sub(r"\D", "", value)
+
+
+def _phone_digits(query: str) -> str | None:
+    if PHONE_QUERY_RE.match(query):
+        digits = normalize_phone(query)
+        if len(digits) >= MIN_PHONE_DIGITS:
+            return digits
+    return None
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# ─────────────────────────── PostgreSQL ─────────────────────────── #
+
+
+async def _search_postgres(
+    query: str, db: AsyncSession, user: User, limit: int
+) -> List[Row]:
+    text_expr = literal_column(SEARCH_TEXT_EXPR)
+    needle = _escape_like(query.lower())
+    conditions = [text_expr.like(f"%{needle}%", escape="\\")]
+
+    digits = _phone_digits(query)
+    if digits:
+        conditions.append(literal_column(SEARCH_PHONE_EXPR).like(f"%{digits}%"))
+
+    prefix = f"{needle}%"
+    is_prefix = or_(
+        func.lower(Contact.first_name).like(prefix, escape="\\"),
+        func.lower(Contact.last_name).like(prefix, escape="\\"),
+        func.lower(Contact.email).like(prefix, escape="\\"),
+    )
+    stmt = (
+        select(*CONTACT_ROW_COLUMNS)
+        .where(Contact.user_id == user.id, or_(*conditions))
+        .order_by(
+            case((is_prefix, 1), else_=0).desc(),
+            func.similarity(text_expr, query.lower()).desc(),
+            Contact.id,
+        )
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return list(result.all())
+
+
+# ─────────────────────── in-process fallback ────────────────────── #
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i : i + 3] for i in range(len(value) - 2)}
+
+
+class NgramIndex:
+    """Trigram postings over one user's contacts, plus token-prefix postings."""
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self.texts: dict[int, str] = {}
+        self.tokens: dict[int, list[str]] = {}
+        self.phones: dict[int, str] = {}
+        self.postings: dict[str, set[int]] = {}
+
+        for contact_id, first_name, last_name, email, phone in rows:
+            text = f"{first_name} {last_name} {email}".lower()
+            tokens = [token for token in TOKEN_SPLIT_RE.split(text) if token]
+            digits = normalize_phone(phone)
+            self.texts[contact_id] = text
+            self.tokens[contact_id] = tokens
+            self.phones[contact_id] = digits
+
+            grams = _trigrams(text)
+            grams.update("#" + gram for gram in _trigrams(digits))
+            for token in tokens:
+                grams.update("^" + token[:size] for size in (1, 2))
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(contact_id)
+
+    def _candidates(self, grams: set[str]) -> set[int]:
+        result: set[int] | None = None
+        for gram in sorted(grams, key=lambda g: len(self.postings.get(g, ()))):
+            posting = self.postings.get(gram)
+            if not posting:
+                return set()
+            result = set(posting) if result is None else result & posting
+            if not result:
+                return result
+        return result or set()
+
+    def search(self, query: str, limit: int) -> list[int]:
+        needle = query.lower().strip()
+        scores: dict[int, int] = {}
+
+        if len(needle) >= 3:
+            for contact_id in self._candidates(_trigrams(needle)):
+                if needle in self.texts[contact_id]:
+                    scores[contact_id] = 1
+        elif needle:
+            # too short for trigrams: prefix matches only
+            scores.update(dict.fromkeys(self.postings.get("^" + needle, ()), 1))
+
+        for contact_id in list(scores):
+            if any(token.startswith(needle) for token in self.tokens[contact_id]):
+                scores[contact_id] = 2
+
+        digits = _phone_digits(query)
+        if digits:
+            for contact_id in self._candidates(
+                {"#" + gram for gram in _trigrams(digits)}
+            ):
+                phone = self.phones[contact_id]
+                if digits in phone:
+                    score = 2 if phone.startswith(digits) else 1
+                    scores[contact_id] = max(scores.get(contact_id, 0), score)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [contact_id for contact_id, _ in ranked[:limit]]
+
+
+# user_id -> NgramIndex; dropped by invalidate_index() on every contact write
+_indexes = LocalCache(
+    maxsize=settings.search_index_max_users, ttl=settings.search_index_ttl
+)
+
+
+async def _get_index(db: AsyncSession, user: User) -> NgramIndex:
+    index = _indexes.get(user.id)
+    if index is None:
+        rows = await db.execute(
+            select(
+                Contact.id,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.email,
+                Contact.phone,
+            ).where(Contact.user_id == user.id),
+        )
+        index = NgramIndex(rows.all())
+        _indexes.set(user.id, index)
+    return index
+
+
+def invalidate_index(user_id: int) -> None:
+    """Forget the in-process index after the user's contacts changed."""
+    _indexes.delete(user_id)
+
+
+async def _search_ngram(
+    query: str, db: AsyncSession, user: User, limit: int
+) -> List[Row]:
+    ids = (await _get_index(db, user)).search(query, limit)
+    if not ids:
+        return []
+    result = await db.execute(
+        select(*CONTACT_ROW_COLUMNS).where(
+            Contact.user_id == user.id, Contact.id.in_(ids)
+        ),
+    )
+    by_id = {row.id: row for row in result.all()}
+    return [by_id[contact_id] for contact_id in ids if contact_id in by_id]
+
+
+# ──────────────────────────── entry point ───────────────────────── #
+
+
+async def search(query: str, db: AsyncSession, user: User, limit: int) -> List[Row]:
+    """Ranked search over name, e-mail and phone, using the best index available."""
+    query = query.strip()
+    if not query:
+        return []
+    if db.get_bind().dialect.name == "postgresql":
+        return await _search_postgres(query, db, user, limit)
+    return await _search_ngram(query, db, user, limit)
@@ -0,0 +1,209 @@
+"""
+Login sessions, refresh tokens and revocation:
+– a login opens a session; its access tokens carry the session id (``sid``)
+  and its refresh tokens form one rotation family
+– each refresh token works once; presenting an already-used one revokes the
+  whole session (the token was copied)
+– revoked session ids are mirrored into an in-memory Bloom filter, synced
+  incrementally from the DB, so access-token checks only query on a "maybe"
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.session import AuthSession, RefreshToken
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# incremental syncs re-read this far back, for revocations committed late
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def _new_id() -> str:
+    return secrets.token_hex(16)
+
+
+# ──────────────────────────── sessions ──────────────────────────── #
+
+
+async def open_session(db: AsyncSession, user_id: int) -> str:
+    session_id = _new_id()
+    await db.execute(insert(AuthSession).values(id=session_id, user_id=user_id))
+    return session_id
+
+
+async def add_refresh_token(db: AsyncSession, session_id: str) -> Tuple[str, datetime]:
+    """Store a new refresh token for the session; returns (jti, expires_at)."""
+    jti = _new_id()
+    expires_at = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+    await db.execute(
+        insert(RefreshToken).values(
+            jti=jti, session_id=session_id, expires_at=expires_at
+        )
+    )
+    return jti, expires_at
+
+
+async def rotate_refresh_token(db: AsyncSession, jti: str, session_id: str) -> bool:
+    """Mark the token used if it is still valid; False (and maybe a revocation) if not."""
+    now = datetime.utcnow()
+    live_sessions = select(AuthSession.id).where(AuthSession.revoked_at.is_(None))
+    stmt = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.jti == jti,
+            RefreshToken.session_id == session_id,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.expires_at > now,
+            RefreshToken.session_id.in_(live_sessions),
+        )
+        .values(used_at=now)
+        .returning(RefreshToken.jti)
+    )
+    if (await db.execute(stmt)).first() is not None:
+        return True
+    # a second use of the same token: someone else holds a copy
+    if (
+        await db.scalar(select(RefreshToken.used_at).where(RefreshToken.jti == jti))
+        is not None
+    ):
+        logger.warning("Refresh token reuse; revoking session %s", session_id)
+        await revoke_session(db, session_id)
+    return False
+
+
+async def revoke_session(db: AsyncSession, session_id: str) -> None:
+    await db.execute(
+        update(AuthSession)
+        .where(AuthSession.id == session_id, AuthSession.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow()),
+    )
+    # this worker sees it at once; others on their next sync
+    revocation_filter.add(session_id)
+
+
+async def purge_refresh_tokens(db: AsyncSession, now: datetime) -> int:
+    result = await db.execute(delete(RefreshToken).where(RefreshToken.expires_at < now))
+    await db.commit()
+    return result.rowcount
+
+
+# ─────────────────────────── revocations ────────────────────────── #
+
+
+class RevocationFilter:
+    """Bloom filter of sessions revoked within the access-token lifetime.
+
+    Older revocations don't matter on the hot path: every access token from
+    such a session has expired. A miss is a definite "not revoked"; a hit
+    is confirmed with one query. Until the first sync every check queries.
+    """
+
+    def __init__(
+        self, capacity: int, error_rate: float, window: timedelta, interval: float
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window = window
+        self.interval = interval
+        self._filter = BloomFilter(capacity, error_rate)
+        self._synced_at: Optional[datetime] = None
+        self._built_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self.checks = 0
+        self.queries = 0
+        self.revoked = 0
+
+    def add(self, session_id: str) -> None:
+        if session_id not in self._filter:
+            self._filter.add(session_id)
+
+    async def sync(self, db: AsyncSession) -> bool:
+        """Pull revocations since the last sync; rebuilds (returns True) once per window."""
+        now = datetime.utcnow()
+        since = now - self.window
+        if self._built_at is None or self._synced_at is None:
+            rebuild = True
+        else:
+            rebuild = now - self._built_at >= self.window or self._filter.saturated
+            if not rebuild:
+                since = self._synced_at - SYNC_OVERLAP
+        session_ids = (
+            await db.scalars(
+                select(AuthSession.id).where(AuthSession.revoked_at >= since)
+            )
+        ).all()
+        if rebuild:
+            fresh = BloomFilter(self.capacity, self.error_rate)
+            for session_id in session_ids:
+                fresh.add(session_id)
+            self._filter, self._built_at = fresh, now
+        else:
+            for session_id in session_ids:
+                self.add(session_id)
+        self._synced_at = now
+        return rebuild
+
+    async def is_revoked(self, session_id: str, db: AsyncSession) -> bool:
+        self.checks += 1
+        if self._synced_at is not None and session_id not in self._filter:
+            return False
+        self.queries += 1
+        revoked_at = await db.scalar(
+            select(AuthSession.revoked_at).where(AuthSession.id == session_id)
+        )
+        if revoked_at is not None:
+            self.revoked += 1
+        return revoked_at is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    if await self.sync(db):
+                        # piggy-back the (rare) cleanup on the rebuild
+                        await purge_refresh_tokens(db, datetime.utcnow())
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Revocation filter sync failed")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        return {
+            "synced_at": self._synced_at.isoformat() if self._synced_at else None,
+            "entries": len(self._filter),
+            "capacity": self.capacity,
+            "bits": self._filter.bits,
+            "checks": self.checks,
+            "queries": self.queries,
+            "revoked": self.revoked,
+        }
+
+
+revocation_filter = RevocationFilter(
+    capacity=settings.revocation_filter_capacity,
+    error_rate=settings.revocation_filter_error_rate,
+    window=timedelta(minutes=settings.token_expire_minutes),
+    interval=settings.revocation_sync_interval,
+)
@@ -0,0 +1,206 @@
+"""
+Delta sync for contacts:
+– every contact write takes fresh numbers from the owner's change sequence
+  (users.change_seq) and stamps them on the row (contacts.change_seq)
+– deletes leave a tombstone carrying their sequence number
+– get_changes() returns rows and tombstones past a sync token, in sequence
+  order, so the cost follows the number of changes, not the address book
+– TombstoneCompactor drops old tombstones and raises users.sync_floor;
+  tokens below the floor answer 410 and the client resyncs from scratch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.contact import Contact, ContactTombstone
+from app.models.user import User
+from app.schemas.contact import ContactChanges
+from app.utils.cursor import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+
+# ────────────────────────── write side ──────────────────────────── #
+
+
+async def next_change_seq(db: AsyncSession, user_id: int, count: int = 1) -> int:
+    """Reserve ``count`` sequence numbers for ``user_id``; returns the last one.
+
+    The UPDATE row-locks the user until commit, so one user's changes
+    commit in sequence order and a token never skips a late commit.
+    """
+    stmt = (
+        update(User)
+        .where(User.id == user_id)
+        .values(change_seq=User.change_seq + count)
+        .returning(User.change_seq)
+        .execution_options(synchronize_session=False)
+    )
+    return (await db.execute(stmt)).scalar_one()
+
+
+async def record_tombstone(
+    db: AsyncSession, user_id: int, contact_id: int, change_seq: int
+) -> None:
+    await db.execute(
+        insert(ContactTombstone).values(
+            user_id=user_id, contact_id=contact_id, change_seq=change_seq
+        ),
+    )
+
+
+# ─────────────────────────── read side ──────────────────────────── #
+
+
+def _decode_token(token: str) -> Tuple[int, int]:
+    position = decode_cursor(token)
+    seq, contact_id = position.get("seq"), position.get("id", 0)
+    if not isinstance(seq, int) or not isinstance(contact_id, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token",
+        )
+    return seq, contact_id
+
+
+async def get_changes(
+    since: Optional[str],
+    limit: int,
+    db: AsyncSession,
+    user: User,
+) -> ContactChanges:
+    """Contacts written and deleted after ``since`` (everything when None)."""
+    # user may be a cached snapshot: read the live counters
+    counters = await db.execute(
+        select(User.change_seq, User.sync_floor).where(User.id == user.id)
+    )
+    current_seq, floor = counters.one()
+
+    # Rows written before sync existed all carry change_seq 0, so positions
+    # are (change_seq, id); sequence numbers are otherwise unique per user.
+    position = (-1, 0) if since is None else _decode_token(since)
+    if since is not None and position[0] < floor:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token expired; fetch the full address book again",
+        )
+
+    contacts = (
+        await db.scalars(
+            select(Contact)
+            .where(
+                Contact.user_id == user.id,
+                tuple_(Contact.change_seq, Contact.id) > position,
+            )
+            .order_by(Contact.change_seq, Contact.id)
+            .limit(limit + 1),
+        )
+    ).all()
+    events: List[Tuple[int, int, object]] = [(c.change_seq, c.id, c) for c in contacts]
+
+    # a fresh sync has nothing to delete
+    if since is not None:
+        tombstones = await db.execute(
+            select(ContactTombstone.change_seq, ContactTombstone.contact_id)
+            .where(
+                ContactTombstone.user_id == user.id,
+                ContactTombstone.change_seq > position[0],
+            )
+            .order_by(ContactTombstone.change_seq)
+            .limit(limit + 1),
+        )
+        events.extend((seq, 0, contact_id) for seq, contact_id in tombstones.all())
+        events.sort(key=lambda event: event[:2])
+
+    has_more = len(events) > limit
+    events = events[:limit]
+    if events:
+        position = events[-1][:2]
+    if not has_more:
+        # caught up: everything numbered up to the counter read above is
+        # committed and was visible to these queries
+        position = max(position, (current_seq, 0))
+
+    return ContactChanges(
+        changed=[event[2] for event in events if isinstance(event[2], Contact)],
+        deleted=[event[2] for event in events if not isinstance(event[2], Contact)],
+        next_token=encode_cursor({"seq": position[0], "id": position[1]}),
+        has_more=has_more,
+    )
+
+
+# ─────────────────────────── compaction ─────────────────────────── #
+
+
+async def compact_tombstones(db: AsyncSession, older_than: datetime) -> int:
+    """Drop tombstones older than ``older_than``; returns how many went."""
+    floors = await db.execute(
+        select(ContactTombstone.user_id, func.max(ContactTombstone.change_seq))
+        .where(ContactTombstone.deleted_at < older_than)
+        .group_by(ContactTombstone.user_id),
+    )
+    removed = 0
+    for user_id, floor in floors.all():
+        await db.execute(
+            update(User)
+            .where(User.id == user_id, User.sync_floor < floor)
+            .values(sync_floor=floor),
+        )
+        result = await db.execute(
+            delete(ContactTombstone).where(
+                ContactTombstone.user_id == user_id,
+                ContactTombstone.change_seq <= floor,
+            ),
+        )
+        removed += result.rowcount
+    await db.commit()
+    return removed
+
+
+class TombstoneCompactor:
+    """Background task running compact_tombstones() periodically."""
+
+    def __init__(self, interval: float, retention_days: int) -> None:
+        self.interval = interval
+        self.retention = timedelta(days=retention_days)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    removed = await compact_tombstones(
+                        db, datetime.utcnow() - self.retention
+                    )
+                if removed:
+                    logger.info("Compacted %d contact tombstones", removed)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Tombstone compaction failed")
+            await asyncio.sleep(self.interval)
+
+
+tombstone_compactor = TombstoneCompactor(
+    interval=settings.sync_compaction_interval,
+    retention_days=settings.sync_tombstone_retention_days,
+)
@@ -1,7 +1,9 @@
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.schemas.user import AvatarUpdate
+from app.services.auth import invalidate_principal
 
 
 async def update_avatar(
@@ -10,8 +12,15 @@ async def update_avatar(
     current_user: User,
 ) -> User:
     """Update user avatar from given URL."""
-    current_user.avatar = avatar_data.avatar_url
-    db.add(current_user)
+    # current_user may be a detached cached snapshot: write by id, read back via RETURNING
+    stmt = (
+        update(User)
+        .where(User.id == current_user.id)
+        .values(avatar=avatar_data.avatar_url)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    user = (await db.scalars(stmt)).one()
     await db.commit()
-    await db.refresh(current_user)
-    return current_user
+    await invalidate_principal(user.email)
+    return user
@@ -0,0 +1,46 @@
+"""Bloom filter: set membership with no false negatives and a bounded
+false-positive rate, in a fixed-size bit array."""
+
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        # optimal bit count and hash count for ``capacity`` items at ``error_rate``
+        self.bits = max(
+            8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * step) % self.bits for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        array = self._array
+        return all(
+            array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def saturated(self) -> bool:
+        """More items than it was sized for: the false-positive rate is climbing."""
+        return self.count > self.capacity
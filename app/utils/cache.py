@@ -0,0 +1,159 @@
+"""
+Small caching toolkit shared by the services:
+– LocalCache: in-process LRU with per-entry TTL
+– SharedBackend: pluggable cross-worker tier (Redis-shaped, async)
+– TieredCache: local tier in front of an optional shared tier
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Protocol
+
+
+class LocalCache:
+    """Bounded LRU mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SharedBackend(Protocol):
+    """Cross-worker key/value store; values must be JSON-like."""
+
+    async def get(self, key: str) -> Any | None:
+        """Stored value, or None if the key is missing or expired."""
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds, replacing any previous one."""
+
+    async def delete(self, key: str) -> None:
+        """Drop the key; missing keys are ignored."""
+
+
+class InMemorySharedBackend:
+    """Process-local stand-in for a shared store such as Redis."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[float, Any]] = {}
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+def build_shared_backend(name: str) -> SharedBackend | None:
+    """Resolve the ``cache_shared_backend`` setting to a backend instance."""
+    if name in ("", "none"):
+        return None
+    if name == "memory":
+        return InMemorySharedBackend()
+    raise ValueError(f"Unknown shared cache backend: {name!r}")
+
+
+class TieredCache:
+    """Local LRU tier in front of an optional shared tier, with hit/miss counters."""
+
+    def __init__(
+        self,
+        namespace: str,
+        maxsize: int,
+        ttl: float,
+        shared: SharedBackend | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local = LocalCache(maxsize, ttl)
+        self.shared = shared
+        self.enabled = enabled
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        if value is not None:
+            self.local_hits += 1
+            return value
+        if self.shared is not None:
+            value = await self.shared.get(self._key(key))
+            if value is not None:
+                self.shared_hits += 1
+                self.local.set(key, value)
+                return value
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        self.local.set(key, value)
+        if self.shared is not None:
+            await self.shared.set(self._key(key), value, self.ttl)
+
+    async def delete(self, key: str) -> None:
+        self.local.delete(key)
+        if self.shared is not None:
+            await self.shared.delete(self._key(key))
+
+    def stats(self) -> dict:
+        lookups = self.local_hits + self.shared_hits + self.misses
+        hits = self.local_hits + self.shared_hits
+        return {
+            "enabled": self.enabled,
+            "size": len(self.local),
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
@@ -1,50 +1,92 @@
 # pylint: disable=E0401,E0611
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional
+
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
 
 from app.config import settings
 
-# Email template for verification
-TEMPLATE_PATH = Path(__file__).parent / "templates" / "verify_email.html"
+# Email templates: <name>.html plus an optional plain-text <name>.txt
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+TEMPLATE_EXTENSIONS = ("html", "txt")
+
+SUBJECTS = {
+    "verify_email": "Verify your email address",
+}
+
+# Compiled templates are cached by the environment; with auto_reload off
+# (production) they are never re-read from disk after the first load.
+template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=settings.email_templates_reload,
+    cache_size=-1,
+)
+
 
+class RenderedEmail(NamedTuple):
+    subject: str
+    html: str
+    text: Optional[str]
 
-def load_template() -> str:
-    """Load the HTML template for the email."""
-    if TEMPLATE_PATH.exists():
-        return TEMPLATE_PATH.read_text()
-    raise FileNotFoundError("Email template not found.")
 
+def preload_templates() -> List[str]:
+    """Compile every email template once (call at startup)."""
+    names = template_env.list_templates(extensions=TEMPLATE_EXTENSIONS)
+    for name in names:
+        template_env.get_template(name)
+    return names
+
+
+def _text_template(name: str):
+    try:
+        return template_env.get_template(f"{name}.txt")
+    except TemplateNotFound:
+        return None
 
-def send_verification_email(to_email: str, token: str):
-    """Send verification email with a confirmation link."""
-    subject = "Verify your email address"
-    from_email = settings.mail_username
-    password = settings.mail_password
-    smtp_server = settings.mail_server
-    smtp_port = settings.mail_port
 
-    # Create the verification link
+def render_bulk(name: str, contexts: Iterable[dict]) -> List[RenderedEmail]:
+    """Render one template for many recipients, resolving it only once."""
+    subject = SUBJECTS[name]
+    html_template = template_env.get_template(f"{name}.html")
+    text_template = _text_template(name)
+    return [
+        RenderedEmail(
+            subject=subject,
+            html=html_template.render(context),
+            text=text_template.render(context) if text_template is not None else None,
+        )
+        for context in contexts
+    ]
+
+
+def render_email(name: str, **context) -> RenderedEmail:
+    """Render the HTML and plain-text parts of a named email."""
+    return render_bulk(name, [context])[0]
+
+
+def render_verification_email(token: str) -> RenderedEmail:
+    """Render the verification email for a signup token."""
     verification_link = f"{settings.frontend_base_url}/verify-email?token={token}"
+    return render_email("verify_email", verification_link=verification_link)
 
-    # Load and personalize the HTML template
-    html_template = load_template()
-    html_content = html_template.replace("{{ verification_link }}", verification_link)
 
-    # Construct the email message
+def build_message(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+) -> MIMEMultipart:
+    """Construct a multipart/alternative message ready for SMTP."""
     message = MIMEMultipart("alternative")
     message["Subject"] = subject
-    message["From"] = from_email
+    message["From"] = settings.mail_username
     message["To"] = to_email
 
-    part_html = MIMEText(html_content, "html")
-    message.attach(part_html)
-
-    try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(from_email, password)
-            server.sendmail(from_email, to_email, message.as_string())
-    except Exception as e:
-        raise RuntimeError(f"Failed to send verification email: {e}") from e
+    # plain text first: clients show the last part they support
+    if text_content is not None:
+        message.attach(MIMEText(text_content, "plain"))
+    message.attach(MIMEText(html_content, "html"))
+    return message
@@ -0,0 +1,40 @@
+"""Entity tags for conditional requests (If-None-Match / If-Match)."""
+
+import hashlib
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+from fastapi import Response, status
+
+
+def contact_etag(contact_id: int, version: int) -> str:
+    return f'"{contact_id}-{version}"'
+
+
+def collection_etag(versions: Iterable[Tuple[int, int]], *extra) -> str:
+    """Tag for a list page, derived from its (id, version) pairs."""
+    digest = hashlib.blake2b(digest_size=12)
+    for contact_id, version in versions:
+        digest.update(f"{contact_id}-{version};".encode())
+    for part in extra:
+        digest.update(f"|{part}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def parse_etags(header: str) -> List[str]:
+    """Split an If-Match / If-None-Match header into its entity tags."""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    if not if_none_match:
+        return False
+    tags = parse_etags(if_none_match)
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def not_modified(etag: str, headers: Optional[Mapping[str, str]] = None) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={**(headers or {}), "ETag": etag},
+    )
@@ -0,0 +1,150 @@
+"""
+Query auditing for development and CI:
+– engine cursor events feed every statement to the audits active in the
+  current context (a request, a test, a benchmark step)
+– an audit flags statement budgets, the same SQL repeated with different
+  parameters (the N+1 shape) and slow statements
+– strict audits raise at the offending statement, so the traceback points
+  at the code that issued it; others collect violations for a report
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+SQL_PREVIEW_CHARS = 200
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+def _preview(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > SQL_PREVIEW_CHARS:
+        return statement[:SQL_PREVIEW_CHARS] + "…"
+    return statement
+
+
+class QueryAudit:
+    """Statements seen inside one audit scope, checked against its limits."""
+
+    def __init__(
+        self,
+        max_statements: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        slow_ms: Optional[float] = None,
+        strict: bool = False,
+    ) -> None:
+        self.max_statements = max_statements
+        self.max_repeats = max_repeats
+        self.slow_seconds = slow_ms / 1000 if slow_ms is not None else None
+        self.strict = strict
+        self.statements: List[Tuple[str, float]] = []
+        self.repeats: Counter[str] = Counter()
+        self.violations: List[str] = []
+
+    def _violation(self, message: str) -> None:
+        self.violations.append(message)
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements.append((statement, elapsed))
+        self.repeats[statement] += 1
+        # each limit is reported once, when it is first crossed
+        if (
+            self.max_statements is not None
+            and len(self.statements) == self.max_statements + 1
+        ):
+            self._violation(
+                f"More than {self.max_statements} statements: {_preview(statement)}"
+            )
+        if (
+            self.max_repeats is not None
+            and self.repeats[statement] == self.max_repeats + 1
+        ):
+            self._violation(
+                f"Same statement run more than {self.max_repeats} times (N+1?): {_preview(statement)}",
+            )
+        if self.slow_seconds is not None and elapsed > self.slow_seconds:
+            self._violation(
+                f"Slow statement ({elapsed * 1000:.0f} ms): {_preview(statement)}"
+            )
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def seconds(self) -> float:
+        return sum(elapsed for _, elapsed in self.statements)
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements, {self.seconds * 1000:.1f} ms"]
+        lines.extend(f"  ! {violation}" for violation in self.violations)
+        for statement, times in self.repeats.most_common():
+            lines.append(f"  {times:>4} × {_preview(statement)}")
+        return "\n".join(lines)
+
+    def check(self) -> None:
+        if self.violations:
+            raise QueryBudgetExceeded(self.report())
+
+
+# Audits stack: a request audit can run inside a test's budget audit
+active_audits: ContextVar[Tuple[QueryAudit, ...]] = ContextVar(
+    "active_audits", default=()
+)
+
+
+@contextmanager
+def audit_queries(
+    max_statements: Optional[int] = None,
+    max_repeats: Optional[int] = None,
+    slow_ms: Optional[float] = None,
+    strict: bool = False,
+) -> Iterator[QueryAudit]:
+    """Audit statements run in this context; engines need :func:`audit_engine`."""
+    audit = QueryAudit(max_statements, max_repeats, slow_ms, strict)
+    token = active_audits.set((*active_audits.get(), audit))
+    try:
+        yield audit
+    finally:
+        active_audits.reset(token)
+
+
+# ──────────────────────────── DB hooks ──────────────────────────── #
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    if active_audits.get():
+        context.audit_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    audits = active_audits.get()
+    if not audits:
+        return
+    elapsed = time.perf_counter() - context.audit_started
+    for audit in audits:
+        audit.record(statement, elapsed)
+
+
+def audit_engine(engine: AsyncEngine) -> None:
+    """Attach the audit hooks to ``engine`` (idempotent)."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,43 @@
+"""Lean JSON for contact lists: rows go straight to orjson, skipping
+per-row Pydantic validation (the API shape is still ContactRead)."""
+
+from typing import Iterable, List
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from app.models.contact import Contact
+
+# ContactRead's fields, in its field order
+CONTACT_READ_COLUMNS = (
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone,
+    Contact.birthday,
+    Contact.id,
+)
+CONTACT_READ_FIELDS = tuple(column.key for column in CONTACT_READ_COLUMNS)
+# What read queries select: the ContactRead fields, plus version for ETags
+CONTACT_ROW_COLUMNS = (*CONTACT_READ_COLUMNS, Contact.version)
+
+
+def contact_rows(rows: Iterable[tuple]) -> List[dict]:
+    """Map rows starting with CONTACT_READ_COLUMNS to ContactRead-shaped dicts.
+
+    Trailing extra columns (e.g. version) are dropped.
+    """
+    return [dict(zip(CONTACT_READ_FIELDS, row)) for row in rows]
+
+
+def contact_rows_response(rows: Iterable[tuple], **kwargs) -> ORJSONResponse:
+    return ORJSONResponse(contact_rows(rows), **kwargs)
+
+
+def contact_dict(contact: Contact) -> dict:
+    return {field: getattr(contact, field) for field in CONTACT_READ_FIELDS}
+
+
+def dumps(content) -> str:
+    """JSON text as ORJSONResponse would render it (for cached bodies)."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS).decode()
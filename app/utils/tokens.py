@@ -0,0 +1,109 @@
+"""
+JWT signing and verification:
+– key material is parsed once into jose Key objects (HMAC secret, or RSA /
+  EC PEM keys), instead of on every jwt.encode / jwt.decode call
+– RS*/ES*/PS* tokens can be verified with just the public key, so other
+  services can check them without sharing a secret
+– verified claims are cached by token digest in a bounded LRU, each entry
+  expiring with its token's ``exp``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional
+
+from jose import jwk, jwt
+from jose.backends.base import Key
+
+from app.utils.cache import LocalCache
+
+ASYMMETRIC_PREFIXES = ("RS", "ES", "PS")
+
+
+def read_pem_file(path: Optional[str]) -> Optional[str]:
+    return Path(path).read_text() if path else None
+
+
+class TokenCodec:
+    """Encode and verify JWTs for one algorithm and key pair."""
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret: Optional[str] = None,
+        private_key: Optional[str] = None,
+        public_key: Optional[str] = None,
+        cache_size: int = 10_000,
+        cache_enabled: bool = True,
+    ) -> None:
+        self.algorithm = algorithm
+        self.signing_key: Optional[Key]
+        self.verifying_key: Key
+        if algorithm.startswith(ASYMMETRIC_PREFIXES):
+            if private_key is None and public_key is None:
+                raise ValueError(f"{algorithm} needs a private and/or public PEM key")
+            self.signing_key = (
+                jwk.construct(private_key, algorithm) if private_key else None
+            )
+            self.verifying_key = (
+                jwk.construct(public_key, algorithm)
+                if public_key
+                else self.signing_key.public_key()
+            )
+        else:
+            if not secret:
+                raise ValueError(f"{algorithm} needs a secret key")
+            self.signing_key = self.verifying_key = jwk.construct(secret, algorithm)
+
+        self.cache_enabled = cache_enabled and cache_size > 0
+        self._cache = LocalCache(maxsize=cache_size, ttl=0)
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, claims: dict) -> str:
+        if self.signing_key is None:
+            raise RuntimeError(
+                "This codec only has a public key; it cannot sign tokens"
+            )
+        return jwt.encode(claims, self.signing_key, algorithm=self.algorithm)
+
+    def _verify(self, token: str) -> dict:
+        return jwt.decode(token, self.verifying_key, algorithms=[self.algorithm])
+
+    def decode(self, token: str) -> dict:
+        """Verified claims of ``token``; raises JWTError like jwt.decode."""
+        if not self.cache_enabled:
+            return self._verify(token)
+
+        digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        claims = self._cache.get(digest)
+        if claims is not None:
+            self.hits += 1
+            return dict(claims)
+
+        self.misses += 1
+        claims = self._verify(token)
+        exp = claims.get("exp")
+        # tokens without exp are still verified, just never cached
+        if isinstance(exp, (int, float)):
+            remaining = exp - time.time()
+            if remaining > 0:
+                self._cache.set(digest, claims, ttl=remaining)
+        return dict(claims)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.cache_enabled,
+            "algorithm": self.algorithm,
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
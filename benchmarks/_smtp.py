@@ -0,0 +1,68 @@
+"""Minimal in-process SMTP server standing in for a real relay.
+
+Speaks just enough SMTP for smtplib (EHLO, AUTH PLAIN, MAIL, RCPT, DATA,
+NOOP, RSET, QUIT); no STARTTLS, so run the app with MAIL_STARTTLS=false.
+"""
+
+import asyncio
+
+
+class StubSMTPServer:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.messages: list[bytes] = []
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> "StubSMTPServer":
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        await reply("220 stub ESMTP")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                verb = line.decode(errors="replace").strip().split(" ", 1)[0].upper()
+                if verb == "EHLO":
+                    await reply("250-stub")
+                    await reply("250 AUTH PLAIN")
+                elif verb == "HELO":
+                    await reply("250 stub")
+                elif verb == "AUTH":
+                    await reply("235 Authentication successful")
+                elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    body = bytearray()
+                    while (chunk := await reader.readline()) not in (b".\r\n", b""):
+                        body += chunk
+                    await asyncio.sleep(self.delay)
+                    self.messages.append(bytes(body))
+                    await reply("250 Queued")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
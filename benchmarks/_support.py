@@ -0,0 +1,138 @@
+"""Shared helpers for the benchmark scripts.
+
+Call :func:`bootstrap_env` before anything from ``app`` is imported – the
+settings object is built at import time and needs a database URL.
+"""
+
+import os
+import tempfile
+from typing import Iterable
+
+BENCH_PASSWORD = "bench-password"
+
+
+def bootstrap_env(database_url: str | None = None) -> str:
+    """Point the app at a throwaway SQLite file (or the given URL)."""
+    if database_url is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="contacts-bench-"), "bench.db")
+        database_url = f"sqlite+aiosqlite:///{path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+    os.environ.setdefault("CLOUDINARY_NAME", "bench")
+    os.environ.setdefault("CLOUDINARY_API_KEY", "bench")
+    os.environ.setdefault("CLOUDINARY_API_SECRET", "bench")
+    os.environ.setdefault("MAIL_USERNAME", "bench@example.com")
+    os.environ.setdefault("MAIL_PASSWORD", "bench")
+    # benchmarks hammer single users/IPs; bench_rate_limit re-enables it
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    return database_url
+
+
+async def create_schema() -> None:
+    import app.models  # noqa: F401  (register tables on Base.metadata)
+    from app.database import Base, engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await sync_revocation_filter()
+
+
+async def sync_revocation_filter() -> None:
+    """What the app's startup loop does first; unsynced, every auth check queries."""
+    from app.database import AsyncSessionLocal
+    from app.services.sessions import revocation_filter
+
+    async with AsyncSessionLocal() as session:
+        await revocation_filter.sync(session)
+
+
+async def dispose() -> None:
+    """Close pooled connections so the process can exit."""
+    from app.database import engine, read_engine
+
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+
+
+async def seed_user(email: str, password: str = BENCH_PASSWORD, verified: bool = True):
+    """Insert a user directly, bypassing signup (and its e-mail)."""
+    from app.database import AsyncSessionLocal
+    from app.models.user import User
+    from app.services.hashing import pwd_context
+
+    async with AsyncSessionLocal() as session:
+        user = User(
+            username=email.split("@")[0],
+            email=email,
+            password=pwd_context.hash(password),
+            is_verified=verified,
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+
+async def seed_contacts(user_id: int, count: int, batch: int = 5000) -> None:
+    """Bulk-insert ``count`` synthetic contacts for ``user_id``."""
+    from datetime import date
+
+    from sqlalchemy import insert
+
+    from app.database import AsyncSessionLocal
+    from app.models.contact import Contact
+
+    async with AsyncSessionLocal() as session:
+        for start in range(0, count, batch):
+            rows = [
+                {
+                    "first_name": f"First{i}",
+                    "last_name": f"Last{i}",
+                    "email": f"u{user_id}c{i}@example.com",
+                    "phone": f"+1{user_id:03d}{i:07d}",
+                    "birthday": date(1980 + i % 30, 1 + i % 12, 1 + i % 28),
+                    "user_id": user_id,
+                }
+                for i in range(start, min(start + batch, count))
+            ]
+            await session.execute(insert(Contact), rows)
+        await session.commit()
+
+
+def client():
+    """httpx client driving the FastAPI app in-process."""
+    import httpx
+
+    from app.main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+
+
+async def login(http, email: str, password: str = BENCH_PASSWORD) -> dict:
+    """Log in and return an Authorization header."""
+    response = await http.post(
+        "/api/auth/login", json={"email": email, "password": password}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def percentile(samples: Iterable[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> str:
+    """One-line latency summary, samples in seconds."""
+    return (
+        f"n={len(samples)} "
+        f"p50={percentile(samples, 50) * 1000:.1f}ms "
+        f"p95={percentile(samples, 95) * 1000:.1f}ms "
+        f"p99={percentile(samples, 99) * 1000:.1f}ms"
+    )
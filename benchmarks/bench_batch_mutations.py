@@ -0,0 +1,100 @@
+"""N single PUT/DELETE requests vs one batch request: statements and time.
+
+python -m benchmarks.bench_batch_mutations --items 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from sqlalchemy import event  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+)
+
+statements = 0
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count(*_args) -> None:
+    global statements  # pylint: disable=global-statement
+    statements += 1
+
+
+async def measure(label: str, run) -> None:
+    global statements  # pylint: disable=global-statement
+    statements = 0
+    started = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<16} {statements:>6} statements  {elapsed * 1000:>8.1f}ms")
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("batch@example.com")
+    await seed_contacts(user.id, args.items * 4)
+    n = args.items
+    singles, batched = range(1, n + 1), range(n + 1, 2 * n + 1)
+    doomed_singles, doomed_batched = range(2 * n + 1, 3 * n + 1), range(
+        3 * n + 1, 4 * n + 1
+    )
+
+    async with client() as http:
+        headers = await login(http, "batch@example.com")
+        # the principal cache is warm from here on, so auth adds no statements
+
+        async def single_updates():
+            for contact_id in singles:
+                response = await http.put(
+                    f"/api/contacts/{contact_id}",
+                    json={"last_name": f"Single{contact_id}"},
+                    headers=headers,
+                )
+                response.raise_for_status()
+
+        async def batch_update():
+            items = [{"id": i, "changes": {"last_name": f"Batch{i}"}} for i in batched]
+            response = await http.patch(
+                "/api/contacts/batch", json={"items": items}, headers=headers
+            )
+            response.raise_for_status()
+
+        async def single_deletes():
+            for contact_id in doomed_singles:
+                response = await http.delete(
+                    f"/api/contacts/{contact_id}", headers=headers
+                )
+                response.raise_for_status()
+
+        async def batch_delete():
+            response = await http.post(
+                "/api/contacts/batch/delete",
+                json={"ids": list(doomed_batched)},
+                headers=headers,
+            )
+            response.raise_for_status()
+
+        print(f"{n} contacts")
+        await measure("update x single", single_updates)
+        await measure("update batch", batch_update)
+        await measure("delete x single", single_deletes)
+        await measure("delete batch", batch_delete)
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,104 @@
+"""Upcoming birthdays: rows transferred and latency vs address-book size.
+
+Compares the SQL day-of-year filter against the old approach of loading
+every contact and filtering in Python. Only ``--matching`` contacts have
+a birthday inside the window, so the SQL path should transfer the same
+amount of data at every size.
+
+    python -m benchmarks.bench_birthdays --sizes 1000 10000 50000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from sqlalchemy import select, update  # noqa: E402
+
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.models.contact import Contact, birthday_key  # noqa: E402
+from app.services.contacts import get_upcoming_birthdays  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+)
+
+
+def payload_bytes(contacts) -> int:
+    columns = Contact.__table__.columns.keys()
+    return sum(
+        len(str(getattr(contact, column))) for contact in contacts for column in columns
+    )
+
+
+async def legacy_upcoming(db, user):
+    """The pre-index implementation: load everything, filter in Python."""
+    today = date.today()
+    next_week = today + timedelta(days=7)
+    result = await db.execute(select(Contact).filter(Contact.user_id == user.id))
+    all_contacts = result.scalars().all()
+    matches = []
+    for contact in all_contacts:
+        try:
+            upcoming = contact.birthday.replace(year=today.year)
+        except ValueError:  # Feb 29 in a non-leap year
+            continue
+        if today <= upcoming <= next_week:
+            matches.append(contact)
+    return all_contacts, matches
+
+
+async def prepare(size: int, matching: int):
+    await create_schema()
+    user = await seed_user(f"user{size}@example.com")
+    await seed_contacts(user.id, size)
+    off_window = date.today() - timedelta(days=60)
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Contact).values(
+                birthday=off_window, birthday_md=birthday_key(off_window)
+            ),
+        )
+        ids = (await db.scalars(select(Contact.id).limit(matching))).all()
+        await db.execute(
+            update(Contact)
+            .where(Contact.id.in_(ids))
+            .values(
+                birthday=date(1990, date.today().month, date.today().day),
+                birthday_md=birthday_key(date.today()),
+            ),
+        )
+        await db.commit()
+    return user
+
+
+async def main(args) -> None:
+    print(f"{'contacts':>9} {'path':>7} {'rows':>7} {'bytes':>9} {'ms':>8}")
+    for size in args.sizes:
+        user = await prepare(size, args.matching)
+        for label in ("legacy", "sql"):
+            async with AsyncSessionLocal() as db:
+                started = time.perf_counter()
+                if label == "legacy":
+                    transferred, matches = await legacy_upcoming(db, user)
+                else:
+                    transferred = matches = await get_upcoming_birthdays(db, user)
+                elapsed = (time.perf_counter() - started) * 1000
+            assert len(matches) == args.matching, (label, len(matches))
+            print(
+                f"{size:>9} {label:>7} {len(transferred):>7} {payload_bytes(transferred):>9} {elapsed:>8.1f}"
+            )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--matching", type=int, default=25)
+    asyncio.run(main(parser.parse_args()))
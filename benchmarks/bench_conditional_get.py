@@ -0,0 +1,71 @@
+"""Unchanged-poll workload: full GETs vs If-None-Match revalidation.
+
+python -m benchmarks.bench_conditional_get --contacts 5000 --limit 100
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+async def poll(
+    http, url: str, headers: dict, repeat: int, revalidate: bool
+) -> tuple[list[float], int]:
+    samples, transferred, etag = [], 0, None
+    for _ in range(repeat):
+        request_headers = dict(headers)
+        if revalidate and etag:
+            request_headers["If-None-Match"] = etag
+        started = time.perf_counter()
+        response = await http.get(url, headers=request_headers)
+        samples.append(time.perf_counter() - started)
+        assert response.status_code in (200, 304), response.status_code
+        etag = response.headers.get("etag", etag)
+        transferred += len(response.content)
+    return samples, transferred
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("poller@example.com")
+    await seed_contacts(user.id, args.contacts)
+
+    async with client() as http:
+        headers = await login(http, "poller@example.com")
+        for label, url in (
+            ("list", f"/api/contacts/?limit={args.limit}"),
+            ("page", f"/api/contacts/page?limit={min(args.limit, 100)}"),
+            ("single", "/api/contacts/1"),
+        ):
+            print(label)
+            for revalidate in (False, True):
+                samples, transferred = await poll(
+                    http, url, headers, args.repeat, revalidate
+                )
+                mode = "if-none-match" if revalidate else "full"
+                print(
+                    f"  {mode:<13} {transferred / args.repeat:9.0f} B/poll  {summarize(samples)}"
+                )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contacts", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=300)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,84 @@
+"""Throughput and checkout waits under concurrency for several pool sizes,
+plus the cost of SQL echo.
+
+    python -m benchmarks.bench_db_pool --concurrency 64 --pool-sizes 1,5,20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from sqlalchemy.ext.asyncio import async_sessionmaker  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import build_engine, pool_stats  # noqa: E402
+from app.services.contacts import get_contacts_page  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+async def run(bind, user, concurrency: int, requests: int) -> tuple[list[float], float]:
+    sessions = async_sessionmaker(bind=bind, expire_on_commit=False)
+    samples: list[float] = []
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            async with sessions() as db:
+                await get_contacts_page(20, db, user)
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("pool@example.com")
+    await seed_contacts(user.id, 1000)
+
+    for size in (int(value) for value in args.pool_sizes.split(",")):
+        bind = build_engine(settings.database_url, pool_size=size, max_overflow=0)
+        samples, elapsed = await run(bind, user, args.concurrency, args.requests)
+        stats = pool_stats(bind)
+        print(
+            f"pool_size={size:<3} {len(samples) / elapsed:7.0f} req/s  {summarize(samples)}  "
+            f"waits={stats['waits']}/{stats['checkouts']} "
+            f"avg_wait={stats['avg_wait_ms']:.2f}ms max_wait={stats['max_wait_ms']:.1f}ms",
+        )
+        await bind.dispose()
+
+    # echo=True formats and writes every statement and its parameters
+    for echo in (False, True):
+        bind = build_engine(settings.database_url, echo=echo)
+        for handler in logging.getLogger("sqlalchemy.engine.Engine").handlers:
+            handler.setStream(
+                open(os.devnull, "w", encoding="utf-8")
+            )  # pylint: disable=consider-using-with
+        samples, elapsed = await run(bind, user, args.concurrency, args.requests)
+        print(
+            f"echo={echo!s:<5}  {len(samples) / elapsed:7.0f} req/s  {summarize(samples)}"
+        )
+        await bind.dispose()
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--pool-sizes", default="1,5,20")
+    asyncio.run(main(parser.parse_args()))
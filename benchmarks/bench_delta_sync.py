@@ -0,0 +1,86 @@
+"""Delta sync vs full re-download as the address book grows, with a fixed
+number of changes between syncs.
+
+    python -m benchmarks.bench_delta_sync --sizes 1000,10000,50000 --changes 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+URL = "/api/contacts/changes"
+
+
+async def sync(http, headers, since, repeat: int) -> tuple[list[float], int, str]:
+    samples, size, token = [], 0, since
+    params = {"limit": 5000, **({"since": since} if since else {})}
+    for _ in range(repeat):
+        token, page = since, None
+        started = time.perf_counter()
+        size = 0
+        while page is None or page["has_more"]:
+            response = await http.get(
+                URL,
+                params={**params, **({"since": token} if token else {})},
+                headers=headers,
+            )
+            response.raise_for_status()
+            page = response.json()
+            token = page["next_token"]
+            size += len(response.content)
+        samples.append(time.perf_counter() - started)
+    return samples, size, token
+
+
+async def main(args) -> None:
+    async with client() as http:
+        for index, size in enumerate(int(value) for value in args.sizes.split(",")):
+            await create_schema()
+            email = f"sync{index}@example.com"
+            user = await seed_user(email)
+            await seed_contacts(user.id, size)
+            headers = await login(http, email)
+
+            _, _, token = await sync(http, headers, None, 1)
+            for i in range(args.changes):
+                contact_id = 1 + i * (size // args.changes)
+                if i % 4 == 3:
+                    response = await http.delete(
+                        f"/api/contacts/{contact_id}", headers=headers
+                    )
+                else:
+                    response = await http.put(
+                        f"/api/contacts/{contact_id}",
+                        json={"last_name": f"Changed{i}"},
+                        headers=headers,
+                    )
+                response.raise_for_status()
+
+            full, full_bytes, _ = await sync(http, headers, None, args.repeat)
+            delta, delta_bytes, _ = await sync(http, headers, token, args.repeat)
+            print(f"{size} contacts, {args.changes} changes")
+            print(f"  full   {full_bytes:>10} B  {summarize(full)}")
+            print(f"  delta  {delta_bytes:>10} B  {summarize(delta)}")
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--changes", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
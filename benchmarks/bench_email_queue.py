@@ -0,0 +1,73 @@
+"""Signup latency with a slow SMTP relay, and outbox drain throughput.
+
+Signups only write the outbox row, so their latency should not move
+when the relay slows down; delivery happens in the dispatcher over a
+reused connection.
+
+    python -m benchmarks.bench_email_queue --signups 20 --smtp-delay 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+os.environ["MAIL_SERVER"] = "127.0.0.1"
+os.environ["MAIL_STARTTLS"] = "false"
+os.environ["EMAIL_POLL_INTERVAL"] = "0.2"
+
+from app.config import settings  # noqa: E402
+from app.services.email_queue import email_dispatcher  # noqa: E402
+from benchmarks._smtp import StubSMTPServer  # noqa: E402
+from benchmarks._support import client, create_schema, dispose, summarize  # noqa: E402
+
+
+async def run(label: str, signups: int, delay: float) -> None:
+    smtp = await StubSMTPServer(delay).start()
+    settings.mail_port = smtp.port
+    email_dispatcher.start()
+
+    latencies = []
+    async with client() as http:
+        for i in range(signups):
+            started = time.perf_counter()
+            response = await http.post(
+                "/api/auth/signup",
+                json={
+                    "username": f"{label}{i}",
+                    "email": f"{label}{i}@example.com",
+                    "password": "secret123",
+                },
+            )
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 201, response.text
+
+    started = time.perf_counter()
+    while len(smtp.messages) < signups:
+        await asyncio.sleep(0.05)
+    drained = time.perf_counter() - started
+
+    await email_dispatcher.stop()
+    await smtp.stop()
+    print(f"smtp delay {delay:.2f}s: signup {summarize(latencies)}")
+    print(
+        f"{'':>18} drained {signups} mails {drained:.2f}s after last signup over {smtp.connections} connection(s)"
+    )
+
+
+async def main(args) -> None:
+    await create_schema()
+    await run("fast", args.signups, 0.0)
+    await run("slow", args.signups, args.smtp_delay)
+    print(f"dispatcher: {await email_dispatcher.stats()}")
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signups", type=int, default=20)
+    parser.add_argument("--smtp-delay", type=float, default=0.5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,70 @@
+"""Email renders per second: compiled Jinja2 templates vs re-reading the file.
+
+python -m benchmarks.bench_email_templates --renders 20000
+"""
+
+import argparse
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from app.utils.email import (  # noqa: E402
+    TEMPLATE_DIR,
+    preload_templates,
+    render_bulk,
+    render_email,
+    template_env,
+)
+
+
+def legacy_render(link: str) -> str:
+    """The pre-Jinja path: read the file and str.replace on every send."""
+    template = (TEMPLATE_DIR / "verify_email.html").read_text()
+    return template.replace("{{ verification_link }}", link)
+
+
+def rate(label: str, renders: int, call) -> None:
+    started = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - started
+    print(f"{label:>22}: {renders / elapsed:10.0f} renders/s")
+
+
+def main(args) -> None:
+    preload_templates()
+    links = [
+        f"http://localhost:3000/verify-email?token=t{i}" for i in range(args.renders)
+    ]
+    rate(
+        "file read + replace",
+        args.renders,
+        lambda: [legacy_render(link) for link in links],
+    )
+    html = template_env.get_template("verify_email.html")
+    rate(
+        "compiled html",
+        args.renders,
+        lambda: [html.render(verification_link=link) for link in links],
+    )
+    rate(
+        "compiled html+txt",
+        args.renders,
+        lambda: [
+            render_email("verify_email", verification_link=link) for link in links
+        ],
+    )
+    rate(
+        "compiled bulk html+txt",
+        args.renders,
+        lambda: render_bulk(
+            "verify_email", ({"verification_link": link} for link in links)
+        ),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=20000)
+    main(parser.parse_args())
@@ -0,0 +1,94 @@
+"""Streaming export throughput (MB/s) and peak RSS.
+
+Peak RSS is sampled before and after the export; with a server-side
+cursor it should not grow with --rows. The app is driven through raw
+ASGI calls because httpx's ASGITransport buffers whole response bodies.
+
+    python -m benchmarks.bench_export --rows 1000000 --format ndjson
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from app.main import app  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+)
+
+
+def peak_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("exporter@example.com")
+    await seed_contacts(user.id, args.rows)
+
+    async with client() as http:
+        headers = await login(http, "exporter@example.com")
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 1234),
+        "root_path": "",
+        "path": "/api/contacts/export",
+        "raw_path": b"/api/contacts/export",
+        "query_string": f"format={args.format}".encode(),
+        "headers": [(b"authorization", headers["Authorization"].encode())],
+    }
+    size = lines = 0
+
+    requested = False
+
+    async def receive():
+        # one empty request body, then block like a client that stays connected
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal size, lines
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+        elif message["type"] == "http.response.body":
+            size += len(message["body"])
+            lines += message["body"].count(b"\n")
+
+    rss_before = peak_rss_mib()
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{args.format}: {lines:,} lines, {size / 1e6:.1f} MB in {elapsed:.2f}s = {size / 1e6 / elapsed:.1f} MB/s"
+    )
+    print(
+        f"  peak RSS {rss_before:.0f} MiB before export, {peak_rss_mib():.0f} MiB after"
+    )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""Bulk import throughput (rows/s) and peak Python memory while streaming.
+
+The CSV body is generated on the fly and streamed to the endpoint, so
+peak memory should stay flat as --rows grows.
+
+    python -m benchmarks.bench_import --rows 50000 --format csv
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+import orjson  # noqa: E402
+
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_user,
+)
+
+CHUNK_ROWS = 500
+
+
+async def body(rows: int, fmt: str):
+    if fmt == "csv":
+        yield b"first_name,last_name,email,phone,birthday\n"
+    for start in range(0, rows, CHUNK_ROWS):
+        lines = []
+        for i in range(start, min(start + CHUNK_ROWS, rows)):
+            row = {
+                "first_name": f"First{i}",
+                "last_name": f"Last{i}",
+                "email": f"import{i}@example.com",
+                "phone": f"+38{i:09d}",
+                "birthday": f"19{50 + i % 50}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            }
+            if fmt == "csv":
+                lines.append(",".join(row.values()).encode())
+            else:
+                lines.append(orjson.dumps(row))
+        yield b"\n".join(lines) + b"\n"
+
+
+async def main(args) -> None:
+    await create_schema()
+    await seed_user("importer@example.com")
+    content_type = "text/csv" if args.format == "csv" else "application/x-ndjson"
+
+    async with client() as http:
+        headers = await login(http, "importer@example.com")
+        if args.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        response = await http.post(
+            "/api/contacts/import",
+            headers={**headers, "content-type": content_type},
+            content=body(args.rows, args.format),
+            timeout=None,
+        )
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory() if args.trace_memory else (0, 0)
+        tracemalloc.stop()
+
+    result = response.json()
+    print(
+        f"{args.format}: {result['inserted']} inserted, {result['failed']} failed in {elapsed:.2f}s"
+    )
+    print(f"  {args.rows / elapsed:,.0f} rows/s")
+    if args.trace_memory:
+        print(
+            f"  peak traced memory {peak / 1024 / 1024:.1f} MiB (tracing slows the run)"
+        )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+    parser.add_argument("--trace-memory", action="store_true")
+    asyncio.run(main(parser.parse_args()))
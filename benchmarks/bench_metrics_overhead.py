@@ -0,0 +1,141 @@
+"""Instrumentation overhead: the same request mix with METRICS_ENABLED on
+and off (each in a fresh process, rounds interleaved), plus the in-process
+cost of the work the middleware and cursor hooks add to one request.
+
+    python -m benchmarks.bench_metrics_overhead --requests 3000 --rounds 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+from benchmarks._support import bootstrap_env
+
+
+async def child(args) -> None:
+    bootstrap_env()
+    from benchmarks._support import (  # pylint: disable=import-outside-toplevel
+        client,
+        create_schema,
+        dispose,
+        login,
+        seed_contacts,
+        seed_user,
+    )
+
+    await create_schema()
+    user = await seed_user("metrics@example.com")
+    await seed_contacts(user.id, 200)
+    urls = ["/api/contacts/?limit=20", "/api/contacts/7", "/api/contacts/page?limit=20"]
+    async with client() as http:
+        headers = await login(http, "metrics@example.com")
+        for url in urls:  # warm-up
+            await http.get(url, headers=headers)
+        started = time.perf_counter()
+        for i in range(args.requests):
+            response = await http.get(urls[i % len(urls)], headers=headers)
+            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+    await dispose()
+    print(json.dumps({"rps": args.requests / elapsed}))
+
+
+def run_child(enabled: bool, requests: int) -> float:
+    env = {**os.environ, "METRICS_ENABLED": "true" if enabled else "false"}
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_metrics_overhead",
+            "--child",
+            "--requests",
+            str(requests),
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])["rps"]
+
+
+def main(args) -> None:
+    results = {True: [], False: []}
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            results[enabled].append(run_child(enabled, args.requests))
+    off, on = statistics.median(results[False]), statistics.median(results[True])
+    print(f"metrics off: {off:8.0f} req/s  (median of {args.rounds})")
+    print(
+        f"metrics on:  {on:8.0f} req/s  end-to-end difference {(1 - on / off) * 100:+.1f}%"
+    )
+
+    bootstrap_env()
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from app.utils.metrics import (
+        HTTP_REQUEST_DB_SECONDS,
+        HTTP_REQUEST_DB_STATEMENTS,
+        HTTP_REQUEST_SECONDS,
+        HTTP_REQUESTS_IN_FLIGHT,
+        RequestDBStats,
+        _after_cursor_execute,
+        _before_cursor_execute,
+        request_db_stats,
+    )
+
+    route = "/api/contacts/{contact_id}"
+    context = SimpleNamespace()
+
+    def one_request() -> None:
+        # what MetricsMiddleware and the cursor hooks do for a one-statement request
+        stats = RequestDBStats()
+        token = request_db_stats.set(stats)
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        _before_cursor_execute(None, None, "", (), context, False)
+        _after_cursor_execute(None, None, "", (), context, False)
+        HTTP_REQUESTS_IN_FLIGHT.dec()
+        request_db_stats.reset(token)
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started, ("GET", route, "200")
+        )
+        HTTP_REQUEST_DB_STATEMENTS.observe(stats.statements, (route,))
+        HTTP_REQUEST_DB_SECONDS.observe(stats.seconds, (route,))
+
+    number = 50000
+    per_request = min(timeit.repeat(one_request, number=number, repeat=5)) / number
+    per_observe = (
+        min(
+            timeit.repeat(
+                lambda: HTTP_REQUEST_SECONDS.observe(0.004, ("GET", route, "200")),
+                number=number,
+                repeat=5,
+            ),
+        )
+        / number
+    )
+    print(f"Histogram.observe:          {per_observe * 1e9:6.0f} ns")
+    print(
+        f"instrumentation per request: {per_request * 1e6:6.1f} µs "
+        f"= {per_request * off * 100:.2f}% of a {1000 / off:.2f} ms request",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parsed = parser.parse_args()
+    if parsed.child:
+        asyncio.run(child(parsed))
+    else:
+        main(parsed)
@@ -0,0 +1,67 @@
+"""Deep-page latency: OFFSET pagination vs keyset cursors.
+
+python -m benchmarks.bench_pagination --contacts 50000 --page 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.services.contacts import get_contacts, get_contacts_page  # noqa: E402
+from app.utils.cursor import encode_cursor  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+async def timed(repeat: int, call) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            await call(db)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def main(args) -> None:
+    await create_schema()
+    # Noise: other users' rows interleave with the measured user's rows
+    other = await seed_user("other@example.com")
+    user = await seed_user("reader@example.com")
+    await seed_contacts(other.id, args.contacts)
+    await seed_contacts(user.id, args.contacts)
+
+    skip = (args.page - 1) * args.limit
+    async with AsyncSessionLocal() as db:
+        previous = await get_contacts(skip - 1, 1, db, user)
+    cursor = encode_cursor({"s": "id", "id": previous[0].id})
+
+    offset = await timed(
+        args.repeat, lambda db: get_contacts(skip, args.limit, db, user)
+    )
+    keyset = await timed(
+        args.repeat, lambda db: get_contacts_page(args.limit, db, user, cursor)
+    )
+    print(f"page {args.page} (limit {args.limit}, {args.contacts} contacts)")
+    print(f"  offset: {summarize(offset)}")
+    print(f"  keyset: {summarize(keyset)}")
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contacts", type=int, default=50000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,93 @@
+"""p99 of GET /api/contacts/ while /api/auth/login is saturated.
+
+Runs the same workload twice: bcrypt inline on the event loop (the old
+behaviour) and through the bounded password-hashing pool.
+
+    python -m benchmarks.bench_password_pool --seconds 5 --login-clients 16
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from app.config import settings  # noqa: E402
+from app.services import auth  # noqa: E402
+from app.services.hashing import PasswordHasher  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    BENCH_PASSWORD,
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+def build_hasher(workers: int) -> PasswordHasher:
+    # a fresh hasher per run: the pool and its slot semaphore are sized on construction
+    return PasswordHasher(
+        max_workers=workers,
+        max_queue=settings.password_hash_queue_size,
+        queue_timeout=settings.password_hash_timeout,
+        executor=settings.password_hash_executor,
+    )
+
+
+async def run(seconds: float, login_clients: int) -> list[float]:
+    deadline = time.perf_counter() + seconds
+    latencies: list[float] = []
+
+    async with client() as http:
+        headers = await login(http, "reader@example.com")
+
+        async def hammer_login():
+            while time.perf_counter() < deadline:
+                await http.post(
+                    "/api/auth/login",
+                    json={"email": "login@example.com", "password": BENCH_PASSWORD},
+                )
+
+        async def read_contacts():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await http.get("/api/contacts/", headers=headers)
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            read_contacts(), *(hammer_login() for _ in range(login_clients))
+        )
+    return latencies
+
+
+async def main(args) -> None:
+    await create_schema()
+    reader = await seed_user("reader@example.com")
+    await seed_user("login@example.com")
+    await seed_contacts(reader.id, 100)
+
+    for label, workers in (("inline", 0), ("pool", args.workers)):
+        # the login path resolves the hasher through app.services.auth
+        auth.password_hasher = hasher = build_hasher(workers)
+        try:
+            latencies = await run(args.seconds, args.login_clients)
+        finally:
+            hasher.shutdown()
+        print(f"{label:>6} GET /api/contacts/ {summarize(latencies)}")
+        print(f"{'':>6} hashing {hasher.stats()}")
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--login-clients", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,63 @@
+"""Authenticated request throughput with the principal cache on and off.
+
+python -m benchmarks.bench_principal_cache --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from app.services.auth import principal_cache  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+async def run(
+    http, headers: dict, requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await http.get("/api/contacts/", headers=headers)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started), latencies
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("reader@example.com")
+    await seed_contacts(user.id, 10)
+
+    async with client() as http:
+        headers = await login(http, "reader@example.com")
+        for label, enabled in (("off", False), ("on", True)):
+            principal_cache.enabled = enabled
+            rps, latencies = await run(http, headers, args.requests, args.concurrency)
+            print(f"cache {label:>3}: {rps:8.1f} req/s  {summarize(latencies)}")
+        print(f"counters: {principal_cache.stats()}")
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
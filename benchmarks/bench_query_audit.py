@@ -0,0 +1,151 @@
+"""Statements per endpoint, checked against a budget (a CI smoke test for
+N+1 regressions), plus what the detector reports for a per-row query loop.
+
+    python -m benchmarks.bench_query_audit
+    python -m benchmarks.bench_query_audit --database-url postgresql+asyncpg://localhost/contacts_bench
+
+Exits non-zero when an endpoint goes over its budget.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from benchmarks._support import bootstrap_env
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    "--database-url", default=None, help="defaults to a throwaway SQLite file"
+)
+parser.add_argument("--contacts", type=int, default=200)
+ARGS = parser.parse_args()
+if ARGS.contacts < 5:
+    parser.error("--contacts must be at least 5")
+bootstrap_env(ARGS.database_url)
+
+from sqlalchemy import select  # noqa: E402
+
+from app.database import AsyncSessionLocal, engine, read_engine  # noqa: E402
+from app.models.contact import Contact  # noqa: E402
+from app.services.contacts import get_contact_by_id  # noqa: E402
+from app.utils.query_audit import audit_engine, audit_queries  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+)
+
+
+def endpoints(
+    get_id: int,
+    put_id: int,
+    delete_id: int,
+    patched: list[int],
+    deleted: list[int],
+) -> list[tuple[str, str, dict | None, int]]:
+    """(method, url, json body, statement budget) per endpoint.
+
+    The principal cache and the search index are warm, so authentication and
+    index builds cost no query.
+    """
+    return [
+        ("GET", "/api/contacts/?limit=50", None, 1),
+        ("GET", "/api/contacts/page?limit=50", None, 1),
+        ("GET", f"/api/contacts/{get_id}", None, 1),
+        ("GET", "/api/contacts/search?q=First1", None, 1),
+        ("GET", "/api/contacts/upcoming/birthdays", None, 1),
+        ("GET", "/api/contacts/changes", None, 2),
+        (
+            "POST",
+            "/api/contacts/",
+            {
+                "first_name": "Audit",
+                "last_name": "Probe",
+                "email": "audit.probe@example.com",
+                "phone": "+19995550100",
+                "birthday": "1990-05-01",
+            },
+            2,
+        ),
+        ("PUT", f"/api/contacts/{put_id}", {"first_name": "Renamed"}, 2),
+        (
+            "PATCH",
+            "/api/contacts/batch",
+            {
+                "items": [
+                    {"id": i, "changes": {"last_name": f"Batch{i}"}} for i in patched
+                ]
+            },
+            4,  # 3 where executemany reports rowcounts; asyncpg needs a confirming SELECT
+        ),
+        ("DELETE", f"/api/contacts/{delete_id}", None, 3),
+        ("POST", "/api/contacts/batch/delete", {"ids": deleted}, 3),
+    ]
+
+
+async def seeded_ids(user_id: int) -> list[int]:
+    async with AsyncSessionLocal() as session:
+        return list(
+            await session.scalars(
+                select(Contact.id)
+                .where(Contact.user_id == user_id)
+                .order_by(Contact.id)
+            )
+        )
+
+
+async def main() -> int:
+    try:
+        return await run_audit(ARGS.contacts)
+    finally:
+        await dispose()
+
+
+async def run_audit(contacts: int) -> int:
+    await create_schema()
+    user = await seed_user("audit@example.com")
+    await seed_contacts(user.id, contacts)
+    # each seeded id is written or deleted by one endpoint only
+    get_id, put_id, delete_id, *rest = await seeded_ids(user.id)
+    size = min(20, len(rest) // 2)
+    patched, deleted = rest[:size], rest[size : 2 * size]
+    audit_engine(engine)
+    audit_engine(read_engine)
+
+    failures = 0
+    async with client() as http:
+        headers = await login(http, "audit@example.com")
+        await http.get(
+            "/api/contacts/search?q=warm", headers=headers
+        )  # principal cache, search index
+
+        print(f"{'endpoint':<42} {'status':>6} {'statements':>10} {'budget':>6}")
+        for method, url, body, budget in endpoints(
+            get_id, put_id, delete_id, patched, deleted
+        ):
+            with audit_queries(max_statements=budget, max_repeats=2) as audit:
+                response = await http.request(method, url, json=body, headers=headers)
+            over = bool(audit.violations) or response.status_code >= 400
+            failures += over
+            print(
+                f"{method + ' ' + url[:36]:<42} {response.status_code:>6} {audit.count:>10} {budget:>6}"
+            )
+            if over:
+                print(audit.report())
+
+    # what an N+1 looks like: one query per contact instead of one for the list
+    lookups = [get_id, put_id, *patched][:10]
+    print(f"\nper-row lookup loop ({len(lookups)} contacts):")
+    async with AsyncSessionLocal() as session:
+        with audit_queries(max_repeats=2) as audit:
+            for contact_id in lookups:
+                await get_contact_by_id(contact_id, session, user)
+    print(audit.report())
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,79 @@
+"""Rate limiter overhead per request.
+
+Times the raw algorithms against the in-memory store over many keys,
+then GET /api/contacts/ end to end with the per-user limiter on and off.
+
+    python -m benchmarks.bench_rate_limit --ops 200000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+os.environ["RATE_LIMIT_API_BURST"] = "1000000000"
+
+from app.config import settings  # noqa: E402
+from app.services.rate_limit import (  # noqa: E402
+    InMemoryCounterStore,
+    sliding_window,
+    token_bucket,
+)
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+)
+
+
+async def algorithm_cost(ops: int, keys: int) -> None:
+    for name, algorithm in (
+        ("token_bucket", token_bucket),
+        ("sliding_window", sliding_window),
+    ):
+        store = InMemoryCounterStore()
+        started = time.perf_counter()
+        for i in range(ops):
+            await algorithm(store, f"k{i % keys}", 100, 1.0, time.time())
+        elapsed = time.perf_counter() - started
+        print(
+            f"{name:>15}: {elapsed / ops * 1e6:6.2f} µs/decision over {keys} keys, {len(store)} live keys"
+        )
+
+
+async def endpoint_cost(requests: int) -> None:
+    await create_schema()
+    user = await seed_user("reader@example.com")
+    await seed_contacts(user.id, 10)
+    async with client() as http:
+        headers = await login(http, "reader@example.com")
+        for enabled in (False, True, False, True):
+            settings.rate_limit_enabled = enabled
+            started = time.perf_counter()
+            for _ in range(requests):
+                response = await http.get("/api/contacts/", headers=headers)
+                assert response.status_code == 200, response.text
+            elapsed = time.perf_counter() - started
+            print(
+                f"limiter {'on ' if enabled else 'off'}: {elapsed / requests * 1e3:.3f} ms/request"
+            )
+    await dispose()
+
+
+async def main(args) -> None:
+    await algorithm_cost(args.ops, args.keys)
+    await endpoint_cost(args.requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=200000)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,156 @@
+"""Allocations and CPU per list request: entity queries + response_model
+validation (the previous read path, reproduced here) vs column rows +
+lean orjson encoding.
+
+    python -m benchmarks.bench_read_allocations --contacts 20000 --limit 500
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from fastapi.responses import ORJSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.models.contact import Contact, birthday_key  # noqa: E402
+from app.schemas.contact import ContactRead  # noqa: E402
+from app.services import search  # noqa: E402
+from app.services.contacts import (  # noqa: E402
+    get_contacts,
+    get_upcoming_birthdays,
+    search_contacts,
+)
+from app.utils.serializers import contact_rows_response  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+)
+
+CONTACT_LIST = TypeAdapter(list[ContactRead])
+
+
+# ─── previous read path ─── #
+
+
+async def legacy_list(db, user, limit):
+    query = (
+        select(Contact)
+        .where(Contact.user_id == user.id)
+        .order_by(Contact.id)
+        .limit(limit)
+    )
+    return (await db.scalars(query)).all()
+
+
+async def legacy_search(db, user, limit):
+    ids = (await search._get_index(db, user)).search(
+        "first1", limit
+    )  # pylint: disable=protected-access
+    found = (await db.scalars(select(Contact).where(Contact.id.in_(ids)))).all()
+    by_id = {contact.id: contact for contact in found}
+    return [by_id[contact_id] for contact_id in ids]
+
+
+async def legacy_birthdays(db, user, days):
+    keys = [
+        birthday_key(date.today() + timedelta(days=offset))
+        for offset in range(days + 1)
+    ]
+    query = select(Contact).where(
+        Contact.user_id == user.id, Contact.birthday_md.in_(keys)
+    )
+    return (await db.scalars(query)).all()
+
+
+def legacy_body(contacts) -> bytes:
+    validated = CONTACT_LIST.validate_python(contacts, from_attributes=True)
+    return ORJSONResponse(CONTACT_LIST.dump_python(validated, mode="json")).body
+
+
+def lean_body(rows) -> bytes:
+    return contact_rows_response(rows).body
+
+
+# ─── measurement ─── #
+
+
+async def request(load, serialize) -> int:
+    async with AsyncSessionLocal() as db:
+        data = await load(db)
+        return len(serialize(data))
+
+
+async def allocations(load, serialize) -> tuple[int, int]:
+    """(blocks allocated and kept while loading, peak bytes over the request)."""
+    async with AsyncSessionLocal() as db:
+        await db.connection()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        data = await load(db)
+        after = tracemalloc.take_snapshot()
+        serialize(data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks, peak
+
+
+async def cpu(load, serialize, repeat: int) -> float:
+    started = time.process_time()
+    for _ in range(repeat):
+        await request(load, serialize)
+    return (time.process_time() - started) / repeat
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("reader@example.com")
+    await seed_contacts(user.id, args.contacts)
+
+    cases = {
+        "list": (
+            lambda db: legacy_list(db, user, args.limit),
+            lambda db: get_contacts(0, args.limit, db, user),
+        ),
+        "search": (
+            lambda db: legacy_search(db, user, 100),
+            lambda db: search_contacts("first1", db, user, 100),
+        ),
+        "birthdays": (
+            lambda db: legacy_birthdays(db, user, 30),
+            lambda db: get_upcoming_birthdays(db, user, 30),
+        ),
+    }
+    print(
+        f"{'endpoint':<10} {'path':<8} {'bytes':>8} {'blocks':>8} {'peak KiB':>9} {'cpu ms':>8}"
+    )
+    for name, (legacy, lean) in cases.items():
+        for label, load, serialize in (
+            ("entity", legacy, legacy_body),
+            ("rows", lean, lean_body),
+        ):
+            size = await request(load, serialize)  # warm caches / search index
+            blocks, peak = await allocations(load, serialize)
+            cpu_ms = await cpu(load, serialize, args.repeat) * 1000
+            print(
+                f"{name:<10} {label:<8} {size:>8} {blocks:>8} {peak / 1024:>9.0f} {cpu_ms:>8.2f}"
+            )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contacts", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=30)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,162 @@
+"""Token renewal by password login (bcrypt) versus refresh-token rotation.
+
+Measures CPU (process time, including the bcrypt threads) and latency per
+renewal both ways, projects the login CPU saved for a session mix (clients
+renew once per access-token lifetime), then checks the hot-path cost of the
+revocation filter and its false-positive rate.
+
+    python -m benchmarks.bench_refresh_tokens --renewals 200 --sessions 5000 --hours 8 --revoked 20000
+"""
+
+import argparse
+import asyncio
+import os
+import secrets
+import time
+from datetime import datetime
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+# thread pool: bcrypt CPU shows up in this process's process_time()
+os.environ.setdefault("PASSWORD_HASH_EXECUTOR", "thread")
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.models.session import AuthSession  # noqa: E402
+from app.services.sessions import revocation_filter  # noqa: E402
+from app.utils.bloom import BloomFilter  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    BENCH_PASSWORD,
+    client,
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+async def timed(count: int, op) -> tuple[float, list[float]]:
+    """Run ``op`` ``count`` times; returns (CPU seconds per op, latencies)."""
+    latencies = []
+    cpu = time.process_time()
+    for _ in range(count):
+        started = time.perf_counter()
+        await op()
+        latencies.append(time.perf_counter() - started)
+    return (time.process_time() - cpu) / count, latencies
+
+
+async def seed_revocations(user_id: int, count: int) -> None:
+    now = datetime.utcnow()
+    rows = [
+        {"id": secrets.token_hex(16), "user_id": user_id, "revoked_at": now}
+        for _ in range(count)
+    ]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(AuthSession), rows)
+        await db.commit()
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("refresh@example.com")
+    await seed_contacts(user.id, 10)
+    credentials = {"email": "refresh@example.com", "password": BENCH_PASSWORD}
+
+    async with client() as http:
+        # ── renewals ──
+        async def login():
+            response = await http.post("/api/auth/login", json=credentials)
+            assert response.status_code == 200, response.text
+
+        tokens = (await http.post("/api/auth/login", json=credentials)).json()
+
+        async def refresh():
+            nonlocal tokens
+            response = await http.post(
+                "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+            )
+            assert response.status_code == 200, response.text
+            tokens = response.json()
+
+        login_cpu, login_lat = await timed(args.renewals, login)
+        refresh_cpu, refresh_lat = await timed(args.renewals, refresh)
+        print(f"login   {login_cpu * 1000:7.2f} ms CPU/renewal  {summarize(login_lat)}")
+        print(
+            f"refresh {refresh_cpu * 1000:7.2f} ms CPU/renewal  {summarize(refresh_lat)}"
+        )
+
+        # ── session mix ──
+        per_session = max(1, int(args.hours * 60 / settings.token_expire_minutes))
+        renewals = args.sessions * per_session
+        without = renewals * login_cpu
+        with_refresh = (
+            args.sessions * login_cpu + (renewals - args.sessions) * refresh_cpu
+        )
+        print(
+            f"\n{args.sessions} sessions x {args.hours:g} h, access tokens of "
+            f"{settings.token_expire_minutes} min: {renewals} renewals"
+        )
+        print(
+            f"  password logins only  {without:8.1f} CPU s ({renewals} bcrypt verifies)"
+        )
+        print(
+            f"  login + refresh       {with_refresh:8.1f} CPU s ({args.sessions} bcrypt verifies)"
+        )
+        print(
+            f"  saved                 {without - with_refresh:8.1f} CPU s ({1 - with_refresh / without:.1%})"
+        )
+
+        # ── hot path: revocation check per authenticated request ──
+        await seed_revocations(user.id, args.revoked)
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        async def read():
+            response = await http.get("/api/contacts/1", headers=headers)
+            assert response.status_code == 200, response.text
+
+        print(
+            f"\nGET /api/contacts/1 with {args.revoked} revoked sessions in the window"
+        )
+        for label, synced in (("filter", True), ("query every request", False)):
+            if synced:
+                async with AsyncSessionLocal() as db:
+                    await revocation_filter.sync(db)
+            else:
+                revocation_filter._synced_at = None  # never synced: every check queries
+            before = revocation_filter.stats()["queries"]
+            _, latencies = await timed(args.requests, read)
+            queries = revocation_filter.stats()["queries"] - before
+            rps = len(latencies) / sum(latencies)
+            print(
+                f"  {label:20} {rps:6.0f} req/s  {queries / args.requests:.2f} queries/request  {summarize(latencies)}"
+            )
+
+    # ── false positives at capacity ──
+    bloom = BloomFilter(
+        settings.revocation_filter_capacity, settings.revocation_filter_error_rate
+    )
+    for _ in range(bloom.capacity):
+        bloom.add(secrets.token_hex(16))
+    probes = 200_000
+    false_positives = sum(secrets.token_hex(16) in bloom for _ in range(probes))
+    print(
+        f"\nBloom filter at capacity ({bloom.capacity} ids, {bloom.bits / 8 / 1024:.0f} KiB, "
+        f"{bloom.hashes} hashes): {false_positives / probes:.3%} false positives "
+        f"(target {bloom.error_rate:.3%})"
+    )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renewals", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--revoked", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
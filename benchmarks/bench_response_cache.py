@@ -0,0 +1,114 @@
+"""Contact reads with the per-user response cache on and off.
+
+Several users read their lists, single contacts and upcoming birthdays; a
+fraction of requests are updates, which invalidate that user's entries.
+
+    python -m benchmarks.bench_response_cache --users 10 --contacts 1000 --requests 4000 --write-ratio 0.02
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from app.services.response_cache import response_cache  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    client,
+    create_schema,
+    dispose,
+    login,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+
+async def run(
+    http, sessions, args, seed: int
+) -> tuple[float, list[float], list[float]]:
+    rng = random.Random(seed)
+    steps = [(rng.choice(sessions), rng.random()) for _ in range(args.requests)]
+    remaining = iter(steps)
+    reads: list[float] = []
+    writes: list[float] = []
+
+    async def worker():
+        for (headers, first_id), draw in remaining:
+            started = time.perf_counter()
+            contact_id = (
+                first_id + int(draw * 1_000_003) % 20
+            )  # a small hot set per user
+            if draw < args.write_ratio:
+                response = await http.put(
+                    f"/api/contacts/{contact_id}",
+                    json={"last_name": f"Edited{int(draw * 1e9)}"},
+                    headers=headers,
+                )
+                writes.append(time.perf_counter() - started)
+            else:
+                kind = int(draw * 1000) % 3
+                if kind == 0:
+                    response = await http.get(
+                        "/api/contacts/", params={"limit": 50}, headers=headers
+                    )
+                elif kind == 1:
+                    response = await http.get(
+                        f"/api/contacts/{contact_id}", headers=headers
+                    )
+                else:
+                    response = await http.get(
+                        "/api/contacts/upcoming/birthdays", headers=headers
+                    )
+                reads.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return args.requests / (time.perf_counter() - started), reads, writes
+
+
+async def main(args) -> None:
+    await create_schema()
+    async with client() as http:
+        sessions = []
+        for i in range(args.users):
+            user = await seed_user(f"cache{i}@example.com")
+            await seed_contacts(user.id, args.contacts)
+            sessions.append(
+                (await login(http, f"cache{i}@example.com"), i * args.contacts + 1)
+            )
+
+        for enabled in (False, True):
+            response_cache.enabled = response_cache.bodies.enabled = enabled
+            before = response_cache.stats()
+            rps, reads, writes = await run(http, sessions, args, seed=7)
+            after = response_cache.stats()
+            print(f"response cache {'on ' if enabled else 'off'}: {rps:7.0f} req/s")
+            print(f"  reads  {summarize(reads)}")
+            print(f"  writes {summarize(writes)}")
+            if enabled:
+                hits = (
+                    after["local_hits"]
+                    + after["shared_hits"]
+                    - before["local_hits"]
+                    - before["shared_hits"]
+                )
+                lookups = hits + after["misses"] - before["misses"]
+                print(
+                    f"  hit ratio {hits / lookups:.1%} ({hits}/{lookups}), invalidations {after['invalidations']}"
+                )
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--contacts", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--write-ratio", type=float, default=0.02)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+"""Contact search: indexed engine vs the unindexed ILIKE path.
+
+On SQLite this exercises the in-process n-gram index; point
+DATABASE_URL at PostgreSQL (``--database-url``) to measure pg_trgm.
+
+    python -m benchmarks.bench_search --contacts 100000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from benchmarks._support import bootstrap_env
+
+
+def _database_url() -> str | None:
+    if "--database-url" in sys.argv:
+        return sys.argv[sys.argv.index("--database-url") + 1]
+    return None
+
+
+bootstrap_env(_database_url())
+
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.services.contacts import search_contacts, search_contacts_ilike  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+QUERIES = ["first4242", "last9", "u2c1234", "last77777", "1000002", "nomatch"]
+
+
+async def timed(repeat: int, call) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            async with AsyncSessionLocal() as db:
+                started = time.perf_counter()
+                await call(query, db)
+                samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def main(args) -> None:
+    await create_schema()
+    await seed_user("other@example.com")
+    user = await seed_user("reader@example.com")
+    await seed_contacts(user.id, args.contacts)
+
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        await search_contacts("warmup", db, user)
+        print(f"index warm-up: {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    ilike = await timed(args.repeat, lambda q, db: search_contacts_ilike(q, db, user))
+    indexed = await timed(
+        args.repeat, lambda q, db: search_contacts(q, db, user, args.limit)
+    )
+    print(f"{args.contacts} contacts, queries={QUERIES}")
+    print(f"  ilike:   {summarize(ilike)}")
+    print(f"  indexed: {summarize(indexed)}")
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contacts", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--database-url", default=None)
+    asyncio.run(main(parser.parse_args()))
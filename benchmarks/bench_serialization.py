@@ -0,0 +1,96 @@
+"""Load + serialize a 10k-contact list on the previous path (ORM objects
+validated into List[ContactRead], stdlib json) and the lean path (column
+rows mapped straight to orjson).
+
+    python -m benchmarks.bench_serialization --contacts 10000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.models.contact import Contact  # noqa: E402
+from app.schemas.contact import ContactRead  # noqa: E402
+from app.services.contacts import get_contacts  # noqa: E402
+from app.utils.serializers import contact_rows_response  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_contacts,
+    seed_user,
+    summarize,
+)
+
+CONTACT_LIST = TypeAdapter(list[ContactRead])
+
+
+def pydantic_body(contacts, response_class) -> bytes:
+    # what FastAPI does for response_model=List[ContactRead]
+    validated = CONTACT_LIST.validate_python(contacts, from_attributes=True)
+    return response_class(CONTACT_LIST.dump_python(validated, mode="json")).body
+
+
+async def measure(repeat: int, load, serialize) -> tuple[list[float], list[float], int]:
+    load_samples, dump_samples, size = [], [], 0
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            data = await load(db)
+            loaded = time.perf_counter()
+            body = serialize(data)
+            dump_samples.append(time.perf_counter() - loaded)
+            load_samples.append(loaded - started)
+            size = len(body)
+    return load_samples, dump_samples, size
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("serialize@example.com")
+    await seed_contacts(user.id, args.contacts)
+
+    async def orm(db):
+        # the previous get_contacts: full entities
+        query = select(Contact).where(Contact.user_id == user.id).order_by(Contact.id)
+        return (await db.scalars(query.limit(args.contacts))).all()
+
+    def rows(db):
+        return get_contacts(0, args.contacts, db, user)
+
+    variants = (
+        ("orm + pydantic + json", orm, lambda data: pydantic_body(data, JSONResponse)),
+        (
+            "orm + pydantic + orjson",
+            orm,
+            lambda data: pydantic_body(data, ORJSONResponse),
+        ),
+        ("rows + lean + orjson", rows, lambda data: contact_rows_response(data).body),
+    )
+    reference = None
+    for label, load, serialize in variants:
+        load_samples, dump_samples, size = await measure(args.repeat, load, serialize)
+        print(f"{label}  ({size} B)")
+        print(f"  load       {summarize(load_samples)}")
+        print(f"  serialize  {summarize(dump_samples)}")
+        async with AsyncSessionLocal() as db:
+            decoded = json.loads(serialize(await load(db)))
+        assert reference is None or decoded == reference, "payloads differ"
+        reference = decoded
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
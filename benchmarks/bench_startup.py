@@ -0,0 +1,188 @@
+"""Cold start: import time, startup phases and time to the first response,
+each measured in a fresh interpreter.
+
+Configurations:
+  before   – Pillow imported with the app, create_all, no pool warm-up
+  default  – create_all, pool warm-up
+  alembic  – one alembic_version query instead of create_all, heads read
+             from the migration scripts (imports alembic)
+  pinned   – the same check against DB_SCHEMA_REVISION (no alembic import)
+
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --database-url postgresql+asyncpg://localhost/contacts_bench
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+STARTED = time.perf_counter()
+
+CONFIGS = {
+    "before": {
+        "DB_SCHEMA_STARTUP": "create_all",
+        "DB_POOL_WARMUP": "0",
+        "BENCH_PREIMPORT_PIL": "1",
+    },
+    "default": {"DB_SCHEMA_STARTUP": "create_all"},
+    "alembic": {"DB_SCHEMA_STARTUP": "alembic"},
+    "pinned": {"DB_SCHEMA_STARTUP": "alembic", "DB_SCHEMA_REVISION": "0001_initial"},
+}
+REVISION = CONFIGS["pinned"]["DB_SCHEMA_REVISION"]
+
+
+async def child() -> None:
+    """Runs in the fresh interpreter: import, start up, serve one request."""
+    if os.environ.get("BENCH_PREIMPORT_PIL"):
+        import PIL.Image  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+    import httpx  # pylint: disable=import-outside-toplevel
+
+    from app.main import app  # pylint: disable=import-outside-toplevel
+    from app.services.auth import (  # pylint: disable=import-outside-toplevel
+        create_access_token,
+    )
+    from app.utils.startup import (  # pylint: disable=import-outside-toplevel
+        startup_timings,
+    )
+
+    imported = time.perf_counter()
+    await app.router.startup()
+    started_up = time.perf_counter()
+
+    headers = {
+        "Authorization": f"Bearer {create_access_token({'sub': 'startup@example.com'})}"
+    }
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as http:
+        response = await http.get("/api/contacts/?limit=20", headers=headers)
+        response.raise_for_status()
+    answered = time.perf_counter()
+    await app.router.shutdown()
+
+    from benchmarks._support import dispose  # pylint: disable=import-outside-toplevel
+
+    await dispose()
+    print(
+        json.dumps(
+            {
+                "import_ms": (imported - STARTED) * 1000,
+                "startup_ms": (started_up - imported) * 1000,
+                "first_request_ms": (answered - started_up) * 1000,
+                "to_first_response_ms": (answered - STARTED) * 1000,
+                "phases_ms": startup_timings.stats()["phases_ms"],
+            },
+        ),
+    )
+
+
+def write_alembic_env(root: str) -> str:
+    """A one-revision migration tree; only its head is read at startup."""
+    versions = os.path.join(root, "versions")
+    os.makedirs(versions)
+    with open(
+        os.path.join(versions, f"{REVISION}.py"), "w", encoding="utf-8"
+    ) as handle:
+        handle.write(f'revision = "{REVISION}"\ndown_revision = None\n')
+    config = os.path.join(root, "alembic.ini")
+    with open(config, "w", encoding="utf-8") as handle:
+        handle.write(f"[alembic]\nscript_location = {root}\n")
+    return config
+
+
+async def prepare() -> None:
+    from sqlalchemy import text  # pylint: disable=import-outside-toplevel
+
+    from app.database import engine  # pylint: disable=import-outside-toplevel
+    from benchmarks._support import (  # pylint: disable=import-outside-toplevel
+        create_schema,
+        dispose,
+        seed_contacts,
+        seed_user,
+    )
+
+    await create_schema()
+    user = await seed_user("startup@example.com")
+    await seed_contacts(user.id, 200)
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL)"
+            )
+        )
+        await conn.execute(text("DELETE FROM alembic_version"))
+        await conn.execute(
+            text("INSERT INTO alembic_version (version_num) VALUES (:rev)"),
+            {"rev": REVISION},
+        )
+    await dispose()
+
+
+def main(args) -> None:
+    from benchmarks._support import (  # pylint: disable=import-outside-toplevel
+        bootstrap_env,
+    )
+
+    bootstrap_env(args.database_url)
+    asyncio.run(prepare())
+    alembic_config = write_alembic_env(tempfile.mkdtemp(prefix="contacts-alembic-"))
+
+    results = {name: [] for name in CONFIGS}
+    for _ in range(args.runs):
+        # interleaved, so drift on the machine hits every configuration alike
+        for name, overrides in CONFIGS.items():
+            env = {
+                **os.environ,
+                "ALEMBIC_CONFIG": alembic_config,
+                "EMAIL_DISPATCH_ENABLED": "false",
+                **overrides,
+            }
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            results[name].append(json.loads(output.strip().splitlines()[-1]))
+
+    columns = ("import_ms", "startup_ms", "first_request_ms", "to_first_response_ms")
+    print(f"median of {args.runs} cold starts (ms)")
+    print(f"{'config':<9}" + "".join(f"{column[:-3]:>20}" for column in columns))
+    for name, runs in results.items():
+        print(
+            f"{name:<9}"
+            + "".join(
+                f"{statistics.median(r[column] for r in runs):>20.1f}"
+                for column in columns
+            )
+        )
+    for name, runs in results.items():
+        phases = runs[0]["phases_ms"]
+        breakdown = ", ".join(
+            f"{phase} {statistics.median(r['phases_ms'][phase] for r in runs):.1f}"
+            for phase in phases
+        )
+        print(f"  {name}: {breakdown}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--database-url", default=None, help="defaults to a throwaway SQLite file"
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parsed = parser.parse_args()
+    if parsed.child:
+        asyncio.run(child())
+    else:
+        main(parsed)
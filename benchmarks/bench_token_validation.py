@@ -0,0 +1,93 @@
+"""Access token validations per second: the old per-call jwt.decode with a
+raw key, the same with a pre-built key object, and the verified-claims
+cache, for HS256 and the asymmetric algorithms.
+
+    python -m benchmarks.bench_token_validation --seconds 1
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, rsa  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from app.utils.tokens import TokenCodec  # noqa: E402
+
+SECRET = "bench-secret-key"
+
+
+def pem_pair(private_key) -> tuple[str, str]:
+    private = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        .decode()
+    )
+    return private, public
+
+
+def rate(fn, seconds: float) -> float:
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        calls += 100
+    return calls / (time.perf_counter() - started)
+
+
+def main(args) -> None:
+    keys = {
+        "HS256": (SECRET, SECRET),
+        "RS256": pem_pair(
+            rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        ),
+        "ES256": pem_pair(ec.generate_private_key(ec.SECP256R1())),
+    }
+    claims = {
+        "sub": "bench@example.com",
+        "exp": datetime.utcnow() + timedelta(minutes=30),
+    }
+
+    print(
+        f"{'alg':<6} {'jwt.decode(raw key)':>20} {'key object':>12} {'cached':>12}  validations/s"
+    )
+    for alg, (private, public) in keys.items():
+        if alg == "HS256":
+            uncached = TokenCodec(alg, secret=SECRET, cache_enabled=False)
+            cached = TokenCodec(alg, secret=SECRET)
+        else:
+            uncached = TokenCodec(
+                alg, private_key=private, public_key=public, cache_enabled=False
+            )
+            cached = TokenCodec(alg, private_key=private, public_key=public)
+        token = uncached.encode(claims)
+        assert cached.decode(token)["sub"] == claims["sub"]
+
+        legacy = rate(lambda: jwt.decode(token, public, algorithms=[alg]), args.seconds)
+        prepared = rate(lambda: uncached.decode(token), args.seconds)
+        hit = rate(lambda: cached.decode(token), args.seconds)
+        print(
+            f"{alg:<6} {legacy:>20,.0f} {prepared:>12,.0f} {hit:>12,.0f}  ({hit / legacy:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--seconds", type=float, default=1.0, help="time per measurement"
+    )
+    main(parser.parse_args())
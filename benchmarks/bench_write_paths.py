@@ -0,0 +1,143 @@
+"""Statements and latency per contact / user write: commit+refresh ORM
+flow (the previous implementation, reproduced here) vs single-statement
+RETURNING writes.
+
+    python -m benchmarks.bench_write_paths --repeat 300
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date
+
+from benchmarks._support import bootstrap_env
+
+bootstrap_env()
+
+from sqlalchemy import event, select  # noqa: E402
+
+from app.database import AsyncSessionLocal, engine  # noqa: E402
+from app.models.contact import Contact  # noqa: E402
+from app.schemas.contact import ContactCreate, ContactUpdate  # noqa: E402
+from app.schemas.user import AvatarUpdate  # noqa: E402
+from app.services import contacts, users  # noqa: E402
+from benchmarks._support import (  # noqa: E402
+    create_schema,
+    dispose,
+    seed_user,
+    summarize,
+)
+
+statements = 0
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count(*_args) -> None:
+    global statements  # pylint: disable=global-statement
+    statements += 1
+
+
+# ─── previous implementations ─── #
+
+
+async def legacy_create(data, db, user):
+    contact = Contact(**data.model_dump(), user_id=user.id)
+    db.add(contact)
+    await db.commit()
+    await db.refresh(contact)
+    return contact
+
+
+async def legacy_update(contact_id, data, db, user):
+    contact = await contacts.get_contact_by_id(contact_id, db, user)
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(contact, field, value)
+    await db.commit()
+    await db.refresh(contact)
+    return contact
+
+
+async def legacy_delete(contact_id, db, user):
+    contact = await contacts.get_contact_by_id(contact_id, db, user)
+    await db.delete(contact)
+    await db.commit()
+
+
+async def legacy_avatar(data, db, user):
+    user = await db.get(type(user), user.id)
+    user.avatar = data.avatar_url
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+IMPLEMENTATIONS = {
+    "refresh": (legacy_create, legacy_update, legacy_delete, legacy_avatar),
+    "returning": (
+        contacts.create_contact,
+        contacts.update_contact,
+        contacts.delete_contact,
+        users.update_avatar,
+    ),
+}
+
+
+async def measure(call) -> tuple[list[float], int]:
+    global statements  # pylint: disable=global-statement
+    samples = []
+    statements = 0
+    for i, operation in enumerate(call):
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            await operation(i, db)
+            samples.append(time.perf_counter() - started)
+    return samples, statements // max(1, len(samples))
+
+
+async def main(args) -> None:
+    await create_schema()
+    user = await seed_user("writer@example.com")
+
+    for name, (create, update, remove, avatar) in IMPLEMENTATIONS.items():
+        created: list[int] = []
+
+        async def do_create(i, db, create=create, created=created, name=name):
+            data = ContactCreate(
+                first_name="First",
+                last_name=f"Last{i}",
+                email=f"{name}{i}@example.com",
+                phone=f"+1{len(name)}{i:08d}",
+                birthday=date(1990, 1 + i % 12, 1 + i % 28),
+            )
+            created.append((await create(data, db, user)).id)
+
+        async def do_update(i, db, update=update, created=created):
+            await update(created[i], ContactUpdate(last_name=f"Renamed{i}"), db, user)
+
+        async def do_delete(i, db, remove=remove, created=created):
+            await remove(created[i], db, user)
+
+        async def do_avatar(i, db, avatar=avatar):
+            await avatar(
+                AvatarUpdate(avatar_url=f"https://cdn.example.com/{i}.jpg"), db, user
+            )
+
+        print(name)
+        for label, operation in (
+            ("create", do_create),
+            ("update", do_update),
+            ("delete", do_delete),
+            ("avatar", do_avatar),
+        ):
+            samples, per_op = await measure([operation] * args.repeat)
+            print(f"  {label:<7} {per_op} stmt/op  {summarize(samples)}")
+
+    async with AsyncSessionLocal() as db:
+        assert await db.scalar(select(Contact.id).limit(1)) is None
+    await dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=300)
+    asyncio.run(main(parser.parse_args()))
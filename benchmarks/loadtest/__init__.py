@@ -0,0 +1,16 @@
+"""Reproducible load test of the Contacts API.
+
+Seeds synthetic users and contacts into SQLite (default) or the database
+given with --database-url, then drives the real app in-process through
+httpx's ASGI transport with a weighted, seeded mix of login, list, page,
+get, search, birthdays, CRUD and avatar-upload requests (avatars go to a
+stub store). Per-route RPS and p50/p95/p99 are printed and written as JSON,
+and two result files can be compared:
+
+    python -m benchmarks.loadtest run --users 20 --contacts 2000 --requests 5000 --output base.json
+    python -m benchmarks.loadtest run ... --output new.json
+    python -m benchmarks.loadtest compare base.json new.json --threshold 10
+
+``compare`` exits non-zero when a route's p95 or throughput regressed by
+more than the threshold, so it can gate CI.
+"""
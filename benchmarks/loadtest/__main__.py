@@ -0,0 +1,136 @@
+"""Command line: ``run`` a load test or ``compare`` two result files."""
+
+import argparse
+import asyncio
+import sys
+
+from benchmarks.loadtest import __doc__ as DESCRIPTION
+
+
+async def run(args) -> None:
+    # imported after bootstrap_env: the app reads its settings at import
+    # pylint: disable=import-outside-toplevel
+    from app.database import engine
+    from benchmarks._support import client, dispose
+    from benchmarks.loadtest.results import (
+        build_result,
+        print_table,
+        summarize,
+        write_result,
+    )
+    from benchmarks.loadtest.seed import seed
+    from benchmarks.loadtest.workload import drive, plan, prepare_avatars
+
+    print(f"seeding {args.users} users × {args.contacts} contacts …")
+    users = await seed(args.users, args.contacts)
+    prepare_avatars()
+
+    async with client() as http:
+        if args.warmup:
+            await drive(
+                http,
+                users,
+                plan(args.mix, len(users), args.warmup, args.seed + 1),
+                args.concurrency,
+                args.seed,
+            )
+        steps = plan(args.mix, len(users), args.requests, args.seed)
+        samples, elapsed = await drive(http, users, steps, args.concurrency, args.seed)
+    await dispose()
+
+    routes, total = summarize(samples, elapsed)
+    print(
+        f"{args.requests} requests, mix={args.mix}, concurrency={args.concurrency}, {elapsed:.2f} s"
+    )
+    print_table(routes, total)
+    if args.output:
+        params = {
+            name: getattr(args, name)
+            for name in (
+                "users",
+                "contacts",
+                "requests",
+                "concurrency",
+                "mix",
+                "seed",
+                "warmup",
+            )
+        }
+        write_result(
+            args.output,
+            build_result(params, engine.dialect.name, routes, total, elapsed),
+        )
+        print(f"results written to {args.output}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loadtest",
+        description=DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="seed, drive the app, report per route"
+    )
+    run_parser.add_argument(
+        "--database-url", default=None, help="defaults to a throwaway SQLite file"
+    )
+    run_parser.add_argument("--users", type=int, default=10)
+    run_parser.add_argument(
+        "--contacts", type=int, default=1000, help="contacts per user"
+    )
+    run_parser.add_argument("--requests", type=int, default=3000)
+    run_parser.add_argument(
+        "--warmup", type=int, default=200, help="unrecorded requests first"
+    )
+    run_parser.add_argument("--concurrency", type=int, default=8)
+    run_parser.add_argument(
+        "--mix", default="default", choices=["default", "read", "write"]
+    )
+    run_parser.add_argument("--seed", type=int, default=1)
+    run_parser.add_argument("--output", help="write results as JSON")
+
+    compare_parser = commands.add_parser("compare", help="diff two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="allowed regression in percent"
+    )
+    compare_parser.add_argument(
+        "--min-requests",
+        type=int,
+        default=200,
+        help="samples needed to judge a route's p95",
+    )
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        # pylint: disable=import-outside-toplevel
+        from benchmarks.loadtest.results import compare, load_result
+
+        regressions = compare(
+            load_result(args.baseline),
+            load_result(args.candidate),
+            args.threshold,
+            args.min_requests,
+        )
+        if regressions:
+            print(
+                f"{len(set(regressions))} route(s) regressed by more than {args.threshold:g}%"
+            )
+            return 1
+        return 0
+
+    from benchmarks._support import (  # pylint: disable=import-outside-toplevel
+        bootstrap_env,
+    )
+
+    bootstrap_env(args.database_url)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Per-route summaries, the JSON result file and run-to-run comparison."""
+
+import json
+import platform
+import subprocess
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from benchmarks._support import percentile
+from benchmarks.loadtest.workload import Sample
+
+FORMAT_VERSION = 1
+
+
+def _stats(samples: List[Sample], elapsed: float) -> dict:
+    latencies = [sample.seconds for sample in samples]
+    return {
+        "requests": len(samples),
+        "client_errors": sum(1 for sample in samples if 400 <= sample.status < 500),
+        "server_errors": sum(1 for sample in samples if sample.status >= 500),
+        "rps": len(samples) / elapsed if elapsed else 0.0,
+        "mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Tuple[Dict[str, dict], dict]:
+    """(per-route stats, overall stats); route RPS is that route's share of throughput."""
+    by_route: Dict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_route[sample.route].append(sample)
+    routes = {route: _stats(by_route[route], elapsed) for route in sorted(by_route)}
+    return routes, _stats(samples, elapsed)
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_result(
+    params: dict, database: str, routes: Dict[str, dict], total: dict, elapsed: float
+) -> dict:
+    return {
+        "format": FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "database": database,
+        "params": params,
+        "elapsed_s": elapsed,
+        "total": total,
+        "routes": routes,
+    }
+
+
+def print_table(routes: Dict[str, dict], total: dict) -> None:
+    print(
+        f"{'route':<38} {'n':>6} {'4xx':>5} {'5xx':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for route, stats in [*routes.items(), ("TOTAL", total)]:
+        print(
+            f"{route:<38} {stats['requests']:>6} {stats['client_errors']:>5} {stats['server_errors']:>5} "
+            f"{stats['rps']:>8.1f} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}",
+        )
+
+
+def write_result(path: str, result: dict) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(result, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def load_result(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        result = json.load(handle)
+    if result.get("format") != FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported result format {result.get('format')!r}")
+    return result
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compare(
+    baseline: dict, candidate: dict, threshold: float, min_requests: int = 200
+) -> List[str]:
+    """Print a per-route diff; returns the routes that regressed by over ``threshold`` percent.
+
+    Throughput is judged on the total only (per-route RPS is a fixed share of
+    it); p95 only for routes with at least ``min_requests`` samples per run.
+    """
+    if baseline["params"] != candidate["params"]:
+        print(
+            "warning: the runs used different parameters; numbers are not directly comparable"
+        )
+    print(f"baseline  {baseline['git_revision']} {baseline['created_at']}")
+    print(f"candidate {candidate['git_revision']} {candidate['created_at']}")
+    print(f"{'route':<38} {'rps':>9} {'Δ rps':>8} {'p95 ms':>9} {'Δ p95':>8}")
+
+    regressions = []
+    rows = [*sorted(set(baseline["routes"]) | set(candidate["routes"])), "TOTAL"]
+    for route in rows:
+        before = (
+            baseline["total"] if route == "TOTAL" else baseline["routes"].get(route)
+        )
+        after = (
+            candidate["total"] if route == "TOTAL" else candidate["routes"].get(route)
+        )
+        if before is None or after is None:
+            print(
+                f"{route:<38} {'only in ' + ('candidate' if before is None else 'baseline'):>36}"
+            )
+            continue
+        rps_change = _change(before["rps"], after["rps"])
+        p95_change = _change(before["p95_ms"], after["p95_ms"])
+        flag = ""
+        if min(before["requests"], after["requests"]) < min_requests:
+            flag = "  (few samples)"
+        elif p95_change > threshold or (route == "TOTAL" and rps_change < -threshold):
+            flag = "  REGRESSION"
+            regressions.append(route)
+        if after["server_errors"] > before["server_errors"]:
+            flag += "  MORE 5xx"
+            regressions.append(route)
+        print(
+            f"{route:<38} {after['rps']:>9.1f} {rps_change:>+7.1f}% {after['p95_ms']:>9.2f} {p95_change:>+7.1f}%{flag}",
+        )
+    return regressions
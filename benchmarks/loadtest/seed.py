@@ -0,0 +1,67 @@
+"""Synthetic users and contacts for the load test."""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from sqlalchemy import insert, select
+
+from benchmarks._support import BENCH_PASSWORD, create_schema, seed_contacts
+
+
+@dataclass
+class SeededUser:
+    id: int
+    email: str
+    contact_ids: List[int]
+    headers: dict = field(default_factory=dict)
+    created: int = 0  # contacts created by the workload so far
+
+
+async def seed(users: int, contacts_per_user: int) -> List[SeededUser]:
+    """Fresh schema with ``users`` verified users owning ``contacts_per_user`` contacts each."""
+    # pylint: disable=import-outside-toplevel
+    from app.database import AsyncSessionLocal
+    from app.models.contact import Contact
+    from app.models.user import User
+    from app.services.auth import create_access_token
+    from app.services.hashing import pwd_context
+
+    await create_schema()
+    # one bcrypt hash shared by every user; seeding is not what we measure
+    password = pwd_context.hash(BENCH_PASSWORD)
+    emails = [f"load{i}@example.com" for i in range(users)]
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            insert(User),
+            [
+                {
+                    "username": email.split("@")[0],
+                    "email": email,
+                    "password": password,
+                    "is_verified": True,
+                }
+                for email in emails
+            ],
+        )
+        await session.commit()
+        user_ids = dict((await session.execute(select(User.email, User.id))).all())
+
+    for email in emails:
+        await seed_contacts(user_ids[email], contacts_per_user)
+
+    seeded = {
+        user_ids[email]: SeededUser(user_ids[email], email, []) for email in emails
+    }
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(
+            select(Contact.user_id, Contact.id).order_by(Contact.id)
+        )
+        for user_id, contact_id in rows:
+            seeded[user_id].contact_ids.append(contact_id)
+
+    for user in seeded.values():
+        # tokens are minted directly; the "login" operation still pays bcrypt
+        user.headers = {
+            "Authorization": f"Bearer {create_access_token({'sub': user.email})}"
+        }
+    return list(seeded.values())
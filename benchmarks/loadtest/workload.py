@@ -0,0 +1,209 @@
+"""Weighted request mixes and the concurrent driver.
+
+The sequence of (operation, user) pairs is drawn up front from a seeded RNG,
+so two runs with the same arguments issue the same requests.
+"""
+
+import asyncio
+import io
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Awaitable, Callable, Dict, List, NamedTuple
+
+import httpx
+
+from benchmarks._support import BENCH_PASSWORD
+from benchmarks.loadtest.seed import SeededUser
+
+Handler = Callable[
+    [httpx.AsyncClient, SeededUser, random.Random], Awaitable[httpx.Response]
+]
+
+
+class Sample(NamedTuple):
+    route: str
+    status: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class Operation:
+    route: str  # label in the report: method and route template
+    handler: Handler
+
+
+# ─────────────────────────── operations ─────────────────────────── #
+
+
+async def login(http, user, rng):
+    return await http.post(
+        "/api/auth/login", json={"email": user.email, "password": BENCH_PASSWORD}
+    )
+
+
+async def list_contacts(http, user, rng):
+    return await http.get("/api/contacts/", params={"limit": 50}, headers=user.headers)
+
+
+async def page_contacts(http, user, rng):
+    return await http.get(
+        "/api/contacts/page", params={"limit": 50}, headers=user.headers
+    )
+
+
+async def get_contact(http, user, rng):
+    return await http.get(
+        f"/api/contacts/{rng.choice(user.contact_ids)}", headers=user.headers
+    )
+
+
+async def search_contacts(http, user, rng):
+    return await http.get(
+        "/api/contacts/search",
+        params={"q": f"First{rng.randrange(100)}"},
+        headers=user.headers,
+    )
+
+
+async def upcoming_birthdays(http, user, rng):
+    return await http.get("/api/contacts/upcoming/birthdays", headers=user.headers)
+
+
+async def create_contact(http, user, rng):
+    user.created += 1
+    response = await http.post(
+        "/api/contacts/",
+        json={
+            "first_name": "Load",
+            "last_name": f"Created{user.created}",
+            "email": f"load{user.id}n{user.created}@example.com",
+            "phone": f"+2{user.id:04d}{user.created:07d}",
+            "birthday": (
+                date(1990, 1, 1) + timedelta(days=rng.randrange(365))
+            ).isoformat(),
+        },
+        headers=user.headers,
+    )
+    if response.status_code == 201:
+        user.contact_ids.append(response.json()["id"])
+    return response
+
+
+async def update_contact(http, user, rng):
+    return await http.put(
+        f"/api/contacts/{rng.choice(user.contact_ids)}",
+        json={"last_name": f"Updated{rng.randrange(10_000)}"},
+        headers=user.headers,
+    )
+
+
+async def delete_contact(http, user, rng):
+    # newest first, so seeded contacts (and other operations' targets) survive longer
+    contact_id = (
+        user.contact_ids.pop() if len(user.contact_ids) > 1 else user.contact_ids[0]
+    )
+    return await http.delete(f"/api/contacts/{contact_id}", headers=user.headers)
+
+
+AVATAR_BYTES: bytes = b""
+
+
+async def upload_avatar(http, user, rng):
+    files = {"file": ("avatar.jpg", AVATAR_BYTES, "image/jpeg")}
+    return await http.post("/api/users/avatar", files=files, headers=user.headers)
+
+
+OPERATIONS = {
+    "login": Operation("POST /api/auth/login", login),
+    "list": Operation("GET /api/contacts/", list_contacts),
+    "page": Operation("GET /api/contacts/page", page_contacts),
+    "get": Operation("GET /api/contacts/{id}", get_contact),
+    "search": Operation("GET /api/contacts/search", search_contacts),
+    "birthdays": Operation("GET /api/contacts/upcoming/birthdays", upcoming_birthdays),
+    "create": Operation("POST /api/contacts/", create_contact),
+    "update": Operation("PUT /api/contacts/{id}", update_contact),
+    "delete": Operation("DELETE /api/contacts/{id}", delete_contact),
+    "avatar": Operation("POST /api/users/avatar", upload_avatar),
+}
+
+# operation -> relative weight
+MIXES: Dict[str, Dict[str, int]] = {
+    "default": {
+        "list": 20,
+        "get": 25,
+        "page": 10,
+        "search": 15,
+        "birthdays": 8,
+        "create": 6,
+        "update": 8,
+        "delete": 4,
+        "login": 2,
+        "avatar": 2,
+    },
+    "read": {"list": 30, "get": 40, "page": 10, "search": 15, "birthdays": 5},
+    "write": {"create": 40, "update": 40, "delete": 15, "get": 5},
+}
+
+
+# ───────────────────────────── driver ───────────────────────────── #
+
+
+class NullAvatarStorage:
+    """Accepts uploads without storing them (keeps the benchmark off disk/network)."""
+
+    async def save(self, public_id: str, data: bytes, content_type: str) -> str:
+        return f"https://avatars.invalid/{public_id}.jpg"
+
+
+def prepare_avatars() -> None:
+    global AVATAR_BYTES  # pylint: disable=global-statement
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    from app.services.avatar import (  # pylint: disable=import-outside-toplevel
+        set_avatar_storage,
+    )
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480), (90, 140, 200)).save(buffer, "JPEG", quality=85)
+    AVATAR_BYTES = buffer.getvalue()
+    set_avatar_storage(NullAvatarStorage())
+
+
+def plan(mix: str, users: int, requests: int, seed: int) -> List[tuple[str, int]]:
+    """The (operation, user index) sequence for a run."""
+    weights = MIXES[mix]
+    names = list(weights)
+    rng = random.Random(seed)
+    chosen = rng.choices(names, weights=[weights[name] for name in names], k=requests)
+    return [(name, rng.randrange(users)) for name in chosen]
+
+
+async def drive(
+    http: httpx.AsyncClient,
+    users: List[SeededUser],
+    steps: List[tuple[str, int]],
+    concurrency: int,
+    seed: int,
+) -> tuple[List[Sample], float]:
+    """Run ``steps`` with ``concurrency`` workers; returns samples and wall time."""
+    samples: List[Sample] = []
+    remaining = iter(enumerate(steps))
+
+    async def worker() -> None:
+        for index, (name, user_index) in remaining:
+            operation = OPERATIONS[name]
+            # per-step RNG: parameters don't depend on how workers interleave
+            rng = random.Random(seed * 1_000_003 + index)
+            started = time.perf_counter()
+            response = await operation.handler(http, users[user_index], rng)
+            samples.append(
+                Sample(
+                    operation.route, response.status_code, time.perf_counter() - started
+                )
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
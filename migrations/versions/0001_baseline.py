@@ -0,0 +1,46 @@
+"""Baseline: users and contacts as first created by create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(100), nullable=False, unique=True),
+        sa.Column("email", sa.String(150), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("avatar", sa.String(), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "contacts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("first_name", sa.String(100), nullable=False),
+        sa.Column("last_name", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(150), nullable=False),
+        sa.Column("phone", sa.String(30), nullable=False, unique=True),
+        sa.Column("birthday", sa.Date(), nullable=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+    )
+    op.create_index("ix_contacts_id", "contacts", ["id"])
+    op.create_index("ix_contacts_email", "contacts", ["email"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_table("contacts")
+    op.drop_table("users")
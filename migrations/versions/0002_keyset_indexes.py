@@ -0,0 +1,25 @@
+"""Keyset pagination indexes on contacts
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_contacts_user_id_id", "contacts", ["user_id", "id"])
+    op.create_index(
+        "ix_contacts_user_id_last_name_id", "contacts", ["user_id", "last_name", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_id_last_name_id", table_name="contacts")
+    op.drop_index("ix_contacts_user_id_id", table_name="contacts")
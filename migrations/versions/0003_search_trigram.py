@@ -0,0 +1,38 @@
+"""Trigram search indexes on contacts (PostgreSQL only)
+
+The expressions must match app/models/contact.py (SEARCH_TEXT_EXPR,
+SEARCH_PHONE_EXPR) exactly for the planner to use the indexes. Other
+dialects search through the in-process index and get nothing here.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_contacts_search_trgm ON contacts "
+        "USING gin ((lower(first_name || ' ' || last_name || ' ' || email)) gin_trgm_ops)",
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_contacts_phone_trgm ON contacts "
+        "USING gin ((regexp_replace(phone, '[^0-9]', '', 'g')) gin_trgm_ops)",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_contacts_phone_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_contacts_search_trgm")
@@ -0,0 +1,44 @@
+"""Indexed month/day column for upcoming birthdays
+
+Existing rows are backfilled from birthday here, once; the app keeps the
+column in step on every write afterwards.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "contacts", sa.Column("birthday_md", sa.SmallInteger(), nullable=True)
+    )
+    contacts = sa.table(
+        "contacts",
+        sa.column("birthday", sa.Date),
+        sa.column("birthday_md", sa.SmallInteger),
+    )
+    month, day = sa.extract("month", contacts.c.birthday), sa.extract(
+        "day", contacts.c.birthday
+    )
+    op.execute(
+        contacts.update()
+        .where(contacts.c.birthday.is_not(None))
+        .values(birthday_md=month * 100 + day),
+    )
+    op.create_index(
+        "ix_contacts_user_id_birthday_md", "contacts", ["user_id", "birthday_md"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_id_birthday_md", table_name="contacts")
+    op.drop_column("contacts", "birthday_md")
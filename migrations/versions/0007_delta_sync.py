@@ -0,0 +1,62 @@
+"""Delta sync: change sequence numbers and contact tombstones
+
+Existing contacts keep change_seq 0; sync orders by (change_seq, id), so
+they are all reported by a client's first sync.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("change_seq", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "users",
+        sa.Column("sync_floor", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "contacts",
+        sa.Column("change_seq", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_contacts_user_id_change_seq", "contacts", ["user_id", "change_seq"]
+    )
+
+    op.create_table(
+        "contact_tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("contact_id", sa.Integer(), nullable=False),
+        sa.Column("change_seq", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_contact_tombstones_user_id_change_seq",
+        "contact_tombstones",
+        ["user_id", "change_seq"],
+    )
+    op.create_index(
+        "ix_contact_tombstones_deleted_at", "contact_tombstones", ["deleted_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("contact_tombstones")
+    op.drop_index("ix_contacts_user_id_change_seq", table_name="contacts")
+    with op.batch_alter_table("contacts") as batch:
+        batch.drop_column("change_seq")
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("sync_floor")
+        batch.drop_column("change_seq")
@@ -0,0 +1,105 @@
+"""
+Shared fixtures: the app over a throwaway SQLite file (or TEST_DATABASE_URL),
+driven in-process through httpx. Async tests run on anyio's pytest plugin.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL"
+) or "sqlite+aiosqlite:///{}".format(
+    os.path.join(tempfile.mkdtemp(prefix="contacts-test-"), "test.db"),
+)
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("CLOUDINARY_NAME", "test")
+os.environ.setdefault("CLOUDINARY_API_KEY", "test")
+os.environ.setdefault("CLOUDINARY_API_SECRET", "test")
+os.environ.setdefault("MAIL_USERNAME", "test@example.com")
+os.environ.setdefault("MAIL_PASSWORD", "test")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+import app.models  # noqa: E402,F401  (register tables on Base.metadata)
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.contact import Contact  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.hashing import pwd_context  # noqa: E402
+from app.services.sessions import revocation_filter  # noqa: E402
+
+pytest_plugins = ["tests.query_budget"]
+
+TEST_EMAIL = "budget@example.com"
+TEST_PASSWORD = "test-password"
+TEST_CONTACTS = 20
+
+
+async def _create_database() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        user = User(
+            username="budget",
+            email=TEST_EMAIL,
+            password=pwd_context.hash(TEST_PASSWORD),
+            is_verified=True,
+        )
+        db.add(user)
+        await db.flush()
+        await db.execute(
+            insert(Contact),
+            [
+                {
+                    "first_name": f"First{i}",
+                    "last_name": f"Last{i}",
+                    "email": f"contact{i}@example.com",
+                    "phone": f"+1555{i:07d}",
+                    "user_id": user.id,
+                }
+                for i in range(TEST_CONTACTS)
+            ],
+        )
+        await db.commit()
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database() -> None:
+    asyncio.run(_create_database())
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    # the startup loop syncs the filter first; unsynced, every auth check queries
+    async with AsyncSessionLocal() as db:
+        await revocation_filter.sync(db)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        yield http
+    # pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+async def auth_headers(client) -> dict:
+    response = await client.post(
+        "/api/auth/login", json={"email": TEST_EMAIL, "password": TEST_PASSWORD}
+    )
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    # warm the principal cache, so budgets count the endpoint's own statements
+    (await client.get("/api/users/me", headers=headers)).raise_for_status()
+    return headers
@@ -0,0 +1,43 @@
+"""
+pytest plugin asserting per-endpoint query budgets (registered in
+tests/conftest.py):
+
+    async def test_list_contacts(client, auth_headers, query_budget):
+        with query_budget(1):
+            await client.get("/api/contacts/", headers=auth_headers)
+
+The app must run in the test's context (httpx.ASGITransport does this), so
+the statements it issues reach the audit. Works with whatever DATABASE_URL
+points at: a SQLite file or a local Postgres.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator, Optional
+
+import pytest
+
+from app.utils.query_audit import QueryAudit, audit_engine, audit_queries
+
+
+@contextmanager
+def _budget(
+    max_statements: int,
+    max_repeats: Optional[int] = None,
+    slow_ms: Optional[float] = None,
+) -> Iterator[QueryAudit]:
+    with audit_queries(max_statements, max_repeats, slow_ms) as audit:
+        yield audit
+    # checked on exit so the failure lists every statement, not just the first over
+    audit.check()
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[QueryAudit]]:
+    """``with query_budget(n, max_repeats=None, slow_ms=None): ...``"""
+    # imported here: the settings are built on import, after conftest set the environment
+    # pylint: disable=import-outside-toplevel
+    from app.database import engine, read_engine
+
+    audit_engine(engine)
+    audit_engine(read_engine)
+    return _budget
@@ -0,0 +1,63 @@
+"""Request body limits, for declared and chunked (no Content-Length) uploads."""
+
+import httpx
+import pytest
+from fastapi import FastAPI, File, UploadFile
+
+from app.middleware.body_limit import BodySizeLimitMiddleware
+
+pytestmark = pytest.mark.anyio
+
+LIMIT = 1000
+BOUNDARY = "limit-test"
+
+
+def _upload_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    app.add_middleware(BodySizeLimitMiddleware, limits={"/upload": LIMIT})
+    return app
+
+
+def _multipart(size: int) -> bytes:
+    return (
+        (
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="a.bin"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        + b"x" * size
+        + f"\r\n--{BOUNDARY}--\r\n".encode()
+    )
+
+
+async def _post(body: bytes, chunked: bool) -> httpx.Response:
+    async def chunks():
+        for start in range(0, len(body), 256):
+            yield body[start : start + 256]
+
+    transport = httpx.ASGITransport(app=_upload_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        return await http.post(
+            "/upload",
+            content=chunks() if chunked else body,
+            headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+        )
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+async def test_body_under_limit_passes(chunked):
+    response = await _post(_multipart(500), chunked)
+    assert response.status_code == 200
+    assert response.json() == {"size": 500}
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+async def test_body_over_limit_is_rejected(chunked):
+    response = await _post(_multipart(5000), chunked)
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body too large"}
@@ -0,0 +1,45 @@
+"""Statements per contacts endpoint, with a warm principal cache."""
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_list_contacts(client, auth_headers, query_budget):
+    with query_budget(1):
+        response = await client.get(
+            "/api/contacts/", params={"limit": 50}, headers=auth_headers
+        )
+    assert response.status_code == 200
+    assert len(response.json()) == 20
+
+
+async def test_list_contacts_page(client, auth_headers, query_budget):
+    with query_budget(1):
+        response = await client.get(
+            "/api/contacts/page", params={"limit": 5}, headers=auth_headers
+        )
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is not None
+
+
+async def test_get_contact(client, auth_headers, query_budget):
+    with query_budget(1):
+        response = await client.get("/api/contacts/3", headers=auth_headers)
+    assert response.status_code == 200
+
+
+async def test_create_contact(client, auth_headers, query_budget):
+    payload = {
+        "first_name": "Budget",
+        "last_name": "Probe",
+        "email": "budget.probe@example.com",
+        "phone": "+15559990000",
+        "birthday": "1990-05-01",
+    }
+    # change_seq reservation + INSERT ... RETURNING
+    with query_budget(2, max_repeats=1):
+        response = await client.post(
+            "/api/contacts/", json=payload, headers=auth_headers
+        )
+    assert response.status_code == 201